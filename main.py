@@ -246,7 +246,11 @@ class ChwiliTranslateApp:
         self.config = self.config_manager.load()
         
         self.cache_manager = CacheManager()
-        self.translation_engine = TranslationEngine(self.cache_manager)
+        self.cache_manager.set_similarity_threshold(self.config.system.cache_similarity_threshold)
+        self._apply_cache_limits()
+        self.translation_engine = TranslationEngine(self.cache_manager, stats_path="provider_stats.json")
+        self.translation_engine.set_routing(self.config.translation.auto_route)
+        self.translation_engine.set_streaming(self.config.translation.streaming)
         self.ocr_engine = OCREngine()
         self.region_selector = RegionSelector()
         self.overlay_window = OverlayWindow()
@@ -269,6 +273,7 @@ class ChwiliTranslateApp:
         
         # Kaydedilmiş API anahtarlarını yükle
         self._load_saved_api_keys()
+        self._apply_translation_settings()
         
         # Kaydedilmiş bölgeleri yükle
         self._load_saved_regions()
@@ -289,6 +294,38 @@ class ChwiliTranslateApp:
                 self.translation_engine.set_api_key(provider_map[name], key)
                 logger.info(f"{name} API anahtarı yüklendi")
     
+    def _apply_cache_limits(self) -> None:
+        """Yapılandırmadaki önbellek boyut sınırlarını uygular"""
+        system = self.config.system
+        limits = dict(
+            max_entries=system.cache_max_entries,
+            max_bytes=system.cache_max_mb * 1024 * 1024,
+            ttl_seconds=system.cache_ttl_days * 86400
+        )
+        try:
+            self.cache_manager.set_limits(policy=system.cache_eviction, **limits)
+        except ValueError:
+            logger.warning(f"Bilinmeyen önbellek atma politikası: {system.cache_eviction}, lru kullanılıyor")
+            self.cache_manager.set_limits(policy=CacheManager.EVICT_LRU, **limits)
+    
+    def _apply_translation_settings(self) -> None:
+        """Yapılandırılmış yedek provider'ı ve hız sınırlarını çeviri motoruna uygular"""
+        from src.translate.providers import TranslationProvider
+        
+        name = self.config.translation.hedge_provider
+        try:
+            provider = TranslationProvider(name) if name else None
+        except ValueError:
+            logger.warning(f"Bilinmeyen yedek provider: {name}")
+            provider = None
+        self.translation_engine.set_hedging(provider, self.config.translation.hedge_delay_ms)
+        
+        for name, rate in self.config.translation.rate_limits.items():
+            try:
+                self.translation_engine.set_rate_limit(TranslationProvider(name), rate)
+            except ValueError:
+                logger.warning(f"Bilinmeyen provider için hız sınırı: {name}")
+    
     def _load_saved_regions(self) -> None:
         """Kaydedilmiş OCR bölgelerini yükler"""
         from src.ocr.region_selector import Region
@@ -493,7 +530,7 @@ class ChwiliTranslateApp:
     
     def _quit_app(self) -> None:
         """Uygulamayı kapatır"""
-        self.app_controller.stop()
+        self.app_controller.cleanup()
         self.tray_icon.hide()
         self.app.quit()
 
@@ -555,18 +592,27 @@ class ChwiliTranslateApp:
         self.overlay_panel.bg_color_changed.connect(self._on_overlay_bg_color_changed)
         self.overlay_panel.glow_color_changed.connect(self._on_overlay_glow_color_changed)
         
+        # Ekran değişikliklerinde monitör geometrisini yenile
+        self.app.screenAdded.connect(self._on_screen_added)
+        self.app.screenRemoved.connect(self._on_screens_changed)
+        self.app.primaryScreenChanged.connect(self._on_screens_changed)
+        for screen in self.app.screens():
+            screen.geometryChanged.connect(self._on_screens_changed)
+        
         # FPS güncelleme timer'ı
         from PyQt6.QtCore import QTimer
         self._fps_timer = QTimer()
         self._fps_timer.timeout.connect(self._update_fps)
         self._fps_timer.start(500)  # Her 500ms'de güncelle
         
-        # Canlı önizleme timer'ı
+        # Canlı önizleme timer'ı (OCR döngüsünün yayınladığı kareyi kullanır)
+        self._preview_version = 0
         self._preview_timer = QTimer()
         self._preview_timer.timeout.connect(self._update_preview)
         self._preview_timer.start(1000)  # Her 1 saniyede güncelle
         
-        # Cache sayısı güncelleme timer'ı
+        # Cache sayısı güncelleme timer'ı (yalnızca toplamlar değişince yeniler)
+        self._cache_stats_version = -1
         self._cache_timer = QTimer()
         self._cache_timer.timeout.connect(self._update_cache_info)
         self._cache_timer.start(2000)  # Her 2 saniyede güncelle
@@ -580,33 +626,54 @@ class ChwiliTranslateApp:
         self.hotkey_manager.set_widget(self.main_window)
         self._register_hotkey_callbacks()
     
+    def _on_screen_added(self, screen) -> None:
+        """Yeni monitör bağlandığında"""
+        screen.geometryChanged.connect(self._on_screens_changed)
+        self._on_screens_changed()
+    
+    def _on_screens_changed(self, *args) -> None:
+        """Monitör yapılandırması değiştiğinde"""
+        self.region_selector.invalidate_monitors()
+        logger.info("Ekran yapılandırması değişti, monitör bilgisi yenilendi")
+    
     def _update_fps(self) -> None:
         """FPS değerini günceller"""
         fps = self.app_controller.get_fps()
         self.status_bar.set_fps(fps)
+        rate, reason = self.app_controller.get_scan_status()
+        self.status_bar.set_scan_rate(rate, reason)
     
     def _update_preview(self) -> None:
-        """Canlı önizlemeyi günceller"""
+        """Canlı önizlemeyi OCR döngüsünün son karesinden günceller"""
         from src.app_controller import AppState
         if self.app_controller.get_state() != AppState.RUNNING:
             return
         
-        region = self.region_selector.get_current_region()
-        if not region:
+        # Yalnızca OCR sayfası görünürken çiz
+        if not self.main_window.isVisible() or self.main_window.get_current_page() != 1:
+            return
+        
+        version, frame = self.app_controller.get_latest_frame()
+        if frame is None or version == self._preview_version:
             return
         
         try:
-            preview_data = self.region_selector.capture_region(region)
-            self.ocr_panel.set_preview_image(preview_data)
+            self.ocr_panel.set_preview_frame(frame)
+            self._preview_version = version
         except Exception:
             pass
     
     def _update_cache_info(self) -> None:
         """Cache bilgisini günceller"""
+        version = self.cache_manager.get_stats_version()
+        if version == self._cache_stats_version:
+            return
+        
         try:
             stats = self.cache_manager.get_stats()
             count = stats.get("total_entries", 0)
             self.settings_panel.set_cache_info(count)
+            self._cache_stats_version = version
         except Exception:
             pass
     
@@ -674,13 +741,12 @@ class ChwiliTranslateApp:
         region = self.region_selector.get_current_region()
         if region:
             try:
-                image_data = self.region_selector.capture_region(region)
-                text = self.ocr_engine.recognize(image_data)
+                frame = self.region_selector.capture_region(region)
+                text = self.ocr_engine.process_image(frame).text
                 if text:
-                    result = self.translation_engine.translate(text)
-                    if result:
-                        self.overlay_window.set_text(result.translated_text)
-                        self.overlay_window.show_overlay()
+                    # Sonuç overlay'e ve callback'lere kontrolcü üzerinden iletilir
+                    self.app_controller.submit(text)
+                    self.overlay_window.show_overlay()
             except Exception as e:
                 logger.error(f"Anlık OCR hatası: {e}")
     
@@ -938,8 +1004,7 @@ class ChwiliTranslateApp:
         
         # Önizleme al
         try:
-            preview_data = self.region_selector.capture_region(region)
-            self.ocr_panel.set_preview_image(preview_data)
+            self.ocr_panel.set_preview_frame(self.region_selector.capture_region(region))
         except Exception as e:
             logger.error(f"Önizleme hatası: {e}")
         
@@ -3,14 +3,23 @@ Application Controller for ChwiliTranslate
 Ana uygulama kontrolcüsü
 """
 
-from dataclasses import dataclass
-from typing import Optional, Callable
+from dataclasses import dataclass, field
+from concurrent.futures import Future
+from typing import Optional, Callable, List
 from enum import Enum
+import asyncio
 import time
 import threading
-import asyncio
 import queue
 
+from .ocr.change_detector import ChangeDetector
+from .ocr.frame import FrameSlot
+from .ocr.incremental import IncrementalOCR
+from .utils.async_loop import AsyncLoopThread
+from .utils.pipeline import DropOldestQueue, QueueClosed, StageStats
+from .utils.scheduler import AdaptiveScheduler
+from .translate.rate_limit import RateLimitedError
+
 
 class AppState(Enum):
     """Uygulama durumu"""
@@ -22,9 +31,25 @@ class AppState(Enum):
 @dataclass
 class AppConfig:
     """Uygulama konfigürasyonu"""
-    ocr_interval_ms: int = 400  # OCR tarama aralığı (0.4 saniye)
+    ocr_interval_ms: int = 400  # Başlangıç OCR tarama aralığı (0.4 saniye)
+    min_interval_ms: int = 100  # Metin değişirken tarama aralığı
+    max_interval_ms: int = 2000  # Sabit ekranda ulaşılabilecek en uzun aralık
+    backoff_factor: float = 1.5  # Değişiklik olmayan her taramada aralık çarpanı
     cache_enabled: bool = True
     gpu_enabled: bool = True
+    change_detection_enabled: bool = True  # Değişmeyen bölgelerde OCR'ı atla
+    change_tolerance: float = 2.0  # Piksel başına parlaklık toleransı (animasyonlu arka planlar için artırın)
+    ocr_queue_size: int = 1  # Yakalama -> OCR kuyruğu (dolunca en eski kare atılır)
+    translate_queue_size: int = 1  # OCR -> çeviri kuyruğu (dolunca en eski metin atılır)
+
+
+@dataclass
+class CaptureBatch:
+    """Yakalama aşamasından OCR aşamasına aktarılan kare grubu"""
+    regions: list  # Tüm aktif bölgeler (sıralı)
+    keys: list
+    frames: dict  # Bu turda yakalanan bölgeler: anahtar -> Frame
+    captured_at: float = field(default_factory=time.monotonic)
 
 
 class ApplicationController:
@@ -40,6 +65,27 @@ class ApplicationController:
         self._last_text = ""  # Son algılanan metin (tekrar çeviri önleme)
         self._ocr_ready = False  # OCR hazır mı?
         
+        # Değişiklik algılama
+        self._change_detector = ChangeDetector(self._config.change_tolerance)
+        self._incremental_ocr: Optional[IncrementalOCR] = None  # Kirli karo takibi
+        self._region_texts: dict = {}  # Bölge anahtarı -> son OCR metni
+        self._region_translations: dict = {}  # Bölge anahtarı -> (kaynak metin, çeviri)
+        self._translation_context: Optional[tuple] = None  # (provider, diller) - değişince çeviriler geçersiz
+        self._frames_processed = 0
+        self._frames_skipped = 0
+        
+        # Uyarlanabilir tarama zamanlayıcısı (bölge başına)
+        self._scheduler = AdaptiveScheduler(
+            min_interval_ms=self._config.min_interval_ms,
+            max_interval_ms=self._config.max_interval_ms,
+            backoff_factor=self._config.backoff_factor,
+            initial_interval_ms=self._config.ocr_interval_ms
+        )
+        self._active_keys: list = []
+        
+        # Canlı önizleme için son kare (UI ayrı yakalama yapmaz)
+        self._preview_slot = FrameSlot()
+        
         # Callbacks
         self._on_text_detected: Optional[Callable[[str], None]] = None
         self._on_translation_complete: Optional[Callable] = None
@@ -48,9 +94,22 @@ class ApplicationController:
         # Hariç tutulan alanlar
         self._exclusion_areas: list = []
         
-        # Worker thread
-        self._worker_thread: Optional[threading.Thread] = None
+        # Pipeline: yakalama -> OCR -> çeviri (her aşama kendi thread'inde)
+        self._worker_threads: List[threading.Thread] = []
         self._stop_event = threading.Event()
+        self._ocr_queue = DropOldestQueue(self._config.ocr_queue_size)
+        self._translate_queue = DropOldestQueue(self._config.translate_queue_size)
+        self._stage_stats = {
+            "capture": StageStats(),
+            "ocr": StageStats(),
+            "translate": StageStats()
+        }
+        self._last_latency_ms = 0.0  # Son yakalama -> çeviri süresi
+        
+        # Çeviriler için kalıcı event loop (bağlantılar çağrılar arasında korunur)
+        self._translation_loop = AsyncLoopThread("translation-loop")
+        self._latest_translation: Optional[Future] = None  # Hız sınırında yalnızca en yenisi bekler
+        self._latest_lock = threading.Lock()
         
         # UI güncellemeleri için queue
         self._ui_queue: queue.Queue = queue.Queue()
@@ -66,6 +125,7 @@ class ApplicationController:
     def set_ocr_engine(self, engine) -> None:
         """OCR Engine'i ayarlar"""
         self._ocr_engine = engine
+        self._incremental_ocr = IncrementalOCR(engine, self._change_detector) if engine else None
     
     def set_translation_engine(self, engine) -> None:
         """Translation Engine'i ayarlar"""
@@ -114,10 +174,28 @@ class ApplicationController:
         self._last_fps_time = time.time()
         self._last_text = ""
         self._ocr_ready = False
+        self._change_detector.reset()
+        if self._incremental_ocr:
+            self._incremental_ocr.reset()
+        self._region_texts.clear()
+        self._scheduler.reset()
+        self._active_keys = []
+        self._frames_processed = 0
+        self._frames_skipped = 0
+        self._last_latency_ms = 0.0
+        self._ocr_queue.reopen()
+        self._translate_queue.reopen()
+        for stats in self._stage_stats.values():
+            stats.reset()
         
-        # Worker thread başlat
-        self._worker_thread = threading.Thread(target=self._ocr_loop, daemon=True)
-        self._worker_thread.start()
+        # Aşama thread'lerini başlat
+        self._worker_threads = [
+            threading.Thread(target=self._capture_loop, name="capture", daemon=True),
+            threading.Thread(target=self._ocr_loop, name="ocr", daemon=True),
+            threading.Thread(target=self._translate_loop, name="translate", daemon=True)
+        ]
+        for thread in self._worker_threads:
+            thread.start()
         
         if self._on_state_changed:
             self._on_state_changed(self._state)
@@ -128,9 +206,14 @@ class ApplicationController:
             return
         
         self._stop_event.set()
+        self._ocr_queue.close()
+        self._translate_queue.close()
+        self._translation_loop.cancel_pending()
         
-        if self._worker_thread and self._worker_thread.is_alive():
-            self._worker_thread.join(timeout=2.0)
+        for thread in self._worker_threads:
+            if thread.is_alive():
+                thread.join(timeout=2.0)
+        self._worker_threads = []
         
         self._state = AppState.IDLE
         self._fps = 0.0
@@ -150,6 +233,7 @@ class ApplicationController:
         """OCR döngüsünü devam ettirir"""
         if self._state == AppState.PAUSED:
             self._state = AppState.RUNNING
+            self._scheduler.reset()  # Devam edince hemen tara
             if self._on_state_changed:
                 self._on_state_changed(self._state)
     
@@ -160,10 +244,85 @@ class ApplicationController:
     def get_fps(self) -> float:
         """Anlık FPS değerini döndürür"""
         return self._fps
+    
+    def get_frame_stats(self) -> dict:
+        """İşlenen ve atlanan (değişmeyen) bölge karelerinin sayısını döndürür"""
+        processed = self._frames_processed
+        skipped = self._frames_skipped
+        total = processed + skipped
+        partial = self._incremental_ocr.get_stats()["partial"] if self._incremental_ocr else 0
+        return {
+            "processed": processed,
+            "skipped": skipped,
+            "partial": partial,  # Yalnızca değişen satırların OCR'landığı kareler
+            "skip_ratio": skipped / total if total else 0.0
+        }
+    
+    def get_pipeline_stats(self) -> dict:
+        """Aşama kullanım oranlarını, kuyruk derinliklerini ve uçtan uca gecikmeyi döndürür"""
+        return {
+            "stages": {name: stats.get_stats() for name, stats in self._stage_stats.items()},
+            "queues": {
+                "ocr": self._ocr_queue.get_stats(),
+                "translate": self._translate_queue.get_stats()
+            },
+            "last_latency_ms": self._last_latency_ms
+        }
+    
+    def get_scan_status(self) -> tuple:
+        """Etkin tarama hızını (tarama/sn) ve son değişikliğin gerekçesini döndürür"""
+        return self._scheduler.get_rate(), self._scheduler.get_reason()
+    
+    def set_scan_bounds(self, min_interval_ms: int, max_interval_ms: int) -> None:
+        """Uyarlanabilir tarama aralığı sınırlarını ayarlar"""
+        self._config.min_interval_ms = min_interval_ms
+        self._config.max_interval_ms = max_interval_ms
+        self._scheduler.set_bounds(min_interval_ms, max_interval_ms)
+    
+    def get_latest_frame(self) -> tuple:
+        """OCR döngüsünün son yakaladığı kareyi (sürüm, Frame) olarak döndürür"""
+        return self._preview_slot.get()
+    
+    def set_change_tolerance(self, tolerance: float) -> None:
+        """Değişiklik algılama gürültü toleransını ayarlar"""
+        self._config.change_tolerance = tolerance
+        self._change_detector.set_tolerance(tolerance)
 
     
+    def _capture_loop(self) -> None:
+        """Yakalama aşaması - zamanı gelen bölgeleri yakalar ve OCR kuyruğuna verir"""
+        # OCR modeli yüklenene kadar yakalama yapma
+        while not self._ocr_ready and not self._stop_event.is_set():
+            self._stop_event.wait(0.05)
+        
+        while not self._stop_event.is_set():
+            if self._state == AppState.PAUSED:
+                self._stop_event.wait(0.1)
+                continue
+            
+            started = time.monotonic()
+            try:
+                batch = self._capture_frames()
+            except Exception as e:
+                print(f"Ekran yakalama hatası: {e}")
+                batch = None
+            
+            if batch is not None:
+                self._stage_stats["capture"].record(started, time.monotonic())
+                # OCR geride kalırsa bayat kare atılır; bölgeleri zaten yeniden zamanlandı
+                self._ocr_queue.put(batch)
+            
+            # Bir sonraki bölgenin taranma zamanına kadar bekle (stop ile hemen uyanır)
+            wait_time = self._scheduler.time_until_next(self._active_keys)
+            if wait_time > 0:
+                self._stop_event.wait(wait_time)
+        
+        # Bu thread'e ait yakalama oturumunu kapat
+        if self._region_selector:
+            self._region_selector.release_capture_session()
+    
     def _ocr_loop(self) -> None:
-        """OCR döngüsü (worker thread'de çalışır)"""
+        """OCR aşaması (kendi worker thread'inde çalışır)"""
         # Overlay'e "Yükleniyor" mesajı gönder
         self._update_overlay("⏳ OCR yükleniyor...")
         
@@ -179,17 +338,20 @@ class ApplicationController:
             return
         
         # Ana döngü
-        while not self._stop_event.is_set():
-            if self._state == AppState.PAUSED:
-                time.sleep(0.1)
+        while True:
+            try:
+                batch = self._ocr_queue.get(timeout=0.5)
+            except QueueClosed:
+                break
+            if batch is None:
                 continue
             
-            start_time = time.time()
-            
+            started = time.monotonic()
             try:
-                self._process_frame()
+                self._process_frame(batch)
             except Exception as e:
                 print(f"OCR işleme hatası: {e}")
+            self._stage_stats["ocr"].record(started, time.monotonic())
             
             # FPS hesapla
             self._frame_count += 1
@@ -200,13 +362,23 @@ class ApplicationController:
                 self._fps = self._frame_count / elapsed
                 self._frame_count = 0
                 self._last_fps_time = current_time
+    
+    def _translate_loop(self) -> None:
+        """Çeviri aşaması - yalnızca en güncel metni çevirir"""
+        while True:
+            try:
+                item = self._translate_queue.get(timeout=0.5)
+            except QueueClosed:
+                break
+            if item is None:
+                continue
             
-            # Bekleme süresi
-            process_time = time.time() - start_time
-            wait_time = max(0, (self._config.ocr_interval_ms / 1000.0) - process_time)
-            
-            if wait_time > 0:
-                time.sleep(wait_time)
+            region_items, captured_at = item
+            started = time.monotonic()
+            self._translate_text(region_items)
+            finished = time.monotonic()
+            self._stage_stats["translate"].record(started, finished)
+            self._last_latency_ms = (finished - captured_at) * 1000.0
     
     def _update_overlay(self, text: str) -> None:
         """Overlay'i günceller (thread-safe)"""
@@ -217,10 +389,10 @@ class ApplicationController:
             except Exception as e:
                 print(f"Overlay güncelleme hatası: {e}")
     
-    def _process_frame(self) -> None:
-        """Tek bir frame işler - tüm aktif bölgeleri tarar"""
+    def _capture_frames(self) -> Optional[CaptureBatch]:
+        """Taranma zamanı gelen aktif bölgeleri yakalar"""
         if not self._region_selector or not self._ocr_engine or not self._ocr_ready:
-            return
+            return None
         
         # Tüm aktif bölgeleri al
         regions = self._region_selector.get_enabled_regions()
@@ -230,52 +402,81 @@ class ApplicationController:
             if region:
                 regions = [region]
             else:
-                return
+                return None
         
-        all_texts = []
+        keys = [self._region_key(region) for region in regions]
+        self._active_keys = keys
+        self._scheduler.retain(keys)
+        self._retain_region_state(keys)
         
-        for region in regions:
-            # Ekran görüntüsü al
-            try:
-                image_data = self._region_selector.capture_region(region)
-            except Exception as e:
-                print(f"Ekran yakalama hatası ({region.name}): {e}")
+        # Yalnızca taranma zamanı gelmiş bölgeleri yakala
+        due_keys = set(self._scheduler.due(keys))
+        due = [(region, key) for region, key in zip(regions, keys) if key in due_keys]
+        if not due:
+            return None
+        
+        # Sonuç gelene kadar aynı bölgeyi mevcut aralıkla ertele
+        for _, key in due:
+            self._scheduler.mark_captured(key)
+        
+        # Monitör başına tek yakalama
+        captured = self._region_selector.capture_regions([region for region, _ in due])
+        frames = {key: frame for (_, key), frame in zip(due, captured)}
+        
+        # Önizleme için ilk bölgenin karesini yayınla
+        if keys[0] in frames:
+            self._preview_slot.publish(frames[keys[0]])
+        
+        return CaptureBatch(regions=regions, keys=keys, frames=frames)
+    
+    def _process_frame(self, batch: CaptureBatch) -> None:
+        """Yakalanan kare grubunu OCR'dan geçirir ve değişen metni çeviriye verir"""
+        region_items = []  # (bölge anahtarı, metin) - ekran sırasıyla
+        
+        for region, key in zip(batch.regions, batch.keys):
+            frame = batch.frames.get(key)
+            if frame is None:
+                # Bu turda yakalanmadı - önceki metni kullan
+                text = self._region_texts.get(key, "")
+                if text:
+                    region_items.append((key, text))
                 continue
             
-            # OCR işlemi
+            # OCR - değişmeyen bölgeler atlanır, değişenlerde yalnızca kirli satırlar taranır
             try:
-                ocr_result = self._ocr_engine.process_image(image_data)
+                if self._config.change_detection_enabled and self._incremental_ocr:
+                    ocr_result = self._incremental_ocr.process(key, frame)
+                else:
+                    ocr_result = self._ocr_engine.process_image(frame)
             except Exception as e:
                 print(f"OCR hatası ({region.name}): {e}")
+                # Bir sonraki taramada yeniden dene
+                if self._incremental_ocr:
+                    self._incremental_ocr.reset(key)
+                self._region_texts.pop(key, None)
+                self._scheduler.report(key, changed=False)
                 continue
             
-            if not ocr_result.text or not ocr_result.text.strip():
-                continue
-            
-            # Hariç tutulan alanları kontrol et
-            skip_region = False
-            if self._exclusion_areas and ocr_result.bounding_boxes:
-                for bbox in ocr_result.bounding_boxes:
-                    global_x = region.x + bbox[0]
-                    global_y = region.y + bbox[1]
-                    box_w = bbox[2] - bbox[0]
-                    box_h = bbox[3] - bbox[1]
-                    
-                    if self._is_in_exclusion_area(global_x, global_y, box_w, box_h):
-                        print(f"Metin hariç tutulan alanda, atlanıyor: ({global_x}, {global_y})")
-                        skip_region = True
-                        break
+            previous_text = self._region_texts.get(key)
+            if ocr_result is None:
+                self._frames_skipped += 1
+                text = previous_text or ""
+            else:
+                self._frames_processed += 1
+                text = self._filter_region_text(region, ocr_result)
+                self._region_texts[key] = text
             
-            if skip_region:
-                continue
+            # Metin değiştiyse hızlı taramaya dön, değişmediyse yavaşla
+            self._scheduler.report(key, changed=text != (previous_text or ""))
             
-            all_texts.append(ocr_result.text.strip())
+            if text:
+                region_items.append((key, text))
         
-        if not all_texts:
+        if not region_items:
             return
         
         # Tüm metinleri birleştir
-        combined_text = " ".join(all_texts)
+        combined_text = " ".join(text for _, text in region_items)
         
         # Aynı metin tekrar algılandıysa çevirme
         if combined_text == self._last_text:
@@ -288,23 +489,179 @@ class ApplicationController:
         if self._on_text_detected:
             self._on_text_detected(combined_text)
         
-        # Çeviri
+        # Çeviri aşamasına bölge bölge ver (OCR beklemeden sonraki kareye geçer)
         if self._translation_engine:
-            self._translate_text(combined_text)
+            self._translate_queue.put((region_items, batch.captured_at))
+    
+    def _retain_region_state(self, keys: list) -> None:
+        """Kaldırılan bölgelerin metin, OCR sonucu ve imza durumunu siler"""
+        keep = set(keys)
+        if self._incremental_ocr:
+            self._incremental_ocr.retain(keep)
+        else:
+            self._change_detector.retain(keep)
+        for key in list(self._region_texts):
+            if key not in keep:
+                self._region_texts.pop(key, None)
+    
+    @staticmethod
+    def _region_key(region) -> tuple:
+        """Bölgeyi değişiklik algılama için tanımlayan anahtar"""
+        return (region.monitor_id, region.x, region.y, region.width, region.height)
+    
+    def _filter_region_text(self, region, ocr_result) -> str:
+        """OCR sonucundan bölge metnini çıkarır (hariç tutulan alanlar boş döner)"""
+        if not ocr_result.text or not ocr_result.text.strip():
+            return ""
+        
+        # Hariç tutulan alanları kontrol et
+        if self._exclusion_areas and ocr_result.bounding_boxes:
+            for bbox in ocr_result.bounding_boxes:
+                global_x = region.x + bbox[0]
+                global_y = region.y + bbox[1]
+                box_w = bbox[2] - bbox[0]
+                box_h = bbox[3] - bbox[1]
+                
+                if self._is_in_exclusion_area(global_x, global_y, box_w, box_h):
+                    print(f"Metin hariç tutulan alanda, atlanıyor: ({global_x}, {global_y})")
+                    return ""
+        
+        return ocr_result.text.strip()
+    
+    def submit(self, text: str) -> Future:
+        """Metni kalıcı çeviri loop'unda çevirir (thread-safe)
+        
+        Sonuç tamamlandığında overlay'e ve çeviri callback'ine iletilir;
+        akış açıksa kısmi çeviri geldikçe overlay güncellenir.
+        
+        Returns:
+            TranslationResult döndüren concurrent.futures.Future
+        """
+        engine = self._translation_engine
+        if not engine:
+            raise RuntimeError("Çeviri motoru ayarlanmamış")
+        
+        if engine.supports_streaming():
+            coro = engine.translate_stream(text, self._update_overlay)
+        else:
+            coro = engine.translate(text)
+        future = self._translation_loop.submit(coro)
+        future.add_done_callback(self._on_translation_done)
+        self._supersede(future)
+        return future
+    
+    def submit_regions(self, region_items: List[tuple]) -> Future:
+        """Bölge metinlerini kalıcı çeviri loop'unda çevirir (thread-safe)
+        
+        Args:
+            region_items: Ekran sırasıyla (bölge anahtarı, metin) listesi
+        
+        Returns:
+            Birleştirilmiş TranslationResult döndüren concurrent.futures.Future
+        """
+        if not self._translation_engine:
+            raise RuntimeError("Çeviri motoru ayarlanmamış")
+        
+        future = self._translation_loop.submit(self._translate_regions(list(region_items)))
+        future.add_done_callback(self._on_translation_done)
+        self._supersede(future)
+        return future
+    
+    def _supersede(self, future: Future) -> None:
+        """Provider hız sınırındaysa bekleyen eski çeviriyi iptal eder
+        
+        Sınır altında kuyrukta yalnızca en yeni satır tutulur; eski satırların
+        çevirisi gelse de ekranda çoktan eskimiş olur.
+        """
+        with self._latest_lock:
+            previous, self._latest_translation = self._latest_translation, future
+        if previous is not None and not previous.done() and self._translation_engine.is_rate_limited():
+            previous.cancel()
+    
+    async def _translate_regions(self, region_items: List[tuple]):
+        """Yalnızca metni değişen bölgeleri tek istekte çevirir, overlay metnini birleştirir
+        
+        Bölge çevirileri yalnızca loop thread'inde okunup yazılır.
+        """
+        from .translate.providers import TranslationResult
+        
+        engine = self._translation_engine
+        context = (engine.get_provider(), engine.get_languages())
+        if context != self._translation_context:
+            # Provider veya dil değişti - eski çeviriler geçersiz
+            self._region_translations = {}
+            self._translation_context = context
+        
+        changed = [
+            text for key, text in region_items
+            if self._region_translations.get(key, (None, None))[0] != text
+        ]
+        pending = list(dict.fromkeys(changed))
+        cached = True
+        provider = context[0]
+        
+        if pending:
+            if engine.supports_streaming():
+                results = await self._stream_regions(region_items, pending)
+            else:
+                results = await engine.translate_batch(pending)
+            translations = {r.original_text: r.translated_text for r in results}
+            cached = all(r.cached for r in results)
+            served = {r.provider for r in results}
+            if len(served) == 1:
+                # Hedge kazandıysa yanıtı yedek provider vermiştir
+                provider = served.pop()
+        else:
+            translations = {}
+        
+        # Yalnızca aktif bölgeleri tut
+        self._region_translations = {
+            key: (text, translations[text]) if text in translations else self._region_translations[key]
+            for key, text in region_items
+        }
+        
+        return TranslationResult(
+            original_text="\n".join(text for _, text in region_items),
+            translated_text="\n".join(self._region_translations[key][1] for key, _ in region_items),
+            provider=provider,
+            cached=cached
+        )
+    
+    async def _stream_regions(self, region_items: List[tuple], pending: List[str]) -> list:
+        """Değişen bölgeleri akışlı çevirir; her parçada overlay metnini yeniler
+        
+        Henüz parçası gelmeyen bölgelerde önceki çeviri gösterilir.
+        """
+        engine = self._translation_engine
+        partials = {}
+        
+        def show(text: str, partial: str) -> None:
+            partials[text] = partial
+            self._update_overlay("\n".join(
+                partials.get(region_text) or self._region_translations.get(key, (None, ""))[1]
+                for key, region_text in region_items
+            ))
+        
+        return await asyncio.gather(*(
+            engine.translate_stream(text, lambda partial, text=text: show(text, partial))
+            for text in pending
+        ))
     
-    def _translate_text(self, text: str) -> None:
-        """Metni çevirir"""
+    def _translate_text(self, region_items: List[tuple]) -> None:
+        """Bölge metinlerini çevirir ve sonucu bekler (çeviri aşaması)"""
         try:
-            # Yeni event loop oluştur ve çalıştır
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self._translation_engine.translate(text)
-                )
-            finally:
-                loop.close()
+            self.submit_regions(region_items).result()
+        except Exception:
+            pass  # Hatalar _on_translation_done'da işlenir
+    
+    def _on_translation_done(self, future: Future) -> None:
+        """Tamamlanan çeviriyi overlay'e ve callback'e iletir (loop thread'inde)"""
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is None:
+            result = future.result()
             
             # Overlay'e gönder
             if self._overlay_window and result:
@@ -312,17 +669,22 @@ class ApplicationController:
             
             # Callback
             if self._on_translation_complete:
-                self._on_translation_complete(result)
-                
-        except Exception as e:
-            error_msg = str(e)
-            print(f"Çeviri hatası: {error_msg}")
-            # Hata mesajını overlay'de göster
-            if self._overlay_window:
-                if "API anahtarı" in error_msg:
-                    self._update_overlay("⚠️ API anahtarı ayarlanmamış!")
-                else:
-                    self._update_overlay(f"⚠️ Çeviri hatası")
+                try:
+                    self._on_translation_complete(result)
+                except Exception as e:
+                    print(f"Çeviri callback hatası: {e}")
+            return
+        
+        error_msg = str(error)
+        print(f"Çeviri hatası: {error_msg}")
+        # Hata mesajını overlay'de göster
+        if self._overlay_window:
+            if "API anahtarı" in error_msg:
+                self._update_overlay("⚠️ API anahtarı ayarlanmamış!")
+            elif isinstance(error, RateLimitedError):
+                self._update_overlay("⚠️ Çeviri hız sınırına takıldı, bekleniyor...")
+            else:
+                self._update_overlay(f"⚠️ Çeviri hatası")
     
     def on_text_detected(self, callback: Callable[[str], None]) -> None:
         """Metin algılama callback'i ayarlar"""
@@ -339,6 +701,16 @@ class ApplicationController:
     def cleanup(self) -> None:
         """Kaynakları temizler"""
         self.stop()
+        if self._translation_engine and self._translation_loop.is_running():
+            # HTTP oturumları açıldıkları loop'ta kapatılmalı
+            try:
+                self._translation_loop.submit(self._translation_engine.close()).result(timeout=2.0)
+            except Exception as e:
+                print(f"Çeviri oturumu kapatma hatası: {e}")
+        self._translation_loop.stop()
+        if self._cache_manager:
+            self._cache_manager.close()
+        self._preview_slot.clear()
         self._ocr_engine = None
         self._translation_engine = None
         self._cache_manager = None
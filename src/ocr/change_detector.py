@@ -0,0 +1,149 @@
+"""
+Change Detector for ChwiliTranslate
+Değişmeyen bölgeler için OCR'ı atlayan kare değişikliği dedektörü
+"""
+
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .frame import Frame
+
+
+class ChangeDetector:
+    """Bölge başına karo bazlı piksel karşılaştırması yapan dedektör
+
+    Kare BLOCK_SIZE x BLOCK_SIZE piksellik karolara bölünür ve her karonun
+    konuma duyarlı sağlama toplamı tutulur. Sağlaması aynı kalan karolar
+    temiz sayılır; değişenlerde gri tonu toleranstan fazla değişen piksel sayısı
+    MIN_DIRTY_PIXELS'e ulaşırsa karo "kirli", bölge "değişmiş" sayılır.
+    Tolerans piksel başına uygulanır; karo ortalaması kullanılmaz, çünkü
+    yer değiştiren glifler ("96" -> "69") ortalamayı değiştirmez.
+    """
+
+    BLOCK_SIZE = 16  # Karo boyutu (piksel)
+    MIN_DIRTY_PIXELS = 2  # Karoyu kirli saymak için gereken değişen piksel sayısı
+
+    def __init__(self, tolerance: float = 2.0):
+        """Change Detector'ı başlatır
+
+        Args:
+            tolerance: Piksel başına izin verilen parlaklık farkı (0-255)
+        """
+        self._tolerance = max(0.0, tolerance)
+        self._signatures: Dict[Hashable, Tuple[np.ndarray, np.ndarray]] = {}  # (gri, sağlamalar)
+        self._weights: Dict[int, np.ndarray] = {}  # Karo alanı -> sağlama ağırlıkları
+
+    def set_tolerance(self, tolerance: float) -> None:
+        """Gürültü toleransını ayarlar"""
+        self._tolerance = max(0.0, tolerance)
+
+    def get_tolerance(self) -> float:
+        """Gürültü toleransını döndürür"""
+        return self._tolerance
+
+    @classmethod
+    def _block_dims(cls, frame: Frame) -> Tuple[int, int]:
+        """(blok yüksekliği, blok genişliği) döndürür"""
+        return min(cls.BLOCK_SIZE, frame.height), min(cls.BLOCK_SIZE, frame.width)
+
+    @classmethod
+    def signature(cls, frame: Frame) -> np.ndarray:
+        """Karenin karolara tam bölünecek şekilde doldurulmuş gri tonunu döndürür"""
+        gray = frame.to_gray()
+        height, width = gray.shape
+        block_h, block_w = cls._block_dims(frame)
+        rows = -(-height // block_h)
+        cols = -(-width // block_w)
+
+        # Kenardaki eksik blokları kenar pikselleriyle tamamla
+        pad_h = rows * block_h - height
+        pad_w = cols * block_w - width
+        if pad_h or pad_w:
+            gray = np.pad(gray, ((0, pad_h), (0, pad_w)), mode="edge")
+        return gray
+
+    @staticmethod
+    def _tiles(gray: np.ndarray, block_h: int, block_w: int) -> np.ndarray:
+        """Gri kareyi (satır, sütun, karo pikselleri) biçimine getirir"""
+        rows = gray.shape[0] // block_h
+        cols = gray.shape[1] // block_w
+        return gray.reshape(rows, block_h, cols, block_w).transpose(0, 2, 1, 3).reshape(
+            rows, cols, block_h * block_w
+        )
+
+    def _checksums(self, tiles: np.ndarray) -> np.ndarray:
+        """Karo başına konuma duyarlı 32-bit sağlama toplamı
+
+        Her piksel sabit, tek sayı bir ağırlıkla çarpılıp mod 2^32 toplanır;
+        pikselleri yer değiştiren değişiklikler de sağlamayı değiştirir.
+        """
+        size = tiles.shape[-1]
+        weights = self._weights.get(size)
+        if weights is None:
+            rng = np.random.default_rng(size)
+            weights = rng.integers(1, 2**32, size=size, dtype=np.uint64).astype(np.uint32) | 1
+            self._weights[size] = weights
+        return (tiles.astype(np.uint32) * weights).sum(axis=-1, dtype=np.uint32)
+
+    def _dirty_tiles(self, previous: np.ndarray, current: np.ndarray,
+                     candidates: np.ndarray) -> np.ndarray:
+        """Sağlaması değişen karolardan toleransı aşanları döndürür (satır x sütun maske)"""
+        dirty = np.zeros(candidates.shape, dtype=bool)
+        index = np.nonzero(candidates)
+        before = previous[index].astype(np.int16)
+        after = current[index].astype(np.int16)
+        counts = (np.abs(after - before) > self._tolerance).sum(axis=-1)
+        dirty[index] = counts >= min(self.MIN_DIRTY_PIXELS, current.shape[-1])
+        return dirty
+
+    def dirty_rect(self, key: Hashable, frame: Frame) -> Optional[Tuple[int, int, int, int]]:
+        """Değişen karoların sınırlayıcı kutusunu döndürür (imzayı günceller)
+
+        Returns:
+            (x, y, genişlik, yükseklik) veya bölge değişmediyse None
+        """
+        block_h, block_w = self._block_dims(frame)
+        tiles = self._tiles(self.signature(frame), block_h, block_w)
+        checksums = self._checksums(tiles)
+        previous = self._signatures.get(key)
+
+        if previous is None or previous[0].shape != tiles.shape:
+            self._signatures[key] = (tiles, checksums)
+            return (0, 0, frame.width, frame.height)
+
+        candidates = checksums != previous[1]
+        if not candidates.any():
+            return None
+        dirty = self._dirty_tiles(previous[0], tiles, candidates)
+        if not dirty.any():
+            # Yavaş kaymaların birikmesini önlemek için referansı koru
+            return None
+
+        self._signatures[key] = (tiles, checksums)
+
+        rows = np.flatnonzero(dirty.any(axis=1))
+        cols = np.flatnonzero(dirty.any(axis=0))
+        x = int(cols[0]) * block_w
+        y = int(rows[0]) * block_h
+        x2 = min(frame.width, (int(cols[-1]) + 1) * block_w)
+        y2 = min(frame.height, (int(rows[-1]) + 1) * block_h)
+        return (x, y, x2 - x, y2 - y)
+
+    def has_changed(self, key: Hashable, frame: Frame) -> bool:
+        """Bölge önceki kareye göre değişti mi (imzayı günceller)"""
+        return self.dirty_rect(key, frame) is not None
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        """İmzaları sıfırlar (bir sonraki kare değişmiş sayılır)"""
+        if key is None:
+            self._signatures.clear()
+        else:
+            self._signatures.pop(key, None)
+
+    def retain(self, keys: Iterable[Hashable]) -> None:
+        """Listede olmayan (kaldırılmış) bölgelerin imzalarını siler"""
+        keep = set(keys)
+        for key in list(self._signatures):
+            if key not in keep:
+                del self._signatures[key]
@@ -4,10 +4,12 @@ EasyOCR tabanlı metin tanıma motoru
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union
 from enum import Enum
 import time
 
+from .frame import Frame
+
 
 class OCRSpeed(Enum):
     """OCR hız modu"""
@@ -25,6 +27,14 @@ class OCRConfig:
     confidence_threshold: float = 0.7
 
 
+@dataclass
+class OCRSegment:
+    """Tek bir metin satırı/parçası"""
+    text: str
+    confidence: float
+    box: Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
 @dataclass
 class OCRResult:
     """OCR sonucu"""
@@ -32,6 +42,7 @@ class OCRResult:
     confidence: float
     bounding_boxes: List[Tuple[int, int, int, int]]
     timestamp: float
+    segments: List[OCRSegment] = field(default_factory=list)
 
 
 class OCREngine:
@@ -128,14 +139,22 @@ class OCREngine:
         )
 
     
-    def process_image(self, image: bytes) -> OCRResult:
-        """Görüntüden metin çıkarır"""
+    def process_image(self, image: Union[Frame, bytes]) -> OCRResult:
+        """Görüntüden metin çıkarır
+        
+        Args:
+            image: Ham Frame (önerilen) veya kodlanmış görüntü bytes'ı
+        """
         if not self._initialized:
             self._init_reader()
         
         start_time = time.time()
         
         try:
+            # Frame ise PNG'ye dönmeden doğrudan RGB dizisi ver
+            if isinstance(image, Frame):
+                image = image.to_rgb()
+            
             # EasyOCR ile metin tanıma
             results = self._reader.readtext(image)
             
@@ -143,6 +162,7 @@ class OCREngine:
             texts = []
             confidences = []
             boxes = []
+            segments = []
             
             for result in results:
                 bbox, text, conf = result
@@ -154,12 +174,14 @@ class OCREngine:
                     if bbox:
                         x_coords = [p[0] for p in bbox]
                         y_coords = [p[1] for p in bbox]
-                        boxes.append((
+                        box = (
                             int(min(x_coords)),
                             int(min(y_coords)),
                             int(max(x_coords)),
                             int(max(y_coords))
-                        ))
+                        )
+                        boxes.append(box)
+                        segments.append(OCRSegment(text=text, confidence=conf, box=box))
             
             combined_text = " ".join(texts)
             avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
@@ -168,7 +190,8 @@ class OCREngine:
                 text=combined_text,
                 confidence=avg_confidence,
                 bounding_boxes=boxes,
-                timestamp=time.time() - start_time
+                timestamp=time.time() - start_time,
+                segments=segments
             )
             
         except Exception as e:
@@ -0,0 +1,112 @@
+"""
+Frame for ChwiliTranslate
+Ham ekran görüntüsü - PNG kodlaması olmadan OCR'a aktarım
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+import io
+import time
+
+import numpy as np
+
+
+@dataclass
+class Frame:
+    """mss tamponu üzerinde BGRA görünümü (kopyasız)"""
+    data: np.ndarray  # (yükseklik, genişlik, 4) uint8, BGRA sırası
+    left: int = 0  # Ekran koordinatı
+    top: int = 0
+    timestamp: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_screenshot(cls, screenshot) -> "Frame":
+        """mss ScreenShot'tan kopyalamadan Frame oluşturur"""
+        buffer = np.frombuffer(screenshot.raw, dtype=np.uint8)
+        data = buffer.reshape(screenshot.height, screenshot.width, 4)
+        return cls(data=data, left=screenshot.left, top=screenshot.top)
+
+    @property
+    def width(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def size(self) -> tuple:
+        """(genişlik, yükseklik) döndürür"""
+        return (self.width, self.height)
+
+    def crop(self, x: int, y: int, width: int, height: int) -> "Frame":
+        """Alt bölgeyi görünüm olarak döndürür (kopyasız)"""
+        return Frame(
+            data=self.data[y:y + height, x:x + width],
+            left=self.left + x,
+            top=self.top + y,
+            timestamp=self.timestamp
+        )
+
+    def downscale(self, max_width: int, max_height: int) -> "Frame":
+        """Verilen boyuta sığacak şekilde atlamalı örnekleme yapar (kopyasız)"""
+        step = max(
+            1,
+            -(-self.width // max(1, max_width)),
+            -(-self.height // max(1, max_height))
+        )
+        if step == 1:
+            return self
+        return Frame(
+            data=self.data[::step, ::step],
+            left=self.left,
+            top=self.top,
+            timestamp=self.timestamp
+        )
+
+    def to_rgb(self) -> np.ndarray:
+        """BGRA -> RGB (vektörel, tek kopya)"""
+        return np.ascontiguousarray(self.data[..., 2::-1])
+
+    def to_gray(self) -> np.ndarray:
+        """BGRA -> gri tonlama (ITU-R BT.601 tamsayı ağırlıkları)"""
+        pixels = self.data.astype(np.uint16)
+        gray = (pixels[..., 2] * 77 + pixels[..., 1] * 150 + pixels[..., 0] * 29) >> 8
+        return gray.astype(np.uint8)
+
+    def to_png(self) -> bytes:
+        """PNG bytes'a çevirir (geriye uyumluluk)"""
+        from PIL import Image
+
+        img = Image.fromarray(self.to_rgb(), "RGB")
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+class FrameSlot:
+    """En son kareyi tutan kilitsiz tek değerlik yuva
+
+    Yazar (yakalama aşaması) yeni kareyi tek bir referans atamasıyla yayınlar;
+    okuyucu (UI) her zaman tutarlı bir (sürüm, kare) çifti görür.
+    """
+
+    def __init__(self):
+        self._latest: tuple = (0, None)
+
+    def publish(self, frame: Frame) -> None:
+        """Yeni kareyi yayınlar"""
+        version = self._latest[0] + 1  # Tek yazar varsayımı
+        self._latest = (version, frame)
+
+    def latest(self) -> Optional[Frame]:
+        """En son kareyi döndürür"""
+        return self._latest[1]
+
+    def get(self) -> tuple:
+        """(sürüm, kare) çiftini döndürür"""
+        return self._latest
+
+    def clear(self) -> None:
+        """Yuvayı boşaltır"""
+        self._latest = (self._latest[0] + 1, None)
@@ -0,0 +1,147 @@
+"""
+Incremental OCR for ChwiliTranslate
+Kirli karo takibi ile yalnızca değişen alt alanların OCR'ı
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import time
+
+from .change_detector import ChangeDetector
+from .engine import OCREngine, OCRResult, OCRSegment
+from .frame import Frame
+
+
+class IncrementalOCR:
+    """Bölgenin yalnızca değişen satırlarını yeniden tanıyan OCR sarmalayıcısı
+
+    Değişen karoların sınırlayıcı kutusu tüm bölge genişliğine ve kesiştiği
+    önceki metin satırlarına genişletilir; bu bant dışındaki satırlar bir
+    önceki OCRResult'tan aynen alınır. Önceki satırlarla kesişmeyen (yeni)
+    bir satırın bandı her iki yönde en az bir karo satırı veya satır yüksekliği
+    kadar büyütülür; tolerans altında kalan üst/alt uzantılar kesilmez.
+    """
+
+    LINE_MARGIN = 4  # Bant sınırlarına eklenen piksel payı
+    FULL_OCR_RATIO = 0.6  # Bant bölgenin bu oranından büyükse tam OCR yap
+
+    def __init__(self, engine: OCREngine, detector: Optional[ChangeDetector] = None):
+        """Incremental OCR'ı başlatır"""
+        self._engine = engine
+        self._detector = detector or ChangeDetector()
+        self._results: Dict[Hashable, OCRResult] = {}
+        self._partial_count = 0
+        self._full_count = 0
+
+    def get_detector(self) -> ChangeDetector:
+        """Kullanılan değişiklik dedektörünü döndürür"""
+        return self._detector
+
+    def process(self, key: Hashable, frame: Frame) -> Optional[OCRResult]:
+        """Bölge karesini işler
+
+        Returns:
+            Güncel OCRResult veya bölge değişmediyse None
+        """
+        rect = self._detector.dirty_rect(key, frame)
+        if rect is None:
+            return None
+
+        previous = self._results.get(key)
+        if previous is None:
+            return self._process_full(key, frame)
+
+        top, bottom = self._expand_to_lines(rect, previous.segments, frame.height)
+        if bottom - top >= frame.height * self.FULL_OCR_RATIO:
+            return self._process_full(key, frame)
+
+        start_time = time.time()
+        band = frame.crop(0, top, frame.width, bottom - top)
+        partial = self._engine.process_image(band)
+
+        # Bant dışındaki önceki satırlar + banttaki yeni satırlar
+        segments = [
+            seg for seg in previous.segments
+            if seg.box[3] <= top or seg.box[1] >= bottom
+        ]
+        for seg in partial.segments:
+            x1, y1, x2, y2 = seg.box
+            segments.append(OCRSegment(
+                text=seg.text,
+                confidence=seg.confidence,
+                box=(x1, y1 + top, x2, y2 + top)
+            ))
+
+        result = self._build_result(segments, time.time() - start_time)
+        self._results[key] = result
+        self._partial_count += 1
+        return result
+
+    def _process_full(self, key: Hashable, frame: Frame) -> OCRResult:
+        """Bölgenin tamamında OCR çalıştırır"""
+        result = self._engine.process_image(frame)
+        self._results[key] = result
+        self._full_count += 1
+        return result
+
+    def _expand_to_lines(self, rect: Tuple[int, int, int, int],
+                         segments: List[OCRSegment], height: int) -> Tuple[int, int]:
+        """Kirli kutuyu kesiştiği metin satırlarının tamamını kapsayacak şekilde genişletir"""
+        top = max(0, rect[1] - self.LINE_MARGIN)
+        bottom = min(height, rect[1] + rect[3] + self.LINE_MARGIN)
+
+        if not any(seg.box[1] < bottom and seg.box[3] > top for seg in segments):
+            # Yeni satır: önceki satır yüksekliği veya en az bir karo satırı kadar büyüt
+            line_heights = sorted(seg.box[3] - seg.box[1] for seg in segments)
+            grow = self._detector.BLOCK_SIZE
+            if line_heights:
+                grow = max(grow, line_heights[len(line_heights) // 2])
+            top = max(0, rect[1] - grow)
+            bottom = min(height, rect[1] + rect[3] + grow)
+
+        expanded = True
+        while expanded:
+            expanded = False
+            for seg in segments:
+                y1, y2 = seg.box[1], seg.box[3]
+                if y1 < bottom and y2 > top and (y1 < top or y2 > bottom):
+                    top = max(0, min(top, y1 - self.LINE_MARGIN))
+                    bottom = min(height, max(bottom, y2 + self.LINE_MARGIN))
+                    expanded = True
+
+        return top, bottom
+
+    @staticmethod
+    def _build_result(segments: List[OCRSegment], elapsed: float) -> OCRResult:
+        """Satırları okuma sırasına dizip OCRResult oluşturur"""
+        segments.sort(key=lambda seg: (seg.box[1], seg.box[0]))
+        confidences = [seg.confidence for seg in segments]
+        return OCRResult(
+            text=" ".join(seg.text for seg in segments),
+            confidence=sum(confidences) / len(confidences) if confidences else 0.0,
+            bounding_boxes=[seg.box for seg in segments],
+            timestamp=elapsed,
+            segments=segments
+        )
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        """Önceki sonuçları ve karo imzalarını sıfırlar"""
+        if key is None:
+            self._results.clear()
+        else:
+            self._results.pop(key, None)
+        self._detector.reset(key)
+
+    def retain(self, keys: Iterable[Hashable]) -> None:
+        """Listede olmayan (kaldırılmış) bölgelerin sonuçlarını ve imzalarını siler"""
+        keep = set(keys)
+        for key in list(self._results):
+            if key not in keep:
+                del self._results[key]
+        self._detector.retain(keep)
+
+    def get_stats(self) -> Dict:
+        """Kısmi ve tam OCR sayılarını döndürür"""
+        return {
+            "partial": self._partial_count,
+            "full": self._full_count
+        }
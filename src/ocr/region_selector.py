@@ -5,7 +5,9 @@ Ekran bölgesi seçim aracı - Çoklu bölge desteği
 
 from dataclasses import dataclass, field
 from typing import Optional, List, Callable, Dict
-import io
+
+from .frame import Frame
+from .screen_grabber import ScreenGrabber
 
 
 @dataclass
@@ -53,6 +55,7 @@ class RegionSelector:
     """Ekran bölgesi seçim aracı - Çoklu bölge desteği"""
     
     MAX_REGIONS = 5  # Maksimum bölge sayısı
+    MAX_UNION_OVERHEAD = 4.0  # Birleşik alan / bölge alanları oranı bunu aşarsa ayrı yakala
     
     def __init__(self):
         """Region Selector'ı başlatır"""
@@ -62,26 +65,24 @@ class RegionSelector:
         self._on_complete_callback: Optional[Callable[[Region], None]] = None
         self._is_selecting = False
         self._selecting_index: int = -1  # Hangi bölge için seçim yapılıyor (-1 = yeni)
+        self._grabber = ScreenGrabber()  # Kalıcı yakalama oturumu
     
     def get_monitors(self) -> List[Dict]:
-        """Mevcut monitörleri listeler"""
-        try:
-            import mss
-            with mss.mss() as sct:
-                monitors = []
-                for i, mon in enumerate(sct.monitors[1:], start=0):  # İlki tüm ekranlar
-                    monitors.append({
-                        "id": i,
-                        "left": mon["left"],
-                        "top": mon["top"],
-                        "width": mon["width"],
-                        "height": mon["height"],
-                        "name": f"Monitor {i + 1}"
-                    })
-                self._monitors = monitors
-                return monitors
-        except ImportError:
-            return [{"id": 0, "left": 0, "top": 0, "width": 1920, "height": 1080, "name": "Default"}]
+        """Mevcut monitörleri listeler (önbellekten)"""
+        self._monitors = self._grabber.get_monitors()
+        return self._monitors
+    
+    def invalidate_monitors(self) -> None:
+        """Monitör geometrisi önbelleğini yeniler (ekran değişikliği)"""
+        self._grabber.invalidate_monitors()
+    
+    def get_capture_stats(self) -> Dict:
+        """Ekran yakalama gecikme istatistiklerini döndürür"""
+        return self._grabber.get_stats()
+    
+    def release_capture_session(self) -> None:
+        """Çağıran thread'in yakalama oturumunu kapatır"""
+        self._grabber.close()
 
     
     def start_selection(self, on_complete: Callable[[Region], None], index: int = -1) -> None:
@@ -194,51 +195,90 @@ class RegionSelector:
         if not self._regions:
             self.add_region(region)
     
-    def capture_region(self, region: Optional[Region] = None) -> bytes:
-        """Belirtilen bölgenin ekran görüntüsünü alır"""
+    def _get_capture_area(self, region: Region) -> Dict:
+        """Bölgenin mutlak ekran koordinatlarındaki yakalama alanını döndürür"""
+        # Monitör offset'ini hesapla (önbellekten)
+        monitors = self.get_monitors()
+        monitor_offset_x = 0
+        monitor_offset_y = 0
+        
+        if region.monitor_id < len(monitors):
+            mon = monitors[region.monitor_id]
+            monitor_offset_x = mon["left"]
+            monitor_offset_y = mon["top"]
+        
+        return {
+            "left": monitor_offset_x + region.x,
+            "top": monitor_offset_y + region.y,
+            "width": region.width,
+            "height": region.height
+        }
+    
+    def capture_region(self, region: Optional[Region] = None) -> Frame:
+        """Belirtilen bölgenin ekran görüntüsünü ham Frame olarak alır"""
         target_region = region or self._current_region
         
         if not target_region:
             raise ValueError("Bölge belirtilmedi")
         
-        try:
-            import mss
-            from PIL import Image
+        # Ekran görüntüsü al (kalıcı oturum) - PNG'ye çevirmeden
+        screenshot = self._grabber.grab(self._get_capture_area(target_region))
+        return Frame.from_screenshot(screenshot)
+    
+    def capture_regions(self, regions: List[Region]) -> List[Frame]:
+        """Birden fazla bölgeyi monitör başına tek yakalama ile alır
+        
+        Aynı monitördeki bölgelerin birleşim dikdörtgeni bir kez yakalanır ve
+        her bölgeye ortak tampondan kopyasız bir kesit verilir. Böylece
+        bölgeler aynı andan gelir (bölgeler arası yırtılma olmaz).
+        
+        Returns:
+            Bölgelerle aynı sırada Frame listesi
+        """
+        frames: List[Optional[Frame]] = [None] * len(regions)
+        
+        # Monitöre göre grupla
+        groups: Dict[int, List[int]] = {}
+        for index, region in enumerate(regions):
+            groups.setdefault(region.monitor_id, []).append(index)
+        
+        for indices in groups.values():
+            areas = [self._get_capture_area(regions[i]) for i in indices]
+            left = min(a["left"] for a in areas)
+            top = min(a["top"] for a in areas)
+            right = max(a["left"] + a["width"] for a in areas)
+            bottom = max(a["top"] + a["height"] for a in areas)
+            
+            # Bölgeler birbirinden çok uzaksa birleşimi yakalamak pahalıya patlar
+            union_area = (right - left) * (bottom - top)
+            total_area = sum(a["width"] * a["height"] for a in areas)
+            if len(indices) == 1 or union_area > total_area * self.MAX_UNION_OVERHEAD:
+                for i, area in zip(indices, areas):
+                    frames[i] = Frame.from_screenshot(self._grabber.grab(area))
+                continue
             
-            with mss.mss() as sct:
-                # Monitör offset'ini hesapla
-                monitors = self.get_monitors()
-                monitor_offset_x = 0
-                monitor_offset_y = 0
-                
-                if target_region.monitor_id < len(monitors):
-                    mon = monitors[target_region.monitor_id]
-                    monitor_offset_x = mon["left"]
-                    monitor_offset_y = mon["top"]
-                
-                # Yakalama alanı
-                monitor = {
-                    "left": monitor_offset_x + target_region.x,
-                    "top": monitor_offset_y + target_region.y,
-                    "width": target_region.width,
-                    "height": target_region.height
-                }
-                
-                # Ekran görüntüsü al
-                screenshot = sct.grab(monitor)
-                
-                # PIL Image'e çevir
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                
-                # Bytes'a çevir
-                buffer = io.BytesIO()
-                img.save(buffer, format="PNG")
-                return buffer.getvalue()
-                
+            union = Frame.from_screenshot(self._grabber.grab({
+                "left": left,
+                "top": top,
+                "width": right - left,
+                "height": bottom - top
+            }))
+            for i, area in zip(indices, areas):
+                frames[i] = union.crop(
+                    area["left"] - left, area["top"] - top,
+                    area["width"], area["height"]
+                )
+        
+        return frames
+    
+    def capture_region_bytes(self, region: Optional[Region] = None) -> bytes:
+        """Bölgenin ekran görüntüsünü PNG bytes olarak alır (geriye uyumluluk)"""
+        try:
+            return self.capture_region(region).to_png()
         except ImportError:
             raise ImportError("mss veya Pillow yüklü değil")
     
-    def capture_full_screen(self, monitor_id: int = 0) -> bytes:
+    def capture_full_screen(self, monitor_id: int = 0) -> Frame:
         """Tam ekran görüntüsü alır"""
         monitors = self.get_monitors()
         
@@ -0,0 +1,128 @@
+"""
+Screen Grabber for ChwiliTranslate
+Kalıcı ekran yakalama oturumu ve monitör geometrisi önbelleği
+"""
+
+from collections import deque
+from typing import Optional, List, Dict
+import threading
+import time
+
+
+class ScreenGrabber:
+    """Thread başına kalıcı mss oturumu tutan ekran yakalayıcı
+
+    mss handle'ları thread'ler arasında paylaşılamaz; bu yüzden her thread
+    kendi oturumunu açar ve tekrar kullanır. Monitör geometrisi yalnızca
+    invalidate_monitors() çağrıldığında yeniden okunur.
+    """
+
+    LATENCY_WINDOW = 100  # Gecikme istatistiği için son N yakalama
+    DEFAULT_MONITORS = [{"id": 0, "left": 0, "top": 0, "width": 1920, "height": 1080, "name": "Default"}]
+
+    def __init__(self):
+        """Screen Grabber'ı başlatır"""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0  # Ekran değişikliğinde artar, eski oturumlar yenilenir
+        self._monitors: Optional[List[Dict]] = None
+        self._latencies: deque = deque(maxlen=self.LATENCY_WINDOW)
+        self._capture_count = 0
+        self._session_count = 0
+
+    def _get_session(self):
+        """Mevcut thread'in mss oturumunu döndürür (gerekirse açar)"""
+        import mss
+
+        sct = getattr(self._local, "sct", None)
+        if sct is not None and self._local.generation == self._generation:
+            return sct
+
+        # Eski oturum monitör listesini önbelleğe almış olabilir - kapat
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+        self._local.sct = mss.mss()
+        self._local.generation = self._generation
+        with self._lock:
+            self._session_count += 1
+        return self._local.sct
+
+    def get_monitors(self) -> List[Dict]:
+        """Monitör listesini döndürür (önbellekten)"""
+        with self._lock:
+            monitors = self._monitors
+        if monitors is not None:
+            return monitors
+
+        try:
+            sct = self._get_session()
+        except ImportError:
+            return [m.copy() for m in self.DEFAULT_MONITORS]
+        generation = self._local.generation  # Listenin okunduğu oturumun nesli
+
+        monitors = []
+        for i, mon in enumerate(sct.monitors[1:], start=0):  # İlki tüm ekranlar
+            monitors.append({
+                "id": i,
+                "left": mon["left"],
+                "top": mon["top"],
+                "width": mon["width"],
+                "height": mon["height"],
+                "name": f"Monitor {i + 1}"
+            })
+        with self._lock:
+            # Okuma sırasında invalidate_monitors() çağrıldıysa eski geometriyi saklama
+            if generation == self._generation:
+                self._monitors = monitors
+        return monitors
+
+    def invalidate_monitors(self) -> None:
+        """Monitör önbelleğini geçersiz kılar (ekran değişikliği)"""
+        with self._lock:
+            self._generation += 1
+            self._monitors = None
+
+    def grab(self, area: Dict):
+        """Verilen ekran alanını yakalar (mss ScreenShot döndürür)"""
+        try:
+            sct = self._get_session()
+        except ImportError:
+            raise ImportError("mss yüklü değil")
+
+        start_time = time.perf_counter()
+        screenshot = sct.grab(area)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+
+        with self._lock:
+            self._latencies.append(elapsed_ms)
+            self._capture_count += 1
+        return screenshot
+
+    def close(self) -> None:
+        """Mevcut thread'in oturumunu kapatır"""
+        sct = getattr(self._local, "sct", None)
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+            self._local.sct = None
+
+    def get_stats(self) -> Dict:
+        """Yakalama gecikme istatistiklerini döndürür (ms)"""
+        with self._lock:
+            latencies = list(self._latencies)
+            captures = self._capture_count
+            sessions = self._session_count
+
+        return {
+            "captures": captures,
+            "sessions_opened": sessions,
+            "last_ms": latencies[-1] if latencies else 0.0,
+            "avg_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+            "max_ms": max(latencies) if latencies else 0.0
+        }
@@ -4,12 +4,28 @@ SQLite tabanlı çeviri önbelleği
 """
 
 import sqlite3
+import hashlib
 import os
+import pathlib
+import random
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from contextlib import contextmanager
 
+from .memory_cache import LRUCache
+from .similarity import TrigramIndex, normalize_text
+
+
+def _key_hash(text: str, source_lang: str, target_lang: str) -> int:
+    """(metin, kaynak dil, hedef dil) için işaretli 64-bit özet (SQLite INTEGER)"""
+    digest = hashlib.blake2b(
+        f"{source_lang}\x1f{target_lang}\x1f{text}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
 
 @dataclass
 class CacheEntry:
@@ -23,63 +39,518 @@ class CacheEntry:
 
 
 class CacheManager:
-    """SQLite tabanlı çeviri önbelleği"""
+    """SQLite tabanlı çeviri önbelleği
+    
+    Önünde (metin, kaynak dil, hedef dil) anahtarlı bir bellek içi LRU katmanı
+    bulunur; okumalar önce bellekten, yazmalar her iki katmana yapılır.
+    
+    Her thread WAL modunda açılmış kalıcı bir SQLite bağlantısı kullanır;
+    hazırlanmış ifadeler bağlantı başına önbelleklenir.
+    
+    Satırın rowid'si (metin, kaynak, hedef) özetidir; tam eşleşme tek bir
+    rowid aramasıdır. Normalize aramalar norm_hash dizinini kullanır. Özet
+    çakışmasına karşı metin her okumada doğrulanır.
+    
+    Yazmalar bekleyen tampona alınır ve arka plandaki yazıcı thread'i
+    tarafından FLUSH_ENTRIES kayıtta veya FLUSH_INTERVAL_MS'de bir tek
+    transaction ile diske yazılır; okumalar tamponu da görür. İsabetlerin
+    last_accessed/hit_count güncellemeleri de aynı transaction'a eklenir.
+    
+    set_limits() ile kayıt sayısı, metin boyutu ve kullanılmama süresi
+    sınırlanabilir; sınırı aşan kayıtlar yazıcı thread'inde LRU veya LFU
+    sırasıyla parça parça silinir ve boşalan sayfalar artımlı vacuum ile
+    dosyadan geri verilir.
+    
+    Provider ve dil çifti başına kayıt/bayt toplamları tetikleyicilerle
+    translation_counts tablosunda tutulur ve her yazmadan sonra belleğe
+    alınır; get_stats() veritabanına gitmez.
+    """
+    
+    # SQLite bağlantı ayarları
+    BUSY_TIMEOUT_MS = 5000  # Kilitli veritabanında bekleme süresi
+    PAGE_CACHE_KIB = 8192  # Bağlantı başına sayfa önbelleği
+    STATEMENT_CACHE_SIZE = 256  # Bağlantı başına hazırlanmış ifade önbelleği
+    
+    # Arka plan yazıcısı
+    FLUSH_ENTRIES = 256  # Bu kadar kayıt birikince hemen yaz
+    FLUSH_INTERVAL_MS = 200  # İlk bekleyen kayıttan sonra en geç yazma süresi
+    WRITER_IDLE_S = 2.0  # Boştaki yazıcı thread'i bu süre sonra çıkar
+    
+    # Atma ve sıkıştırma
+    EVICT_LRU = "lru"  # En uzun süredir kullanılmayan önce
+    EVICT_LFU = "lfu"  # En az kullanılan önce
+    EVICT_BATCH = 500  # Transaction başına silinen en fazla kayıt
+    EVICT_TARGET = 0.9  # Sınır aşılınca sınırın bu oranına kadar sil
+    COMPACT_INTERVAL_S = 60.0  # Sınır kontrolleri arası en kısa süre
+    VACUUM_PAGES = 256  # Artımlı vacuum adımında geri verilen sayfa
+    
+    SCHEMA_VERSION = 3  # PRAGMA user_version
+    
+    MEMORY_MAX_ENTRIES = 2048
+    MEMORY_MAX_BYTES = 4 * 1024 * 1024
+    
+    # Eşleşme türleri
+    MATCH_EXACT = "exact"
+    MATCH_NORMALIZED = "normalized"  # Boşluk/noktalama/Unicode farkı
+    MATCH_SIMILAR = "similar"  # Trigram benzerliği eşiğin üstünde
+    
+    VERIFY_SAMPLE_RATE = 0.1  # Benzerlik eşleşmelerinin doğrulanma oranı
+    LATENCY_SAMPLES = 500
     
-    def __init__(self, db_path: str = "cache.db"):
+    def __init__(self, db_path: str = "cache.db",
+                 memory_max_entries: int = MEMORY_MAX_ENTRIES,
+                 memory_max_bytes: int = MEMORY_MAX_BYTES):
         """Cache manager'ı başlatır"""
         self.db_path = db_path
         self._enabled = True
+        self._memory = LRUCache(memory_max_entries, memory_max_bytes)
+        self._db_hits = 0
+        self._db_misses = 0
+        
+        # Yakın kopya araması (eşik 0 ise kapalı)
+        self._similarity_threshold = 0.0
+        self._similarity_index: Optional[TrigramIndex] = None
+        self._stats_lock = threading.Lock()
+        self._match_counts = {self.MATCH_NORMALIZED: 0, self.MATCH_SIMILAR: 0}
+        self._lookup_ms: deque = deque(maxlen=self.LATENCY_SAMPLES)
+        self._verified = 0
+        self._false_matches = 0
+        
+        # Thread başına kalıcı bağlantı
+        self._local = threading.local()
+        self._connections: list = []  # (sahip thread, bağlantı)
+        self._connections_lock = threading.Lock()
+        self._connections_opened = 0
+        
+        # Write-behind: anahtar -> satır, yazıcı thread'i tek transaction'da boşaltır
+        self._pending: dict = {}
+        self._pending_normalized: dict = {}  # (normalize metin, kaynak, hedef) -> satır
+        self._pending_cond = threading.Condition()
+        self._write_lock = threading.Lock()  # Aynı anda tek boşaltma
+        self._writer: Optional[threading.Thread] = None
+        self._flushes = 0
+        self._rows_written = 0
+        
+        # İsabet kayıtları: anahtar -> isabet sayısı, yazıcı thread'i toplu günceller
+        self._touched: dict = {}
+        self._touches_written = 0
+        
+        # Boyut sınırları (0 = sınırsız)
+        self._max_entries = 0
+        self._max_bytes = 0
+        self._ttl_seconds = 0.0
+        self._eviction_policy = self.EVICT_LRU
+        self._compact_due = False
+        self._compact_lock = threading.Lock()  # Aynı anda tek sıkıştırma
+        self._last_compact = time.monotonic()
+        self._evicted = 0
+        self._expired = 0
+        self._vacuumed_pages = 0
+        
+        # (provider, kaynak, hedef) -> (kayıt, bayt); yazmalardan sonra yenilenir
+        self._counts: dict = {}
+        self._stats_version = 0
+        
+        self._created = False  # Dosya yalnızca ilk (şema) bağlantısında oluşturulur
         self._init_database()
+        self._created = True
+        self._refresh_counts()
     
     def _init_database(self) -> None:
-        """Veritabanı şemasını oluşturur"""
+        """Veritabanı şemasını oluşturur, eski sürümleri taşır"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS translations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    source_text TEXT NOT NULL,
-                    translated_text TEXT NOT NULL,
-                    source_lang TEXT NOT NULL,
-                    target_lang TEXT NOT NULL,
-                    provider TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(source_text, source_lang, target_lang)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_source_text 
-                ON translations(source_text)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_languages 
-                ON translations(source_lang, target_lang)
-            """)
-            conn.commit()
-
+            # Yeni veritabanında hemen, eskisinde VACUUM sonrası etkin olur
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL kalıcıdır: okuyucular yazarı, yazar okuyucuları beklemez
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= self.SCHEMA_VERSION:
+                return
+            
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'translations'"
+            ).fetchone() is not None
+            
+            conn.execute("BEGIN")
+            try:
+                if not exists:
+                    self._create_schema(conn)
+                elif version == 0:
+                    conn.execute("ALTER TABLE translations RENAME TO translations_legacy")
+                    self._create_schema(conn)
+                    self._migrate_legacy(conn)
+                elif version == 1:
+                    self._migrate_v1(conn)
+                else:
+                    self._create_schema(conn)
+                if exists:
+                    self._rebuild_counts(conn)
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            if exists and version < 2:
+                conn.execute("VACUUM")  # Eski dizinlerin yerini geri ver
+    
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        """Güncel şemayı oluşturur"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                id INTEGER PRIMARY KEY,  -- (metin, kaynak, hedef) özeti
+                norm_hash INTEGER NOT NULL,  -- (normalize metin, kaynak, hedef) özeti
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_accessed REAL NOT NULL DEFAULT 0,  -- Unix zamanı
+                hit_count INTEGER NOT NULL DEFAULT 0,
+                size_bytes INTEGER NOT NULL DEFAULT 0  -- Metin + çeviri (UTF-8)
+            )
+        """)
+        # Normalize arama: aday rowid'ler dizinden bulunur, satırlar rowid ile okunur
+        # (kapsayan dizin değil - metinleri dizine kopyalamak dosyayı büyütürdü)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_norm_hash 
+            ON translations(norm_hash)
+        """)
+        # Atma sırası: LRU ve LFU
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_last_accessed 
+            ON translations(last_accessed)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_hit_count 
+            ON translations(hit_count, last_accessed)
+        """)
+        
+        # Provider ve dil çifti başına toplamlar; COUNT(*)/GROUP BY taraması gerekmez
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation_counts (
+                provider TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                entries INTEGER NOT NULL,
+                bytes INTEGER NOT NULL,
+                PRIMARY KEY (provider, source_lang, target_lang)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_counts_insert AFTER INSERT ON translations
+            BEGIN
+                INSERT INTO translation_counts
+                VALUES (NEW.provider, NEW.source_lang, NEW.target_lang, 1, NEW.size_bytes)
+                ON CONFLICT(provider, source_lang, target_lang)
+                DO UPDATE SET entries = entries + 1, bytes = bytes + excluded.bytes;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_counts_delete AFTER DELETE ON translations
+            BEGIN
+                UPDATE translation_counts SET entries = entries - 1, bytes = bytes - OLD.size_bytes
+                WHERE provider = OLD.provider AND source_lang = OLD.source_lang
+                      AND target_lang = OLD.target_lang;
+                DELETE FROM translation_counts
+                WHERE provider = OLD.provider AND source_lang = OLD.source_lang
+                      AND target_lang = OLD.target_lang AND entries <= 0;
+            END
+        """)
+        # İsabet güncellemeleri (last_accessed, hit_count) tetiklemez
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_counts_update
+            AFTER UPDATE OF provider, source_lang, target_lang, size_bytes ON translations
+            BEGIN
+                UPDATE translation_counts SET entries = entries - 1, bytes = bytes - OLD.size_bytes
+                WHERE provider = OLD.provider AND source_lang = OLD.source_lang
+                      AND target_lang = OLD.target_lang;
+                INSERT INTO translation_counts
+                VALUES (NEW.provider, NEW.source_lang, NEW.target_lang, 1, NEW.size_bytes)
+                ON CONFLICT(provider, source_lang, target_lang)
+                DO UPDATE SET entries = entries + 1, bytes = bytes + excluded.bytes;
+                DELETE FROM translation_counts
+                WHERE provider = OLD.provider AND source_lang = OLD.source_lang
+                      AND target_lang = OLD.target_lang AND entries <= 0;
+            END
+        """)
+    
+    @staticmethod
+    def _migrate_legacy(conn: sqlite3.Connection) -> None:
+        """Metin anahtarlı eski tablodaki kayıtları özet anahtarlı tabloya taşır"""
+        rows = conn.execute("""
+            SELECT source_text, translated_text, source_lang, target_lang, provider, created_at
+            FROM translations_legacy ORDER BY id
+        """).fetchall()
+        conn.executemany("""
+            INSERT OR REPLACE INTO translations 
+            (id, norm_hash, source_text, translated_text, source_lang, target_lang, provider, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (_key_hash(text, source_lang, target_lang),
+             _key_hash(normalize_text(text), source_lang, target_lang),
+             text, translated, source_lang, target_lang, provider, created_at)
+            for text, translated, source_lang, target_lang, provider, created_at in rows
+        ])
+        conn.execute("DROP TABLE translations_legacy")
+        CacheManager._backfill_usage(conn)
+    
+    @staticmethod
+    def _rebuild_counts(conn: sqlite3.Connection) -> None:
+        """Toplam tablosunu kayıtlardan yeniden hesaplar (yalnızca taşımada)"""
+        conn.execute("DELETE FROM translation_counts")
+        conn.execute("""
+            INSERT INTO translation_counts
+            SELECT provider, source_lang, target_lang, COUNT(*), COALESCE(SUM(size_bytes), 0)
+            FROM translations GROUP BY provider, source_lang, target_lang
+        """)
+    
+    def _refresh_counts(self) -> None:
+        """Toplamları küçük özet tablodan belleğe alır"""
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute("""
+                    SELECT provider, source_lang, target_lang, entries, bytes
+                    FROM translation_counts
+                """).fetchall()
+        except sqlite3.Error as e:
+            print(f"Önbellek istatistik hatası: {e}")
+            return
+        
+        counts = {(provider, source, target): (entries, size)
+                  for provider, source, target, entries, size in rows}
+        with self._stats_lock:
+            if counts != self._counts:
+                self._counts = counts
+                self._stats_version += 1
+    
+    @staticmethod
+    def _migrate_v1(conn: sqlite3.Connection) -> None:
+        """Sürüm 1 tablosuna kullanım sütunlarını ekler"""
+        conn.execute("ALTER TABLE translations ADD COLUMN last_accessed REAL NOT NULL DEFAULT 0")
+        conn.execute("ALTER TABLE translations ADD COLUMN hit_count INTEGER NOT NULL DEFAULT 0")
+        conn.execute("ALTER TABLE translations ADD COLUMN size_bytes INTEGER NOT NULL DEFAULT 0")
+        CacheManager._create_schema(conn)
+        CacheManager._backfill_usage(conn)
+    
+    @staticmethod
+    def _backfill_usage(conn: sqlite3.Connection) -> None:
+        """Taşınan kayıtların son erişimini oluşturulma zamanından, boyutunu metinden doldurur"""
+        conn.execute("""
+            UPDATE translations SET
+                last_accessed = COALESCE(CAST(strftime('%s', created_at) AS REAL), 0),
+                size_bytes = LENGTH(CAST(source_text AS BLOB)) + LENGTH(CAST(translated_text AS BLOB))
+        """)
     
     @contextmanager
     def _get_connection(self):
-        """Veritabanı bağlantısı context manager"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Çağıran thread'in kalıcı bağlantısını verir (yoksa açar)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.conn = conn
+        yield conn
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Ayarlanmış yeni bir bağlantı açar, biten thread'lerin bağlantılarını kapatır
+        
+        Şema kurulduktan sonra açılan bağlantılar mode=rw ile açılır: dosya
+        silindiyse yazıcı sessizce boş bir veritabanı oluşturmak yerine hata verir.
+        """
+        database, uri = self.db_path, False
+        if self._created:
+            database = pathlib.Path(os.path.abspath(self.db_path)).as_uri() + "?mode=rw"
+            uri = True
+        conn = sqlite3.connect(
+            database,
+            timeout=self.BUSY_TIMEOUT_MS / 1000.0,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+            check_same_thread=False,  # close() başka thread'den çağrılabilir
+            uri=uri
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL'da commit başına fsync yok
+        conn.execute(f"PRAGMA cache_size=-{self.PAGE_CACHE_KIB}")
+        conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        
+        with self._connections_lock:
+            alive = []
+            for owner, other in self._connections:
+                if owner.is_alive():
+                    alive.append((owner, other))
+                else:
+                    other.close()
+            alive.append((threading.current_thread(), conn))
+            self._connections = alive
+            self._connections_opened += 1
+        return conn
+    
     
     def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
         """Önbellekten çeviri getirir"""
+        match = self.get_match(text, source_lang, target_lang)
+        return match[0] if match else None
+    
+    def get_match(self, text: str, source_lang: str,
+                  target_lang: str) -> Optional[Tuple[str, str]]:
+        """Önbellekten çeviriyi eşleşme türüyle getirir
+        
+        Sırasıyla bellek, tam/normalize SQLite anahtarı ve (açıksa) benzerlik
+        dizini denenir.
+        
+        Returns:
+            (çeviri, eşleşme türü) veya None
+        """
         if not self._enabled:
             return None
         
+        started = time.perf_counter()
+        try:
+            key = (text, source_lang, target_lang)
+            translated = self._memory.get(key)
+            if translated is not None:
+                self._touch(key)
+                return translated, self.MATCH_EXACT
+            
+            row = self._get_pending(key)
+            if row is not None:
+                # Henüz diske yazılmamış kayıt
+                self._memory.put(key, row[1])
+                return row[1], self.MATCH_EXACT
+            
+            match = self._query_normalized(text, normalize_text(text), source_lang, target_lang)
+            if match is None:
+                match = self._query_similar(text, source_lang, target_lang)
+            
+            if match is None:
+                self._db_misses += 1
+                return None
+            
+            self._db_hits += 1
+            if match[1] != self.MATCH_EXACT:
+                with self._stats_lock:
+                    self._match_counts[match[1]] += 1
+            else:
+                # Tam olmayan eşleşmeler belleğe alınmaz: sonraki aramada da türüyle
+                # dönmeli ki doğrulama örneklemesine ve istatistiklere girsin
+                self._memory.put(key, match[0])
+            return match
+        finally:
+            with self._stats_lock:
+                self._lookup_ms.append((time.perf_counter() - started) * 1000.0)
+    
+    def _query_exact(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Tam anahtarla (rowid) arar"""
+        with self._get_connection() as conn:
+            result = conn.execute("""
+                SELECT source_text, source_lang, target_lang, translated_text
+                FROM translations WHERE id = ?
+            """, (_key_hash(text, source_lang, target_lang),)).fetchone()
+        
+        if result is None or result[:3] != (text, source_lang, target_lang):
+            return None  # Yok veya özet çakışması
+        self._touch(result[:3])
+        return result[3]
+    
+    def _query_normalized(self, text: str, normalized: str, source_lang: str,
+                          target_lang: str) -> Optional[Tuple[str, str]]:
+        """Önce tam, sonra normalize anahtarla arar"""
+        translated = self._query_exact(text, source_lang, target_lang)
+        if translated is not None:
+            return translated, self.MATCH_EXACT
+        if not normalized:
+            # Yalnızca noktalama/boşluktan oluşan metinler birbirine eşlenmez
+            return None
+        
+        # Diske yazılmamış kayıtlar daha yeni
+        with self._pending_cond:
+            row = self._pending_normalized.get((normalized, source_lang, target_lang))
+        if row is not None:
+            return row[1], self.MATCH_EXACT if row[0] == text else self.MATCH_NORMALIZED
+        
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT source_text, source_lang, target_lang, translated_text
+                FROM translations WHERE norm_hash = ?
+            """, (_key_hash(normalized, source_lang, target_lang),)).fetchall()
+        
+        for source_text, row_source, row_target, translated in rows:
+            # Özet çakışmasına karşı doğrula
+            if (row_source, row_target) == (source_lang, target_lang) and \
+                    normalize_text(source_text) == normalized:
+                self._touch((source_text, row_source, row_target))
+                return translated, self.MATCH_EXACT if source_text == text else self.MATCH_NORMALIZED
+        return None
+    
+    def _query_similar(self, text: str, source_lang: str,
+                       target_lang: str) -> Optional[Tuple[str, str]]:
+        """Benzerlik dizininde eşiğin üstündeki en yakın metni arar"""
+        index = self._similarity_index
+        if index is None:
+            return None
+        
+        found = index.query((source_lang, target_lang), normalize_text(text), self._similarity_threshold)
+        if found is None:
+            return None
+        
+        match = self._query_normalized(text, found[0], source_lang, target_lang)
+        if match is None:
+            return None
+        return match[0], self.MATCH_SIMILAR
+    
+    def set_similarity_threshold(self, threshold: float) -> None:
+        """Yakın kopya eşiğini ayarlar (0-1, 0 kapatır)"""
+        self._similarity_threshold = max(0.0, min(1.0, threshold))
+        if self._similarity_threshold <= 0.0:
+            self._similarity_index = None
+            return
+        if self._similarity_index is None:
+            self._similarity_index = self._build_similarity_index()
+    
+    def get_similarity_threshold(self) -> float:
+        """Yakın kopya eşiğini döndürür"""
+        return self._similarity_threshold
+    
+    def _build_similarity_index(self) -> TrigramIndex:
+        """Mevcut kayıtlardan benzerlik dizinini oluşturur"""
+        self.flush()
+        index = TrigramIndex()
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT translated_text FROM translations
-                WHERE source_text = ? AND source_lang = ? AND target_lang = ?
-            """, (text, source_lang, target_lang))
-            result = cursor.fetchone()
-            return result[0] if result else None
+            cursor.execute("SELECT source_text, source_lang, target_lang FROM translations")
+            for text, source_lang, target_lang in cursor.fetchall():
+                index.add((source_lang, target_lang), normalize_text(text))
+        return index
+    
+    def should_verify(self) -> bool:
+        """Bu benzerlik eşleşmesi doğrulama için örneklenmeli mi"""
+        return random.random() < self.VERIFY_SAMPLE_RATE
+    
+    def record_verification(self, cached_translation: str, actual_translation: str) -> None:
+        """Örneklenen benzerlik eşleşmesini gerçek çeviriyle karşılaştırır"""
+        with self._stats_lock:
+            self._verified += 1
+            if normalize_text(cached_translation) != normalize_text(actual_translation):
+                self._false_matches += 1
+    
+    def get_lookup_stats(self) -> dict:
+        """Arama gecikmesi, eşleşme türleri ve tahmini yanlış eşleşme oranını döndürür"""
+        with self._stats_lock:
+            samples = sorted(self._lookup_ms)
+            verified, false_matches = self._verified, self._false_matches
+            counts = dict(self._match_counts)
+        
+        return {
+            "avg_ms": sum(samples) / len(samples) if samples else 0.0,
+            "p95_ms": samples[int(len(samples) * 0.95)] if samples else 0.0,
+            "normalized_hits": counts[self.MATCH_NORMALIZED],
+            "similar_hits": counts[self.MATCH_SIMILAR],
+            "verified": verified,
+            "false_matches": false_matches,
+            "false_match_rate": false_matches / verified if verified else 0.0
+        }
     
     def set(self, source_text: str, translated_text: str, 
             source_lang: str, target_lang: str, provider: str) -> None:
@@ -87,49 +558,338 @@ class CacheManager:
         if not self._enabled:
             return
         
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO translations 
-                (source_text, translated_text, source_lang, target_lang, provider)
-                VALUES (?, ?, ?, ?, ?)
-            """, (source_text, translated_text, source_lang, target_lang, provider))
-            conn.commit()
+        key = (source_text, source_lang, target_lang)
+        normalized = normalize_text(source_text)
+        row = (source_text, translated_text, source_lang, target_lang, provider, normalized)
+        with self._pending_cond:
+            self._pending[key] = row
+            self._pending_normalized[(normalized, source_lang, target_lang)] = row
+            if len(self._pending) == 1 or len(self._pending) >= self.FLUSH_ENTRIES:
+                self._pending_cond.notify()
+            self._ensure_writer()
+        
+        self._memory.put(key, translated_text)
+        if self._similarity_index is not None:
+            self._similarity_index.add((source_lang, target_lang), normalized)
     
-    def clear(self) -> None:
-        """Tüm önbelleği temizler"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM translations")
-            conn.commit()
+    def _touch(self, key: tuple) -> None:
+        """İsabeti kaydeder; last_accessed/hit_count sonraki boşaltmada yazılır"""
+        with self._pending_cond:
+            self._touched[key] = self._touched.get(key, 0) + 1
+            self._ensure_writer()
     
-    def get_stats(self) -> dict:
-        """Önbellek istatistiklerini döndürür"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM translations")
-            total = cursor.fetchone()[0]
+    def _has_work(self) -> bool:
+        """Yazıcı thread'i için iş var mı (_pending_cond tutulurken çağrılır)"""
+        return bool(self._pending or self._touched or self._compact_due)
+    
+    def _get_pending(self, key: tuple) -> Optional[tuple]:
+        """Diske yazılmayı bekleyen satırı döndürür"""
+        with self._pending_cond:
+            return self._pending.get(key)
+    
+    def _ensure_writer(self) -> None:
+        """Yazıcı thread'ini gerekirse başlatır (_pending_cond tutulurken çağrılır)"""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._writer_loop, name="cache-writer", daemon=True)
+            self._writer.start()
+    
+    def _writer_loop(self) -> None:
+        """Bekleyen kayıtları biriktirip toplu yazar; bir süre boş kalınca çıkar"""
+        while True:
+            with self._pending_cond:
+                if not self._has_work() and self._writer is threading.current_thread():
+                    self._pending_cond.wait(self.WRITER_IDLE_S)
+                if not self._has_work() or self._writer is not threading.current_thread():
+                    # Boşta thread tutma - sonraki set() yenisini başlatır
+                    if self._writer is threading.current_thread():
+                        self._writer = None
+                    return
+                if len(self._pending) < self.FLUSH_ENTRIES:
+                    # Biraz daha kayıt birikmesini bekle
+                    self._pending_cond.wait(self.FLUSH_INTERVAL_MS / 1000.0)
+            self.flush()
+            if self._compact_due or (
+                self._has_limits() and
+                time.monotonic() - self._last_compact >= self.COMPACT_INTERVAL_S
+            ):
+                self.compact()
+    
+    def flush(self) -> None:
+        """Bekleyen kayıtları ve isabet güncellemelerini tek transaction ile yazar"""
+        with self._write_lock:
+            with self._pending_cond:
+                batch = dict(self._pending)
+                touched, self._touched = self._touched, {}
+            if not batch and not touched:
+                return
             
-            cursor.execute("""
-                SELECT provider, COUNT(*) FROM translations 
-                GROUP BY provider
-            """)
-            by_provider = dict(cursor.fetchall())
+            now = time.time()
+            try:
+                with self._get_connection() as conn:
+                    # REPLACE silme tetikleyicisini çalıştırmaz; upsert toplamları doğru tutar
+                    conn.executemany("""
+                        INSERT INTO translations 
+                        (id, norm_hash, source_text, translated_text, source_lang, target_lang,
+                         provider, last_accessed, size_bytes)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(id) DO UPDATE SET
+                            norm_hash = excluded.norm_hash,
+                            source_text = excluded.source_text,
+                            translated_text = excluded.translated_text,
+                            source_lang = excluded.source_lang,
+                            target_lang = excluded.target_lang,
+                            provider = excluded.provider,
+                            last_accessed = excluded.last_accessed,
+                            size_bytes = excluded.size_bytes
+                    """, [
+                        (_key_hash(text, source_lang, target_lang),
+                         _key_hash(normalized, source_lang, target_lang),
+                         text, translated, source_lang, target_lang, provider, now,
+                         len(text.encode("utf-8")) + len(translated.encode("utf-8")))
+                        for text, translated, source_lang, target_lang, provider, normalized in batch.values()
+                    ])
+                    conn.executemany("""
+                        UPDATE translations SET last_accessed = ?, hit_count = hit_count + ?
+                        WHERE id = ?
+                    """, [(now, hits, _key_hash(*key)) for key, hits in touched.items()])
+                    conn.commit()
+            except sqlite3.Error as e:
+                print(f"Önbellek yazma hatası: {e}")
             
-            cursor.execute("""
-                SELECT source_lang, target_lang, COUNT(*) FROM translations 
-                GROUP BY source_lang, target_lang
-            """)
-            by_language = [
-                {"source": row[0], "target": row[1], "count": row[2]}
-                for row in cursor.fetchall()
-            ]
+            with self._pending_cond:
+                # Yazılırken güncellenen kayıtlar tamponda kalır
+                for key, row in batch.items():
+                    if self._pending.get(key) is row:
+                        del self._pending[key]
+                    normalized_key = (row[5], row[2], row[3])
+                    if self._pending_normalized.get(normalized_key) is row:
+                        del self._pending_normalized[normalized_key]
+            self._flushes += 1
+            self._rows_written += len(batch)
+            self._touches_written += len(touched)
+            if batch:
+                self._refresh_counts()
+    
+    def set_limits(self, max_entries: int = 0, max_bytes: int = 0,
+                   ttl_seconds: float = 0.0, policy: str = EVICT_LRU) -> None:
+        """SQLite katmanının boyut sınırlarını ayarlar (0 = sınırsız)
+        
+        max_bytes kayıtlardaki metin + çeviri boyutudur (UTF-8). ttl_seconds
+        bu süredir kullanılmayan kayıtları siler. Sınırlar arka planda uygulanır.
+        """
+        if policy not in (self.EVICT_LRU, self.EVICT_LFU):
+            raise ValueError(f"Bilinmeyen atma politikası: {policy}")
+        self._max_entries = max(0, int(max_entries))
+        self._max_bytes = max(0, int(max_bytes))
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._eviction_policy = policy
+        if self._has_limits():
+            with self._pending_cond:
+                self._compact_due = True
+                self._pending_cond.notify()
+                self._ensure_writer()
+    
+    def _has_limits(self) -> bool:
+        """Herhangi bir boyut sınırı ayarlı mı"""
+        return bool(self._max_entries or self._max_bytes or self._ttl_seconds)
+    
+    def compact(self) -> None:
+        """Süresi dolan ve sınırı aşan kayıtları parça parça siler, boş sayfaları geri verir"""
+        with self._compact_lock:
+            with self._pending_cond:
+                self._compact_due = False
+            self._last_compact = time.monotonic()
+        
+            try:
+                if self._ttl_seconds:
+                    cutoff = time.time() - self._ttl_seconds
+                    while True:
+                        removed = self._evict_batch(
+                            "WHERE last_accessed < ? ORDER BY last_accessed", (cutoff,), None, None
+                        )
+                        self._expired += removed
+                        if removed < self.EVICT_BATCH:
+                            break
+            
+                if self._max_entries or self._max_bytes:
+                    count, size = self._totals()
+                    if (self._max_entries and count > self._max_entries) or \
+                            (self._max_bytes and size > self._max_bytes):
+                        # Her seferinde sınırda kalmamak için biraz fazlasını sil
+                        target_entries = max(1, int(self._max_entries * self.EVICT_TARGET)) if self._max_entries else None
+                        target_bytes = int(self._max_bytes * self.EVICT_TARGET) if self._max_bytes else None
+                        if self._eviction_policy == self.EVICT_LFU:
+                            order = "ORDER BY hit_count, last_accessed"
+                        else:
+                            order = "ORDER BY last_accessed"
+                        totals = [count, size]
+                        while self._evict_batch(order, (), target_entries, target_bytes, totals):
+                            pass
             
-            return {
-                "total_entries": total,
-                "by_provider": by_provider,
-                "by_language_pair": by_language
+                self._refresh_counts()
+                self._incremental_vacuum()
+            except sqlite3.Error as e:
+                print(f"Önbellek sıkıştırma hatası: {e}")
+    
+    def _evict_batch(self, clause: str, params: tuple, target_entries: Optional[int],
+                     target_bytes: Optional[int], totals: Optional[list] = None) -> int:
+        """clause sırasındaki en fazla EVICT_BATCH kaydı siler, silinen sayıyı döndürür
+        
+        totals ([kayıt, bayt]) verildiyse hedeflere inilince durulur ve güncellenir.
+        """
+        with self._write_lock:
+            with self._get_connection() as conn:
+                rows = conn.execute(f"""
+                    SELECT id, source_text, source_lang, target_lang, size_bytes
+                    FROM translations {clause} LIMIT ?
+                """, params + (self.EVICT_BATCH,)).fetchall()
+                
+                victims = []
+                for row in rows:
+                    if totals is not None and \
+                            (target_entries is None or totals[0] <= target_entries) and \
+                            (target_bytes is None or totals[1] <= target_bytes):
+                        break
+                    victims.append(row)
+                    if totals is not None:
+                        totals[0] -= 1
+                        totals[1] -= row[4]
+                if not victims:
+                    return 0
+                
+                conn.executemany("DELETE FROM translations WHERE id = ?",
+                                 [(row[0],) for row in victims])
+                conn.commit()
+        
+        for _, text, source_lang, target_lang, _ in victims:
+            self._memory.pop((text, source_lang, target_lang))
+            if self._similarity_index is not None:
+                self._similarity_index.remove((source_lang, target_lang), normalize_text(text))
+        if totals is not None:
+            self._evicted += len(victims)
+        return len(victims)
+    
+    def _incremental_vacuum(self) -> None:
+        """Boş sayfaları VACUUM_PAGES'lik adımlarla dosyadan geri verir"""
+        with self._get_connection() as conn:
+            free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            while free:
+                with self._write_lock:
+                    conn.execute(f"PRAGMA incremental_vacuum({self.VACUUM_PAGES})").fetchall()
+                remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if remaining >= free:
+                    break  # auto_vacuum kapalı (eski dosya)
+                self._vacuumed_pages += free - remaining
+                free = remaining
+    
+    def close(self) -> None:
+        """Bekleyen kayıtları yazar, yazıcıyı durdurur ve bağlantıları kapatır"""
+        with self._pending_cond:
+            writer, self._writer = self._writer, None
+            self._pending_cond.notify()
+        if writer is not None:
+            writer.join()
+        self.flush()
+        
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for _, conn in connections:
+            conn.close()
+        self._local = threading.local()
+    
+    def __enter__(self) -> "CacheManager":
+        """with bloğunda kullanım: çıkışta close() çağrılır"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Bekleyen kayıtları yazar ve bağlantıları kapatır"""
+        self.close()
+    
+    def clear(self) -> None:
+        """Tüm önbelleği temizler (bekleyen kayıtlar dahil)"""
+        with self._write_lock:
+            with self._pending_cond:
+                self._pending.clear()
+                self._pending_normalized.clear()
+                self._touched.clear()
+                # Boşalan sayfaları arka planda geri ver
+                self._compact_due = True
+                self._ensure_writer()
+            self._memory.clear()
+            if self._similarity_index is not None:
+                self._similarity_index.clear()
+            with self._get_connection() as conn:
+                # Satır başına silme tetikleyicisi yerine tabloları yeniden oluştur
+                conn.execute("BEGIN")
+                try:
+                    conn.execute("DROP TABLE translations")
+                    conn.execute("DROP TABLE translation_counts")
+                    self._create_schema(conn)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        self._refresh_counts()
+    
+    def get_stats(self) -> dict:
+        """Önbellek istatistiklerini döndürür (bellekteki toplamlardan, SQL çalıştırmaz)
+        
+        Diske yazılmayı bekleyen kayıtlar sonraki boşaltmadan sonra sayılır.
+        """
+        with self._stats_lock:
+            counts = self._counts
+        
+        by_provider: dict = {}
+        by_pair: dict = {}
+        for (provider, source_lang, target_lang), (entries, _) in counts.items():
+            by_provider[provider] = by_provider.get(provider, 0) + entries
+            by_pair[(source_lang, target_lang)] = by_pair.get((source_lang, target_lang), 0) + entries
+        total, total_bytes = self._totals()
+        
+        return {
+            "total_entries": total,
+            "total_bytes": total_bytes,
+            "by_provider": by_provider,
+            "by_language_pair": [
+                {"source": source, "target": target, "count": count}
+                for (source, target), count in by_pair.items()
+            ],
+            "tiers": self.get_tier_stats(),
+            "lookup": self.get_lookup_stats()
+        }
+    
+    def _totals(self) -> Tuple[int, int]:
+        """Diskteki toplam kayıt ve bayt sayısı"""
+        with self._stats_lock:
+            counts = self._counts
+        return (sum(entries for entries, _ in counts.values()),
+                sum(size for _, size in counts.values()))
+    
+    def get_stats_version(self) -> int:
+        """Toplamlar her değiştiğinde artan sayaç (arayüz yenilemesi için)"""
+        return self._stats_version
+    
+    def get_tier_stats(self) -> dict:
+        """Katman başına isabet/ıska/atma sayılarını döndürür"""
+        return {
+            "memory": self._memory.get_stats(),
+            "sqlite": {
+                "hits": self._db_hits,
+                "misses": self._db_misses,
+                "connections_opened": self._connections_opened,
+                "pending_writes": len(self._pending),
+                "flushes": self._flushes,
+                "rows_written": self._rows_written,
+                "touches_written": self._touches_written,
+                "evicted": self._evicted,
+                "expired": self._expired,
+                "vacuumed_pages": self._vacuumed_pages,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "ttl_seconds": self._ttl_seconds,
+                "eviction_policy": self._eviction_policy
             }
+        }
     
     def is_enabled(self) -> bool:
         """Önbellek durumunu döndürür"""
@@ -144,17 +904,28 @@ class CacheManager:
         if not self._enabled:
             return None
         
+        row = self._get_pending((text, source_lang, target_lang))
+        if row is not None:
+            return CacheEntry(
+                source_text=row[0],
+                translated_text=row[1],
+                source_lang=row[2],
+                target_lang=row[3],
+                provider=row[4],
+                timestamp=time.time()
+            )
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT source_text, translated_text, source_lang, target_lang, 
                        provider, created_at
                 FROM translations
-                WHERE source_text = ? AND source_lang = ? AND target_lang = ?
-            """, (text, source_lang, target_lang))
+                WHERE id = ?
+            """, (_key_hash(text, source_lang, target_lang),))
             result = cursor.fetchone()
             
-            if result:
+            if result and (result[0], result[2], result[3]) == (text, source_lang, target_lang):
                 return CacheEntry(
                     source_text=result[0],
                     translated_text=result[1],
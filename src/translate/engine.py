@@ -4,17 +4,28 @@ Ana çeviri motoru yöneticisi
 """
 
 import os
+import time
+import asyncio
 import base64
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Callable
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from .providers import (
     TranslationProvider, TranslationProviderBase, TranslationResult,
-    ChatGPTProvider, GeminiProvider, GoogleTranslateProvider, DeepLProvider
+    ChatGPTProvider, GeminiProvider, GoogleTranslateProvider, DeepLProvider,
+    request_started_at, reset_request_started
 )
 from .cache import CacheManager
+from .segmenter import SentenceSegmenter
+from .routing import ProviderRouter, CircuitOpenError
+from .rate_limit import RateLimitedError, backoff_delay
+
+
+class _FlightAborted(Exception):
+    """Paylaşılan çeviri isteğinin sahibi iptal edildi"""
+    pass
 
 
 class TranslationEngine:
@@ -23,14 +34,46 @@ class TranslationEngine:
     # Şifreleme için sabit salt (gerçek uygulamada güvenli saklanmalı)
     ENCRYPTION_SALT = b'chwilitranslate_salt_2024'
     
-    def __init__(self, cache_manager: Optional[CacheManager] = None):
-        """Translation Engine'i başlatır"""
+    # Hedge (yedek provider) ayarları
+    HEDGE_PERCENTILE = 0.9  # Sabit gecikme yoksa birincil provider'ın p90'ı beklenir
+    HEDGE_DEFAULT_DELAY_MS = 1000.0  # Yeterli ölçüm yokken bekleme süresi
+    HEDGE_MIN_SAMPLES = 10
+    
+    RATE_LIMIT_RETRIES = 6  # 429/503 sonrası en fazla yeniden deneme
+    
+    def __init__(self, cache_manager: Optional[CacheManager] = None, stats_path: Optional[str] = None):
+        """Translation Engine'i başlatır
+        
+        Args:
+            cache_manager: Çeviri önbelleği
+            stats_path: Provider gecikme/hata istatistiklerinin saklandığı dosya
+        """
         self._provider: TranslationProvider = TranslationProvider.GOOGLE  # Varsayılan: Google (ücretsiz)
         self._source_lang: str = "en"
         self._target_lang: str = "tr"
         self._api_keys: Dict[TranslationProvider, str] = {}
         self._encrypted_keys: Dict[TranslationProvider, bytes] = {}
+        self._rate_limits: Dict[TranslationProvider, tuple] = {}  # provider -> (istek/sn, ani istek)
         self._cache = cache_manager
+        self._segmenter = SentenceSegmenter()
+        self._pending_verifications: Dict[tuple, str] = {}  # Doğrulanacak benzerlik eşleşmeleri
+        
+        # Aynı anda istenen aynı çeviriler tek istekte birleştirilir
+        self._inflight: Dict[tuple, asyncio.Future] = {}  # (metin, kaynak, hedef, provider) -> Future
+        self._coalesced_count = 0
+        
+        # Hedge: birincil geç kalırsa aynı istek yedek provider'a da gönderilir
+        self._hedge_provider: Optional[TranslationProvider] = None
+        self._hedge_delay_ms = 0.0  # 0 = birincilin p90 gecikmesi
+        self._hedges_sent = 0
+        self._hedge_wins = 0
+        
+        # Provider sağlığı (gecikme, hata, devre kesici) ve otomatik yönlendirme
+        self._router = ProviderRouter(stats_path)
+        self._routing_enabled = False
+        
+        # Destekleyen provider'larda çeviri geldikçe gösterilir
+        self._streaming_enabled = False
         self._fernet = self._create_fernet()
         
         # Provider instance'ları
@@ -38,6 +81,9 @@ class TranslationEngine:
         
         # Google provider'ı hemen başlat (ücretsiz)
         self._providers[TranslationProvider.GOOGLE] = GoogleTranslateProvider("")
+        
+        # Değiştirilen provider'lar (oturumları event loop'ta kapatılacak)
+        self._retired_providers: List[TranslationProviderBase] = []
     
     def _create_fernet(self) -> Fernet:
         """Şifreleme için Fernet oluşturur"""
@@ -66,6 +112,67 @@ class TranslationEngine:
         self._source_lang = source_lang
         self._target_lang = target_lang
     
+    def get_languages(self) -> tuple:
+        """(kaynak, hedef) dil çiftini döndürür"""
+        return (self._source_lang, self._target_lang)
+    
+    def set_hedging(self, provider: Optional[TranslationProvider], delay_ms: float = 0.0) -> None:
+        """Yedek provider'ı ayarlar (None kapatır)
+        
+        Birincil provider delay_ms içinde yanıt vermezse aynı istek yedeğe de
+        gönderilir; delay_ms 0 ise birincilin son gecikmelerinin p90'ı kullanılır.
+        """
+        self._hedge_provider = provider
+        self._hedge_delay_ms = max(0.0, delay_ms)
+    
+    def set_routing(self, enabled: bool) -> None:
+        """Otomatik yönlendirmeyi açar/kapatır
+        
+        Açıkken her istek, anahtarı olan provider'lar arasından en hızlı
+        sağlıklı olana gider; kapalıyken seçili provider kullanılır.
+        """
+        self._routing_enabled = enabled
+    
+    def is_routing_enabled(self) -> bool:
+        """Otomatik yönlendirme açık mı"""
+        return self._routing_enabled
+    
+    def set_streaming(self, enabled: bool) -> None:
+        """Akışlı (parça parça) çeviriyi açar/kapatır"""
+        self._streaming_enabled = enabled
+    
+    def supports_streaming(self) -> bool:
+        """Akış açık ve aktif provider parça parça çeviri döndürebiliyor mu"""
+        provider_instance = self._providers.get(self._provider)
+        return self._streaming_enabled and bool(
+            provider_instance and provider_instance.SUPPORTS_STREAMING
+        )
+    
+    def get_provider_stats(self) -> Dict[str, Dict]:
+        """Provider başına gecikme, hata oranı ve devre kesici durumunu döndürür"""
+        return self._router.get_stats()
+    
+    def _route(self) -> TranslationProvider:
+        """Bu istek için kullanılacak provider'ı seçer"""
+        if not self._routing_enabled:
+            return self._provider
+        
+        candidates = [
+            provider.value for provider in TranslationProvider
+            if provider == TranslationProvider.GOOGLE or self.get_api_key(provider)
+        ]
+        choice = self._router.choose(candidates, self._provider.value)
+        return TranslationProvider(choice) if choice else self._provider
+    
+    def get_hedging_stats(self) -> Dict:
+        """Hedge ayarını ve gönderilen/kazanan yedek istek sayılarını döndürür"""
+        return {
+            "provider": self._hedge_provider.value if self._hedge_provider else None,
+            "delay_ms": self._get_hedge_delay_ms(self._provider),
+            "hedges": self._hedges_sent,
+            "hedge_wins": self._hedge_wins
+        }
+    
     def set_api_key(self, provider: TranslationProvider, api_key: str) -> None:
         """API anahtarını güvenli şekilde saklar (şifreli)"""
         # Şifrele ve sakla
@@ -104,6 +211,10 @@ class TranslationEngine:
     
     def _update_provider_instance(self, provider: TranslationProvider, api_key: str) -> None:
         """Provider instance'ını günceller"""
+        previous = self._providers.get(provider)
+        if previous is not None:
+            self._retired_providers.append(previous)
+        
         if provider == TranslationProvider.CHATGPT:
             self._providers[provider] = ChatGPTProvider(api_key)
         elif provider == TranslationProvider.GEMINI:
@@ -112,55 +223,410 @@ class TranslationEngine:
             self._providers[provider] = GoogleTranslateProvider(api_key)
         elif provider == TranslationProvider.DEEPL:
             self._providers[provider] = DeepLProvider(api_key)
+        self._apply_rate_limit(provider)
+    
+    def set_rate_limit(self, provider: TranslationProvider, rate: float,
+                       burst: Optional[int] = None) -> None:
+        """Provider'ın saniyedeki istek sınırını ayarlar (0 = sınırsız)"""
+        self._rate_limits[provider] = (rate, burst)
+        self._apply_rate_limit(provider)
+    
+    def _apply_rate_limit(self, provider: TranslationProvider) -> None:
+        """Ayarlanmış hız sınırını provider instance'ına uygular"""
+        provider_instance = self._providers.get(provider)
+        limit = self._rate_limits.get(provider)
+        if provider_instance is not None and limit is not None:
+            provider_instance.set_rate_limit(*limit)
+    
+    def is_rate_limited(self) -> bool:
+        """Aktif provider'a giden yeni bir istek hız sınırı nedeniyle bekler mi"""
+        provider_instance = self._providers.get(self._provider)
+        return bool(provider_instance and provider_instance.is_rate_limited())
 
     
+    async def open(self) -> None:
+        """Tüm provider'ların kalıcı HTTP oturumlarını açar"""
+        await self._close_retired()
+        for provider_instance in list(self._providers.values()):
+            await provider_instance.open()
+    
+    async def close(self) -> None:
+        """Tüm provider oturumlarını kapatır ve istatistikleri kaydeder"""
+        self._router.save()
+        await self._close_retired()
+        for provider_instance in list(self._providers.values()):
+            await provider_instance.close()
+    
+    async def _close_retired(self) -> None:
+        """Değiştirilen provider'ların oturumlarını kapatır"""
+        while self._retired_providers:
+            provider_instance = self._retired_providers.pop()
+            try:
+                await provider_instance.close()
+            except Exception as e:
+                print(f"Provider kapatma hatası: {e}")
+    
+    def get_connection_stats(self) -> Dict[str, Dict]:
+        """Provider başına bağlantı yeniden kullanım istatistiklerini döndürür"""
+        return {
+            provider.value: instance.get_connection_stats()
+            for provider, instance in self._providers.items()
+        }
+    
     async def translate(self, text: str) -> TranslationResult:
-        """Metni çevirir (cache kontrolü dahil)"""
-        # Önce cache kontrol et
-        if self._cache and self._cache.is_enabled():
-            cached_translation = self._cache.get(
-                text, self._source_lang, self._target_lang
+        """Metni çevirir (cümle bazlı cache kontrolü dahil)"""
+        results = await self.translate_batch([text])
+        return results[0]
+    
+    async def translate_stream(self, text: str,
+                               on_partial: Callable[[str], None]) -> TranslationResult:
+        """Metni çevirir; çeviri parçaları geldikçe on_partial'a birikmiş metni verir
+        
+        Cache'e yalnızca tamamlanan çeviri yazılır. Provider akışı
+        desteklemiyorsa normal çeviriye düşer.
+        """
+        if not self.supports_streaming():
+            return await self.translate(text)
+        
+        cached_translation = self._cache_lookup(text)
+        if cached_translation:
+            return TranslationResult(
+                original_text=text, translated_text=cached_translation,
+                provider=self._provider, cached=True
             )
+        
+        provider = self._provider
+        source_lang, target_lang = self._source_lang, self._target_lang
+        provider_instance = await self._get_provider_instance(provider)
+        health = self._router.health(provider.value)
+        if not health.breaker.allow_request():
+            raise CircuitOpenError(f"{provider.value} art arda hata verdi, geçici olarak devre dışı")
+        
+        parts: List[str] = []
+        started = time.perf_counter()
+        try:
+            try:
+                async for chunk in provider_instance.translate_stream(text, source_lang, target_lang):
+                    parts.append(chunk)
+                    on_partial("".join(parts).strip())
+            except RateLimitedError:
+                # Akış başlamadan sınıra takıldı - bekleyip yeniden deneyen yola düş
+                health.breaker.release()
+                return await self.translate(text)
+            except asyncio.CancelledError:
+                health.record_cancel((time.perf_counter() - started) * 1000.0)
+                raise
+            except Exception as e:
+                health.record_failure(timeout=isinstance(e, asyncio.TimeoutError))
+                raise
+            health.record_success((time.perf_counter() - started) * 1000.0)
+            
+            translated_text = "".join(parts).strip()
+            self._cache_store(text, translated_text, source_lang, target_lang, provider)
+        finally:
+            # Sonuçlanmayan doğrulamayı bırak
+            self._pending_verifications.pop((text, source_lang, target_lang), None)
+        return TranslationResult(
+            original_text=text, translated_text=translated_text,
+            provider=provider, cached=False
+        )
+    
+    async def translate_batch(self, texts: List[str]) -> List[TranslationResult]:
+        """Birden fazla metni çevirir
+        
+        Her metin cümlelere ayrılır ve her cümle ayrı ayrı cache'te aranır;
+        eksik cümleler tek istekte gönderilip metinler sırasıyla yeniden
+        birleştirilir.
+        
+        Returns:
+            Girdi sırasıyla TranslationResult listesi
+        """
+        plans: List[tuple] = []  # (cümle bölümleri veya None, cümleler, cache'ten gelenler)
+        misses: List[str] = []
+        
+        for text in texts:
+            segments = self._segmenter.split(text, self._source_lang)
+            
+            # Önce metnin tamamı (tek cümlelik metinler ve eski kayıtlar)
+            cached_translation = self._cache_lookup(text, verify=len(segments) <= 1)
             if cached_translation:
-                return TranslationResult(
-                    original_text=text,
-                    translated_text=cached_translation,
-                    provider=self._provider,
-                    cached=True
-                )
-        
-        # Provider'dan çeviri al
-        provider_instance = self._providers.get(self._provider)
-        if not provider_instance:
-            # Google için API key gerekmez
-            if self._provider == TranslationProvider.GOOGLE:
-                self._providers[self._provider] = GoogleTranslateProvider("")
-                provider_instance = self._providers[self._provider]
+                plans.append((None, [text], {text: cached_translation}))
+                continue
+            
+            if len(segments) <= 1:
+                plans.append((None, [text], {}))
+                misses.append(text)
+                continue
+            
+            sentences = [segment.text for segment in segments]
+            hits = {}
+            for sentence in sentences:
+                cached_sentence = hits.get(sentence) or self._cache_lookup(sentence)
+                if cached_sentence:
+                    hits[sentence] = cached_sentence
+                else:
+                    misses.append(sentence)
+            plans.append((segments, sentences, hits))
+        
+        pending = list(dict.fromkeys(misses))  # Tekrarlanan cümleler bir kez çevrilir
+        translations: Dict[str, str] = {}
+        provider = self._provider
+        if pending:
+            provider = self._route()
+            translations = await self._fetch(
+                pending, self._source_lang, self._target_lang, provider
+            )
+        
+        results = []
+        for text, (segments, sentences, hits) in zip(texts, plans):
+            parts = [hits.get(sentence) or translations.get(sentence, ("", None))[0] for sentence in sentences]
+            # Çeviriyi gerçekte sunan provider (hedge kazandıysa yedek)
+            served = next(
+                (translations[sentence][1] for sentence in sentences
+                 if sentence not in hits and sentence in translations),
+                provider
+            )
+            if segments is None:
+                translated_text = parts[0]
             else:
-                api_key = self.get_api_key(self._provider)
-                if not api_key:
-                    raise Exception(f"{self._provider.value} için API anahtarı ayarlanmamış")
-                self._update_provider_instance(self._provider, api_key)
-                provider_instance = self._providers[self._provider]
-        
-        translated_text = await provider_instance.translate(
-            text, self._source_lang, self._target_lang
-        )
+                translated_text = self._segmenter.join(parts, segments, self._target_lang)
+            
+            results.append(TranslationResult(
+                original_text=text,
+                translated_text=translated_text,
+                provider=served,
+                cached=len(hits) == len(set(sentences))
+            ))
+        
+        return results
+    
+    async def _fetch(self, texts: List[str], source_lang: str, target_lang: str,
+                     provider: TranslationProvider) -> Dict[str, Tuple[str, TranslationProvider]]:
+        """Metinleri provider'dan çevirir (aynı anda uçuşta olan istekler paylaşılır)
+        
+        Aynı (metin, diller, provider) için devam eden bir istek varsa yeni
+        istek gönderilmez, o isteğin sonucu beklenir.
+        
+        Returns:
+            metin -> (çeviri, çeviriyi sunan provider)
+        """
+        loop = asyncio.get_running_loop()
+        owned: Dict[str, asyncio.Future] = {}
+        joined: Dict[str, asyncio.Future] = {}
+        
+        for text in texts:
+            key = (text, source_lang, target_lang, provider)
+            future = self._inflight.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._inflight[key] = future
+                owned[text] = future
+            else:
+                joined[text] = future
+                self._coalesced_count += 1
+        
+        translations: Dict[str, Tuple[str, TranslationProvider]] = {}
+        try:
+            if owned:
+                pending = list(owned)
+                translated, served = await self._request(pending, source_lang, target_lang, provider)
+                for text, translated_text in zip(pending, translated):
+                    translations[text] = (translated_text, served)
+                    self._cache_store(text, translated_text, source_lang, target_lang, served)
+                    owned[text].set_result((translated_text, served))
+        except BaseException as e:
+            # İptalde bekleyenler kendi isteklerini gönderir; provider hatası
+            # ise aynen iletilir (N bekleyen N kez başarısız istek atmasın)
+            if isinstance(e, Exception):
+                shared = e
+            else:
+                shared = _FlightAborted(str(e) or type(e).__name__)
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(shared)
+                    future.exception()  # "Exception was never retrieved" uyarısını önle
+            raise
+        finally:
+            for text, future in owned.items():
+                if not future.done():
+                    future.set_result(("", provider))
+                self._inflight.pop((text, source_lang, target_lang, provider), None)
+                # Sonuçlanmayan doğrulamaları bırak
+                self._pending_verifications.pop((text, source_lang, target_lang), None)
+        
+        for text, future in joined.items():
+            try:
+                translations[text] = await asyncio.shield(future)
+            except _FlightAborted:
+                # Asıl isteğin sahibi iptal edildi (ör. _supersede) - kendimiz dene
+                retry = await self._fetch([text], source_lang, target_lang, provider)
+                translations[text] = retry[text]
+        
+        return translations
+    
+    async def _request(self, texts: List[str], source_lang: str, target_lang: str,
+                       provider: TranslationProvider) -> Tuple[List[str], TranslationProvider]:
+        """Metinleri provider'a gönderir; hedge açıksa gecikmede yedeğe de gönderir
         
-        # Cache'e kaydet
+        İlk başarılı yanıt kazanır, diğer istek iptal edilir.
+        
+        Returns:
+            (çeviriler, yanıtı veren provider)
+        """
+        secondary = self._hedge_provider
+        if secondary is None or secondary == provider:
+            return await self._timed_batch(texts, source_lang, target_lang, provider), provider
+        
+        primary = asyncio.ensure_future(self._timed_batch(texts, source_lang, target_lang, provider))
+        tasks = {primary: provider}
+        try:
+            await asyncio.wait({primary}, timeout=self._get_hedge_delay_ms(provider) / 1000.0)
+            if not primary.done() or primary.exception() is not None:
+                # Birincil gecikti veya hata verdi - yedeği de dene
+                try:
+                    await self._get_provider_instance(secondary)
+                except Exception as e:
+                    print(f"Yedek provider kullanılamıyor: {e}")
+                else:
+                    hedge = asyncio.ensure_future(
+                        self._timed_batch(texts, source_lang, target_lang, secondary)
+                    )
+                    tasks[hedge] = secondary
+                    self._hedges_sent += 1
+            
+            waiting = set(tasks)
+            error: Optional[BaseException] = None
+            while waiting:
+                done, waiting = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                for task in done:
+                    if task.exception() is None:
+                        if tasks[task] != provider:
+                            self._hedge_wins += 1
+                        return task.result(), tasks[task]
+            raise error
+        finally:
+            # Kaybeden isteği iptal et
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _timed_batch(self, texts: List[str], source_lang: str, target_lang: str,
+                           provider: TranslationProvider) -> List[str]:
+        """Provider'ın toplu çevirisini çağırır; gecikmeyi ve sonucu kaydeder
+        
+        Devre kesicisi açık provider'a istek gönderilmez. Hız sınırı
+        yanıtlarında (429/503) Retry-After'a uyan titreşimli üstel bekleme
+        ile yeniden denenir; bekleme provider'ın tüm isteklerine uygulanır.
+        
+        Gecikme yalnızca başarılı denemenin HTTP süresidir: kendi token
+        bucket'ımızda ve Retry-After/backoff ile beklenen süre sayılmaz.
+        """
+        provider_instance = await self._get_provider_instance(provider)
+        health = self._router.health(provider.value)
+        if not health.breaker.allow_request():
+            raise CircuitOpenError(f"{provider.value} art arda hata verdi, geçici olarak devre dışı")
+        
+        attempt = 0
+        try:
+            while True:
+                attempt_started = time.perf_counter()
+                reset_request_started()
+                try:
+                    translated = await provider_instance.translate_batch(texts, source_lang, target_lang)
+                    break
+                except RateLimitedError as e:
+                    if attempt >= self.RATE_LIMIT_RETRIES:
+                        raise
+                    provider_instance.pause(backoff_delay(attempt, e.retry_after))
+                    attempt += 1
+        except asyncio.CancelledError:
+            sent = request_started_at()
+            if sent is None:
+                # Hız sınırı beklenirken iptal edildi - istek gönderilmedi
+                health.breaker.release()
+            else:
+                # İptal edilen istek en az bu kadar sürdü (p90'ı aşağı çekmesin)
+                health.record_cancel((time.perf_counter() - sent) * 1000.0)
+            raise
+        except Exception as e:
+            health.record_failure(timeout=isinstance(e, asyncio.TimeoutError))
+            raise
+        # Oturum kullanmayan provider'larda deneme başlangıcı esas alınır
+        sent = request_started_at() or attempt_started
+        health.record_success((time.perf_counter() - sent) * 1000.0)
+        return translated
+    
+    def _get_hedge_delay_ms(self, provider: TranslationProvider) -> float:
+        """Yedek isteğin gönderilmeden önce beklenecek süre (ms)"""
+        if self._hedge_delay_ms > 0:
+            return self._hedge_delay_ms
+        health = self._router.health(provider.value)
+        if len(health.latencies) < self.HEDGE_MIN_SAMPLES:
+            return self.HEDGE_DEFAULT_DELAY_MS
+        return health.percentile(self.HEDGE_PERCENTILE)
+    
+    def get_inflight_stats(self) -> Dict[str, int]:
+        """Uçuştaki ve birleştirilen istek sayılarını döndürür"""
+        return {
+            "inflight": len(self._inflight),
+            "coalesced": self._coalesced_count
+        }
+    
+    def _cache_lookup(self, text: str, verify: bool = True) -> Optional[str]:
+        """Cache'teki çeviriyi döndürür (cache kapalıysa None)
+        
+        verify açıksa benzerlik eşleşmelerinin bir kısmı ıska sayılıp
+        gerçek çeviriyle karşılaştırılır.
+        """
+        if not (self._cache and self._cache.is_enabled()):
+            return None
+        
+        match = self._cache.get_match(text, self._source_lang, self._target_lang)
+        if match is None:
+            return None
+        
+        translated_text, kind = match
+        if verify and kind == CacheManager.MATCH_SIMILAR and self._cache.should_verify():
+            # Yanlış eşleşme oranını ölçmek için bu örneği gerçekten çevir
+            self._pending_verifications[(text, self._source_lang, self._target_lang)] = translated_text
+            return None
+        return translated_text
+    
+    def _cache_store(self, text: str, translated_text: str, source_lang: str,
+                     target_lang: str, provider: TranslationProvider) -> None:
+        """Çeviriyi cache'e kaydeder"""
         if self._cache and self._cache.is_enabled():
+            cached_translation = self._pending_verifications.pop(
+                (text, source_lang, target_lang), None
+            )
+            if cached_translation is not None:
+                self._cache.record_verification(cached_translation, translated_text)
             self._cache.set(
                 text, translated_text,
-                self._source_lang, self._target_lang,
-                self._provider.value
+                source_lang, target_lang,
+                provider.value
             )
+    
+    async def _get_provider_instance(self, provider: TranslationProvider) -> TranslationProviderBase:
+        """Provider instance'ını döndürür (gerekirse oluşturur)"""
+        await self._close_retired()
+        provider_instance = self._providers.get(provider)
+        if provider_instance:
+            return provider_instance
         
-        return TranslationResult(
-            original_text=text,
-            translated_text=translated_text,
-            provider=self._provider,
-            cached=False
-        )
+        # Google için API key gerekmez
+        if provider == TranslationProvider.GOOGLE:
+            self._providers[provider] = GoogleTranslateProvider("")
+            self._apply_rate_limit(provider)
+        else:
+            api_key = self.get_api_key(provider)
+            if not api_key:
+                raise Exception(f"{provider.value} için API anahtarı ayarlanmamış")
+            self._update_provider_instance(provider, api_key)
+        return self._providers[provider]
     
     def get_supported_languages(self, provider: Optional[TranslationProvider] = None) -> List[str]:
         """Desteklenen dilleri döndürür"""
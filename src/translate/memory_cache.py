@@ -0,0 +1,104 @@
+"""
+Memory Cache for ChwiliTranslate
+SQLite önbelleğinin önündeki süreç içi LRU katmanı
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+import threading
+
+
+class LRUCache:
+    """Giriş sayısı ve bayt ile sınırlı, thread-safe LRU önbellek
+
+    Sınırlardan biri aşıldığında en uzun süredir kullanılmayan girişler atılır.
+    """
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 4 * 1024 * 1024):
+        """LRU önbelleği başlatır"""
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max(1, max_bytes)
+        self._items: "OrderedDict[Hashable, tuple]" = OrderedDict()  # anahtar -> (değer, boyut)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _sizeof(key: Hashable, value: str) -> int:
+        """Girişin yaklaşık boyutu (metin alanlarının UTF-8 uzunluğu)"""
+        parts = key if isinstance(key, tuple) else (key,)
+        size = len(value.encode("utf-8"))
+        for part in parts:
+            if isinstance(part, str):
+                size += len(part.encode("utf-8"))
+        return size
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Değeri döndürür ve girişi en yeni konuma taşır"""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._hits += 1
+            return item[0]
+
+    def put(self, key: Hashable, value: str) -> None:
+        """Girişi ekler/günceller ve sınırları korur"""
+        size = self._sizeof(key, value)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self._max_bytes:
+                return  # Tek başına sınırı aşan giriş saklanmaz
+
+            self._items[key] = (value, size)
+            self._bytes += size
+
+            while len(self._items) > self._max_entries or self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Girişi siler"""
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self) -> None:
+        """Tüm girişleri siler"""
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def set_limits(self, max_entries: int, max_bytes: int) -> None:
+        """Sınırları değiştirir (gerekirse hemen girişleri atar)"""
+        with self._lock:
+            self._max_entries = max(1, max_entries)
+            self._max_bytes = max(1, max_bytes)
+            while self._items and (len(self._items) > self._max_entries or self._bytes > self._max_bytes):
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_stats(self) -> Dict:
+        """İsabet/ıska/atma sayılarını ve doluluk bilgisini döndürür"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes
+            }
@@ -4,11 +4,30 @@ Translation Providers for ChwiliTranslate
 """
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, AsyncIterator
 from enum import Enum
 import aiohttp
+import asyncio
 import json
+import time
+
+from .rate_limit import TokenBucket, RateLimitedError, parse_retry_after
+
+
+# Görevdeki son HTTP isteğinin hız sınırı beklemesinden sonraki başlangıcı (perf_counter)
+_request_started: ContextVar[Optional[float]] = ContextVar("_request_started", default=None)
+
+
+def request_started_at() -> Optional[float]:
+    """Çalışan görevin son isteğinin gönderilme anını döndürür (istek yoksa None)"""
+    return _request_started.get()
+
+
+def reset_request_started() -> None:
+    """Çalışan görevin istek başlangıcını temizler (yeni deneme öncesi)"""
+    _request_started.set(None)
 
 
 class TranslationProvider(Enum):
@@ -38,16 +57,166 @@ class TranslationResult:
 
 
 class TranslationProviderBase(ABC):
-    """Çeviri sağlayıcı temel sınıfı"""
+    """Çeviri sağlayıcı temel sınıfı
+    
+    Her sağlayıcı keep-alive bağlantılı tek bir uzun ömürlü HTTP oturumu
+    tutar; oturum open()/close() ile açılıp kapatılır (yoksa ilk istekte açılır).
+    Her HTTP isteği önce sağlayıcının token bucket'ından hak bekler.
+    """
+    
+    # HTTP bağlantı havuzu ayarları
+    CONNECTION_LIMIT_PER_HOST = 4  # Aynı sunucuya eşzamanlı bağlantı sınırı
+    KEEPALIVE_TIMEOUT = 60.0  # Boştaki bağlantının açık tutulma süresi (sn)
+    DNS_CACHE_TTL = 300  # DNS çözümleme önbelleği (sn)
+    REQUEST_TIMEOUT = 15.0  # İstek başına toplam zaman aşımı (sn)
+    
+    # Hız sınırı (saniyedeki istek, ani istek sınırı)
+    RATE_PER_SECOND = 5.0
+    RATE_BURST = 5
+    
+    SUPPORTS_STREAMING = False  # translate_stream() gerçekten parça parça mı döndürür
     
     def __init__(self, api_key: str):
         self.api_key = api_key
+        self._limiter = TokenBucket(self.RATE_PER_SECOND, self.RATE_BURST)
+        self._rate_limited_count = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+        self._request_count = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+    
+    async def open(self) -> None:
+        """Kalıcı HTTP oturumunu açar (çalışan event loop'a bağlanır)"""
+        if self._session and not self._session.closed:
+            return
+        
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=self.DNS_CACHE_TTL
+        )
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            trace_configs=[trace_config]
+        )
+        self._session_loop = asyncio.get_running_loop()
+    
+    async def close(self) -> None:
+        """HTTP oturumunu ve havuzdaki bağlantıları kapatır"""
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session and not session.closed:
+            await session.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """İstek hakkını bekler ve açık oturumu döndürür (gerekirse yeniden açar)"""
+        await self._limiter.acquire()
+        if self._session_loop is not asyncio.get_running_loop():
+            # Eski loop kapandıysa oturumu kullanılamaz - yenisini aç
+            self._session = None
+        await self.open()
+        self._request_count += 1
+        # Gecikme ölçümü bekleme sonrasından başlar (kuyruk süresi provider'ı yavaş göstermesin)
+        _request_started.set(time.perf_counter())
+        return self._session
+    
+    def set_rate_limit(self, rate: float, burst: Optional[int] = None) -> None:
+        """Saniyedeki istek sınırını ayarlar (0 = sınırsız)"""
+        self._limiter.configure(rate, burst if burst is not None else max(1, int(rate)))
+    
+    def pause(self, seconds: float) -> None:
+        """Sonraki istekleri seconds boyunca bekletir (Retry-After / backoff)"""
+        self._limiter.block_for(seconds)
+    
+    def is_rate_limited(self) -> bool:
+        """Yeni bir istek şu an hız sınırı nedeniyle bekler mi"""
+        return self._limiter.is_throttled()
+    
+    def _check_rate_limit(self, response: aiohttp.ClientResponse, name: str) -> None:
+        """429/503 yanıtını Retry-After bilgisiyle RateLimitedError'a çevirir"""
+        if response.status in (429, 503):
+            self._rate_limited_count += 1
+            raise RateLimitedError(
+                f"{name} hız sınırı: {response.status}",
+                parse_retry_after(response.headers.get("Retry-After"))
+            )
+    
+    async def _on_connection_created(self, session, context, params) -> None:
+        self._connections_created += 1
+    
+    async def _on_connection_reused(self, session, context, params) -> None:
+        self._connections_reused += 1
+    
+    def get_connection_stats(self) -> Dict:
+        """İstek ve bağlantı yeniden kullanım sayılarını döndürür"""
+        connections = self._connections_created + self._connections_reused
+        return {
+            "requests": self._request_count,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_ratio": self._connections_reused / connections if connections else 0.0,
+            "rate_limited": self._rate_limited_count,
+            "limiter": self._limiter.get_stats()
+        }
     
     @abstractmethod
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Metni çevirir"""
         pass
     
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Birden fazla metni aynı sırayla çevirir (varsayılan: tek tek)"""
+        return [await self.translate(text, source_lang, target_lang) for text in texts]
+    
+    async def translate_stream(self, text: str, source_lang: str, target_lang: str) -> AsyncIterator[str]:
+        """Çeviriyi geldikçe parça parça döndürür (varsayılan: tek parça)"""
+        yield await self.translate(text, source_lang, target_lang)
+    
+    @staticmethod
+    async def _iter_sse(response: aiohttp.ClientResponse) -> AsyncIterator[str]:
+        """SSE yanıtındaki "data:" yüklerini geldikçe döndürür"""
+        async for line in response.content:
+            line = line.strip()
+            if line.startswith(b"data:"):
+                yield line[5:].strip().decode("utf-8")
+    
+    @staticmethod
+    def _build_prompt(text: str, source_lang: str, target_lang: str) -> str:
+        """LLM sağlayıcıları için tek metin istemi oluşturur"""
+        return f"Translate the following text from {source_lang} to {target_lang}. Only return the translation, nothing else:\n\n{text}"
+    
+    @staticmethod
+    def _build_batch_prompt(texts: List[str], source_lang: str, target_lang: str) -> str:
+        """LLM sağlayıcıları için JSON dizisi istemi oluşturur"""
+        return (
+            f"Translate each string in the following JSON array from {source_lang} to {target_lang}. "
+            f"Return only a JSON array of exactly {len(texts)} translated strings in the same order, nothing else:\n\n"
+            f"{json.dumps(texts, ensure_ascii=False)}"
+        )
+    
+    @staticmethod
+    def _parse_batch_response(content: str, count: int) -> Optional[List[str]]:
+        """LLM yanıtındaki JSON dizisini ayrıştırır; biçim bozuksa None döndürür"""
+        start = content.find("[")
+        end = content.rfind("]")
+        if start < 0 or end < start:
+            return None
+        try:
+            items = json.loads(content[start:end + 1])
+        except ValueError:
+            return None
+        if not isinstance(items, list) or len(items) != count:
+            return None
+        if not all(isinstance(item, str) for item in items):
+            return None
+        return [item.strip() for item in items]
+    
     @abstractmethod
     def validate_api_key(self, api_key: str) -> bool:
         """API anahtarını doğrular"""
@@ -63,30 +232,76 @@ class ChatGPTProvider(TranslationProviderBase):
     """OpenAI ChatGPT çeviri sağlayıcısı"""
     
     API_URL = "https://api.openai.com/v1/chat/completions"
+    RATE_PER_SECOND = 1.0
+    RATE_BURST = 3
+    SUPPORTS_STREAMING = True
     
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """ChatGPT ile çeviri yapar"""
-        headers = {
+        return await self._complete(self._build_prompt(text, source_lang, target_lang))
+    
+    async def translate_stream(self, text: str, source_lang: str, target_lang: str) -> AsyncIterator[str]:
+        """ChatGPT yanıtını SSE ile token token döndürür"""
+        payload = self._payload(self._build_prompt(text, source_lang, target_lang))
+        payload["stream"] = True
+        
+        session = await self._get_session()
+        async with session.post(self.API_URL, headers=self._headers(), json=payload) as response:
+            self._check_rate_limit(response, "ChatGPT API")
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"ChatGPT API hatası: {response.status} - {error_text}")
+            
+            async for data in self._iter_sse(response):
+                if data == "[DONE]":
+                    break
+                try:
+                    choices = json.loads(data).get("choices") or []
+                except ValueError:
+                    continue
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if delta:
+                    yield delta
+    
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Tüm metinleri tek bir JSON dizisi istemiyle çevirir"""
+        if len(texts) <= 1:
+            return await super().translate_batch(texts, source_lang, target_lang)
+        
+        content = await self._complete(self._build_batch_prompt(texts, source_lang, target_lang))
+        translations = self._parse_batch_response(content, len(texts))
+        if translations is None:
+            # Model diziyi bozduysa tek tek çevir
+            return await super().translate_batch(texts, source_lang, target_lang)
+        return translations
+    
+    def _headers(self) -> Dict[str, str]:
+        """İstek başlıkları"""
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
-        
-        prompt = f"Translate the following text from {source_lang} to {target_lang}. Only return the translation, nothing else:\n\n{text}"
-        
-        payload = {
+    
+    @staticmethod
+    def _payload(prompt: str) -> Dict:
+        """Chat completions istek gövdesi"""
+        return {
             "model": "gpt-3.5-turbo",
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.3
         }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.API_URL, headers=headers, json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"ChatGPT API hatası: {response.status} - {error_text}")
-                
-                data = await response.json()
-                return data["choices"][0]["message"]["content"].strip()
+    
+    async def _complete(self, prompt: str) -> str:
+        """İstemi gönderir ve yanıt metnini döndürür"""
+        session = await self._get_session()
+        async with session.post(self.API_URL, headers=self._headers(), json=self._payload(prompt)) as response:
+            self._check_rate_limit(response, "ChatGPT API")
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"ChatGPT API hatası: {response.status} - {error_text}")
+            
+            data = await response.json()
+            return data["choices"][0]["message"]["content"].strip()
     
     def validate_api_key(self, api_key: str) -> bool:
         """API anahtarını doğrular"""
@@ -100,25 +315,68 @@ class GeminiProvider(TranslationProviderBase):
     """Google Gemini çeviri sağlayıcısı"""
     
     API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent"
+    STREAM_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:streamGenerateContent"
+    RATE_PER_SECOND = 1.0
+    RATE_BURST = 2
+    SUPPORTS_STREAMING = True
     
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Gemini ile çeviri yapar"""
-        url = f"{self.API_URL}?key={self.api_key}"
+        return await self._generate(self._build_prompt(text, source_lang, target_lang))
+    
+    async def translate_stream(self, text: str, source_lang: str, target_lang: str) -> AsyncIterator[str]:
+        """Gemini yanıtını streamGenerateContent (SSE) ile parça parça döndürür"""
+        url = f"{self.STREAM_URL}?alt=sse&key={self.api_key}"
+        payload = {
+            "contents": [{"parts": [{"text": self._build_prompt(text, source_lang, target_lang)}]}]
+        }
+        
+        session = await self._get_session()
+        async with session.post(url, json=payload) as response:
+            self._check_rate_limit(response, "Gemini API")
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Gemini API hatası: {response.status} - {error_text}")
+            
+            async for data in self._iter_sse(response):
+                try:
+                    candidates = json.loads(data).get("candidates") or []
+                except ValueError:
+                    continue
+                parts = candidates[0].get("content", {}).get("parts", []) if candidates else []
+                chunk = "".join(part.get("text", "") for part in parts)
+                if chunk:
+                    yield chunk
+    
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Tüm metinleri tek bir JSON dizisi istemiyle çevirir"""
+        if len(texts) <= 1:
+            return await super().translate_batch(texts, source_lang, target_lang)
         
-        prompt = f"Translate the following text from {source_lang} to {target_lang}. Only return the translation, nothing else:\n\n{text}"
+        content = await self._generate(self._build_batch_prompt(texts, source_lang, target_lang))
+        translations = self._parse_batch_response(content, len(texts))
+        if translations is None:
+            # Model diziyi bozduysa tek tek çevir
+            return await super().translate_batch(texts, source_lang, target_lang)
+        return translations
+    
+    async def _generate(self, prompt: str) -> str:
+        """İstemi gönderir ve yanıt metnini döndürür"""
+        url = f"{self.API_URL}?key={self.api_key}"
         
         payload = {
             "contents": [{"parts": [{"text": prompt}]}]
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Gemini API hatası: {response.status} - {error_text}")
-                
-                data = await response.json()
-                return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+        session = await self._get_session()
+        async with session.post(url, json=payload) as response:
+            self._check_rate_limit(response, "Gemini API")
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Gemini API hatası: {response.status} - {error_text}")
+            
+            data = await response.json()
+            return data["candidates"][0]["content"]["parts"][0]["text"].strip()
     
     def validate_api_key(self, api_key: str) -> bool:
         return api_key and len(api_key) > 20
@@ -130,6 +388,10 @@ class GeminiProvider(TranslationProviderBase):
 class GoogleTranslateProvider(TranslationProviderBase):
     """Google Translate çeviri sağlayıcısı (Ücretsiz)"""
     
+    # Ücretsiz Google Translate API
+    API_URL = "https://translate.googleapis.com/translate_a/single"
+    BATCH_URL = "https://translate.googleapis.com/translate_a/t"  # Çoklu "q" parametresi kabul eder
+    
     def __init__(self, api_key: str = ""):
         super().__init__(api_key)
     
@@ -137,8 +399,6 @@ class GoogleTranslateProvider(TranslationProviderBase):
         """Google Translate ile çeviri yapar (ücretsiz API)"""
         import urllib.parse
         
-        # Ücretsiz Google Translate API
-        url = "https://translate.googleapis.com/translate_a/single"
         params = {
             "client": "gtx",
             "sl": source_lang,
@@ -147,22 +407,50 @@ class GoogleTranslateProvider(TranslationProviderBase):
             "q": text
         }
         
-        full_url = f"{url}?{urllib.parse.urlencode(params)}"
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(full_url) as response:
-                if response.status != 200:
-                    raise Exception(f"Google Translate hatası: {response.status}")
-                
-                data = await response.json()
-                # Sonuçları birleştir
-                translated_parts = []
-                if data and data[0]:
-                    for part in data[0]:
-                        if part[0]:
-                            translated_parts.append(part[0])
-                
-                return "".join(translated_parts)
+        full_url = f"{self.API_URL}?{urllib.parse.urlencode(params)}"
+        
+        session = await self._get_session()
+        async with session.get(full_url) as response:
+            self._check_rate_limit(response, "Google Translate")
+            if response.status != 200:
+                raise Exception(f"Google Translate hatası: {response.status}")
+            
+            data = await response.json()
+            # Sonuçları birleştir
+            translated_parts = []
+            if data and data[0]:
+                for part in data[0]:
+                    if part[0]:
+                        translated_parts.append(part[0])
+            
+            return "".join(translated_parts)
+    
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Tüm metinleri tek istekte (tekrarlı "q" parametreleri) çevirir"""
+        if len(texts) <= 1:
+            return await super().translate_batch(texts, source_lang, target_lang)
+        
+        params = [("client", "gtx"), ("sl", source_lang), ("tl", target_lang)]
+        params.extend(("q", text) for text in texts)
+        
+        session = await self._get_session()
+        async with session.get(self.BATCH_URL, params=params) as response:
+            self._check_rate_limit(response, "Google Translate")
+            if response.status != 200:
+                raise Exception(f"Google Translate hatası: {response.status}")
+            
+            data = await response.json()
+        
+        # Her öğe ya çeviri ya da [çeviri, algılanan dil] olabilir
+        translations = []
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, list):
+                item = item[0] if item else ""
+            translations.append(item if isinstance(item, str) else "")
+        
+        if len(translations) != len(texts):
+            raise Exception(f"Google Translate hatası: {len(texts)} metin için {len(translations)} çeviri döndü")
+        return translations
     
     def validate_api_key(self, api_key: str) -> bool:
         return True  # Ücretsiz, API key gerekmez
@@ -175,6 +463,8 @@ class DeepLProvider(TranslationProviderBase):
     """DeepL çeviri sağlayıcısı"""
     
     API_URL = "https://api-free.deepl.com/v2/translate"
+    RATE_PER_SECOND = 2.0
+    RATE_BURST = 2
     
     # DeepL dil kodları eşlemesi
     LANG_MAP = {
@@ -229,15 +519,43 @@ class DeepLProvider(TranslationProviderBase):
             "target_lang": self.LANG_MAP.get(target_lang, target_lang.upper())
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.API_URL, headers=headers, data=data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"DeepL API hatası: {response.status} - {error_text}")
-                
-                result = await response.json()
-                translated = result["translations"][0]["text"]
-                return self._fix_punctuation(text, translated)
+        session = await self._get_session()
+        async with session.post(self.API_URL, headers=headers, data=data) as response:
+            self._check_rate_limit(response, "DeepL API")
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"DeepL API hatası: {response.status} - {error_text}")
+            
+            result = await response.json()
+            translated = result["translations"][0]["text"]
+            return self._fix_punctuation(text, translated)
+    
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Tüm metinleri tek istekte (tekrarlı "text" alanları) çevirir"""
+        if not texts:
+            return []
+        
+        headers = {
+            "Authorization": f"DeepL-Auth-Key {self.api_key}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        
+        data = [("text", text) for text in texts]
+        data.append(("source_lang", self.LANG_MAP.get(source_lang, source_lang.upper())))
+        data.append(("target_lang", self.LANG_MAP.get(target_lang, target_lang.upper())))
+        
+        session = await self._get_session()
+        async with session.post(self.API_URL, headers=headers, data=data) as response:
+            self._check_rate_limit(response, "DeepL API")
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"DeepL API hatası: {response.status} - {error_text}")
+            
+            result = await response.json()
+            translations = [item["text"] for item in result["translations"]]
+            if len(translations) != len(texts):
+                raise Exception(f"DeepL API hatası: {len(texts)} metin için {len(translations)} çeviri döndü")
+            return [self._fix_punctuation(text, translated) for text, translated in zip(texts, translations)]
     
     def validate_api_key(self, api_key: str) -> bool:
         return api_key and len(api_key) > 20
@@ -0,0 +1,119 @@
+"""
+Rate Limiting for ChwiliTranslate
+Provider başına token bucket, Retry-After ayrıştırma ve titreşimli üstel geri çekilme
+"""
+
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+import asyncio
+import random
+import time
+
+
+class RateLimitedError(Exception):
+    """Provider isteği hız sınırı nedeniyle reddetti (429/503)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # Sunucunun istediği bekleme (sn), yoksa None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After başlığını saniyeye çevirir (saniye veya HTTP tarihi)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None,
+                  base: float = 0.5, cap: float = 30.0) -> float:
+    """Titreşimli üstel bekleme süresi (sn); sunucu Retry-After verdiyse en az o kadar"""
+    delay = min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+class TokenBucket:
+    """Saniyede rate istek, en fazla burst ani istek izni veren token bucket
+
+    Her acquire() sıradaki boş zamanı eşzamanlı olarak ayırır, böylece
+    bekleyenler geliş sırasıyla (FIFO) ve kilit olmadan sıralanır.
+    rate <= 0 sınırı kapatır.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Token bucket'ı başlatır"""
+        self._tat = 0.0  # Teorik sonraki boş zaman
+        self._blocked_until = 0.0  # Retry-After/backoff ile verilen ara
+        self._waits = 0
+        self._wait_ms = 0.0
+        self.configure(rate, burst)
+
+    def configure(self, rate: float, burst: int = 1) -> None:
+        """Hızı ve ani istek sınırını değiştirir"""
+        self._rate = rate
+        self._burst = max(1, int(burst))
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._tolerance = (self._burst - 1) * self._interval
+
+    def get_rate(self) -> float:
+        """Saniyedeki istek sınırını döndürür (0 = sınırsız)"""
+        return max(0.0, self._rate)
+
+    def reserve(self) -> float:
+        """Bir istek hakkı ayırır ve beklenmesi gereken süreyi (sn) döndürür"""
+        now = time.monotonic()
+        start = max(now, self._blocked_until)
+        if self._interval > 0:
+            start = max(start, self._tat - self._tolerance)
+            self._tat = max(self._tat, start) + self._interval
+        return start - now
+
+    async def acquire(self) -> None:
+        """İstek hakkı gelene kadar bekler"""
+        wait = self.reserve()
+        if wait <= 0:
+            return
+        self._waits += 1
+        self._wait_ms += wait * 1000.0
+        reserved_tat = self._tat
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Son ayrılan hak kullanılmadıysa geri ver
+            if self._interval > 0 and self._tat == reserved_tat:
+                self._tat -= self._interval
+            raise
+
+    def block_for(self, seconds: float) -> None:
+        """Sonraki istekleri en az seconds boyunca bekletir"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + max(0.0, seconds))
+
+    def is_throttled(self) -> bool:
+        """Şu an gelen bir istek beklemek zorunda mı"""
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return True
+        return self._interval > 0 and now < self._tat - self._tolerance
+
+    def get_stats(self) -> Dict:
+        """Bekleme sayısı ve toplam bekleme süresini döndürür"""
+        return {
+            "rate": self.get_rate(),
+            "burst": self._burst,
+            "waits": self._waits,
+            "wait_ms": self._wait_ms
+        }
@@ -0,0 +1,225 @@
+"""
+Provider Routing for ChwiliTranslate
+Provider başına gecikme/hata istatistikleri, devre kesici ve en hızlı sağlıklı provider seçimi
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Optional
+import json
+import os
+import time
+
+
+class CircuitOpenError(Exception):
+    """Provider'ın devre kesicisi açık - istek gönderilmedi"""
+    pass
+
+
+class CircuitBreaker:
+    """Ardışık hatalarda açılan, bekleme sonrası yarı açık deneme yapan devre kesici
+
+    closed: istekler serbest. open: istekler hemen reddedilir.
+    half_open: tek bir deneme isteğine izin verilir; başarılıysa kapanır,
+    başarısızsa yeniden açılır.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """Devre kesiciyi başlatır"""
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0  # Ardışık hata sayısı
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._trips = 0
+
+    def get_state(self) -> str:
+        """Güncel durumu döndürür (bekleme dolduysa yarı açık)"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def is_available(self) -> bool:
+        """İstek gönderilebilir mi (durumu değiştirmez)"""
+        state = self.get_state()
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self._probe_in_flight)
+
+    def allow_request(self) -> bool:
+        """İstek için izin ister; yarı açıkta deneme hakkını alır"""
+        state = self.get_state()
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Başarılı yanıt - devreyi kapatır"""
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self, timeout: bool = False) -> None:
+        """Hata kaydeder - eşik aşılırsa, deneme başarısızsa veya zaman aşımında açar
+
+        Zaman aşımı devreyi hemen açar: ölü bir uç nokta yalnızca bir kez beklenir.
+        """
+        self._failures += 1
+        if timeout or self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state != self.OPEN:
+                self._trips += 1
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Sonuçsuz biten (iptal edilen) isteğin deneme hakkını bırakır"""
+        self._probe_in_flight = False
+
+    def get_stats(self) -> Dict:
+        """Durum, ardışık hata ve açılma sayılarını döndürür"""
+        return {
+            "state": self.get_state(),
+            "consecutive_failures": self._failures,
+            "trips": self._trips
+        }
+
+
+class ProviderHealth:
+    """Bir provider'ın kayan gecikme/hata penceresi ve devre kesicisi"""
+
+    def __init__(self, window: int = 100, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """Sağlık kaydını başlatır"""
+        self.latencies: deque = deque(maxlen=window)  # Son gecikmeler (ms)
+        self.outcomes: deque = deque(maxlen=window)  # Son istek sonuçları (True = başarılı)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+    def record_success(self, latency_ms: float) -> None:
+        """Başarılı isteği kaydeder"""
+        self.latencies.append(latency_ms)
+        self.outcomes.append(True)
+        self.breaker.record_success()
+
+    def record_failure(self, timeout: bool = False) -> None:
+        """Başarısız isteği kaydeder"""
+        self.outcomes.append(False)
+        self.breaker.record_failure(timeout)
+
+    def record_cancel(self, latency_ms: float) -> None:
+        """İptal edilen isteği kaydeder (en az bu kadar sürdü, hata sayılmaz)"""
+        self.latencies.append(latency_ms)
+        self.breaker.release()
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Gecikme yüzdeliğini döndürür (ölçüm yoksa None)"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def error_rate(self) -> float:
+        """Penceredeki hata oranı"""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def to_dict(self) -> Dict:
+        """Kalıcı saklama için sözlüğe çevirir"""
+        return {"latencies": list(self.latencies), "outcomes": list(self.outcomes)}
+
+    def load_dict(self, data: Dict) -> None:
+        """Kaydedilmiş pencereleri yükler"""
+        self.latencies.extend(float(value) for value in data.get("latencies", []))
+        self.outcomes.extend(bool(value) for value in data.get("outcomes", []))
+
+
+class ProviderRouter:
+    """İstekleri en hızlı sağlıklı provider'a yönlendirir
+
+    Provider'lar medyan gecikmelerine göre sıralanır; yeterli ölçümü
+    olmayanlar önce denenir ki istatistikleri oluşsun. Devre kesicisi
+    açık olanlar atlanır.
+    """
+
+    MIN_SAMPLES = 3  # Sıralamaya girmek için gereken ölçüm sayısı
+
+    def __init__(self, stats_path: Optional[str] = None, window: int = 100,
+                 failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """Router'ı başlatır (stats_path varsa kayıtlı istatistikleri yükler)"""
+        self._stats_path = stats_path
+        self._window = window
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._health: Dict[str, ProviderHealth] = {}
+        if stats_path:
+            self.load()
+
+    def health(self, provider: str) -> ProviderHealth:
+        """Provider'ın sağlık kaydını döndürür (yoksa oluşturur)"""
+        health = self._health.get(provider)
+        if health is None:
+            health = self._health[provider] = ProviderHealth(
+                self._window, self._failure_threshold, self._reset_timeout
+            )
+        return health
+
+    def choose(self, candidates: Iterable[str], preferred: str) -> Optional[str]:
+        """Adaylar arasından en hızlı sağlıklı provider'ı seçer
+
+        Eşitlikte tercih edilen provider öne geçer; hiçbiri kullanılamıyorsa None.
+        """
+        best = None
+        best_key = None
+        for provider in candidates:
+            health = self.health(provider)
+            if not health.breaker.is_available():
+                continue
+            if len(health.latencies) < self.MIN_SAMPLES:
+                median = 0.0  # Ölçülmemiş provider'ı dene
+            else:
+                median = health.percentile(0.5)
+            key = (median, provider != preferred)
+            if best_key is None or key < best_key:
+                best, best_key = provider, key
+        return best
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Provider başına gecikme, hata oranı ve devre durumunu döndürür"""
+        return {
+            provider: {
+                "samples": len(health.latencies),
+                "p50_ms": health.percentile(0.5),
+                "p90_ms": health.percentile(0.9),
+                "error_rate": health.error_rate(),
+                **health.breaker.get_stats()
+            }
+            for provider, health in self._health.items()
+        }
+
+    def load(self) -> None:
+        """İstatistikleri dosyadan yükler (dosya yoksa veya bozuksa sessizce geçer)"""
+        if not self._stats_path or not os.path.exists(self._stats_path):
+            return
+        try:
+            with open(self._stats_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for provider, entry in data.items():
+                self.health(provider).load_dict(entry)
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            print(f"Provider istatistikleri yüklenemedi: {e}")
+
+    def save(self) -> None:
+        """İstatistikleri dosyaya yazar"""
+        if not self._stats_path:
+            return
+        try:
+            with open(self._stats_path, "w", encoding="utf-8") as f:
+                json.dump({p: h.to_dict() for p, h in self._health.items()}, f)
+        except OSError as e:
+            print(f"Provider istatistikleri kaydedilemedi: {e}")
@@ -0,0 +1,148 @@
+"""
+Sentence Segmenter for ChwiliTranslate
+Metni cümlelere ayırma (cümle bazlı cache için)
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class Segment:
+    """Tek bir cümle ve ardından gelen ayraç"""
+    text: str
+    separator: str = ""  # Cümleden sonraki boşluk/satır sonu
+
+
+class SentenceSegmenter:
+    """Dile duyarlı kural tabanlı cümle ayırıcı
+
+    CJK sonlandırıcıları (。！？) boşluk beklemeden cümleyi bitirir.
+    Latin sonlandırıcıları (. ! ? …) ancak ardından boşluk geliyorsa bitirir;
+    kısaltmalar, tek harfli baş harfler ve küçük harfle devam eden üç
+    noktalar cümleyi bölmez. Satır sonları her zaman cümle sınırıdır.
+    """
+
+    CJK_TERMINATORS = "。！？．"
+    TERMINATORS = ".!?…"
+    CLOSERS = "\"'”’)]}」』）】》"
+    CJK_LANGUAGES = ("ja", "zh")  # Cümleler arasında boşluk kullanılmayan diller
+
+    # Dil bazlı yaygın kısaltmalar (nokta cümleyi bitirmez)
+    ABBREVIATIONS = {
+        "en": {"mr", "mrs", "ms", "dr", "prof", "st", "vs", "etc", "e.g", "i.e", "jr", "sr", "vol"},
+        "tr": {"dr", "prof", "doç", "vb", "vs", "sn", "bkz", "örn", "yy"},
+        "de": {"dr", "prof", "bzw", "z.b", "usw", "ca", "nr", "hr", "fr", "str"},
+        "fr": {"m", "mme", "mlle", "dr", "etc", "p.ex", "cf"},
+        "es": {"sr", "sra", "srta", "dr", "etc", "pág"},
+        "it": {"sig", "sig.ra", "dott", "ecc", "pag"},
+        "pt": {"sr", "sra", "dr", "etc", "pág"},
+        "ru": {"т.е", "т.д", "т.п", "г", "им", "ул"}
+    }
+
+    def split(self, text: str, lang: str = "en") -> List[Segment]:
+        """Metni sırasıyla cümlelere ayırır
+
+        Segment metinleri ve ayraçları art arda eklendiğinde baştaki ve
+        sondaki boşluklar hariç orijinal metin elde edilir.
+        """
+        text = text.strip()
+        abbreviations = self.ABBREVIATIONS.get(lang, set())
+        segments: List[Segment] = []
+        length = len(text)
+        start = 0
+        i = 0
+
+        while i < length:
+            char = text[i]
+
+            if char == "\n":
+                end, i = i, self._skip_space(text, i)
+                self._append(segments, text[start:end], text[end:i])
+                start = i
+                continue
+
+            if char in self.CJK_TERMINATORS:
+                end = self._skip_closers(text, self._skip_run(text, i, self.CJK_TERMINATORS + self.TERMINATORS))
+                i = self._skip_space(text, end)
+                self._append(segments, text[start:end], text[end:i])
+                start = i
+                continue
+
+            if char in self.TERMINATORS:
+                run_end = self._skip_run(text, i, self.TERMINATORS)
+                end = self._skip_closers(text, run_end)
+                next_start = self._skip_space(text, end)
+
+                if end < length and next_start == end:
+                    # Ardından boşluk yok (3.14, e.g., URL) - cümle devam ediyor
+                    i = end
+                    continue
+
+                run = text[i:run_end]
+                if run == "." and self._is_abbreviation(text[start:i], abbreviations):
+                    i = end
+                    continue
+                if ("…" in run or ".." in run) and next_start < length and text[next_start].islower():
+                    # Cümle ortası üç nokta ("Well... maybe")
+                    i = end
+                    continue
+
+                self._append(segments, text[start:end], text[end:next_start])
+                start = i = next_start
+                continue
+
+            i += 1
+
+        if start < length:
+            self._append(segments, text[start:], "")
+        return segments
+
+    def join(self, sentences: List[str], segments: List[Segment], target_lang: str = "en") -> str:
+        """Çevrilmiş cümleleri orijinal ayraçlarla birleştirir"""
+        parts = []
+        for sentence, segment in zip(sentences, segments):
+            parts.append(sentence)
+            parts.append(self._separator(segment.separator, target_lang))
+        return "".join(parts).strip()
+
+    def _separator(self, separator: str, target_lang: str) -> str:
+        """Ayracı hedef dile uyarlar"""
+        if "\n" in separator:
+            return "\n"
+        if target_lang in self.CJK_LANGUAGES:
+            return ""
+        return " "
+
+    @staticmethod
+    def _append(segments: List[Segment], sentence: str, separator: str) -> None:
+        sentence = sentence.strip()
+        if sentence:
+            segments.append(Segment(sentence, separator))
+        elif segments and separator:
+            # Boş satır - ayracı önceki cümleye ekle
+            segments[-1].separator += separator
+
+    @staticmethod
+    def _skip_run(text: str, i: int, chars: str) -> int:
+        while i < len(text) and text[i] in chars:
+            i += 1
+        return i
+
+    def _skip_closers(self, text: str, i: int) -> int:
+        return self._skip_run(text, i, self.CLOSERS)
+
+    @staticmethod
+    def _skip_space(text: str, i: int) -> int:
+        while i < len(text) and text[i].isspace():
+            i += 1
+        return i
+
+    @staticmethod
+    def _is_abbreviation(sentence: str, abbreviations: set) -> bool:
+        """Noktadan önceki kelime kısaltma veya tek harfli baş harf mi"""
+        words = sentence.split()
+        if not words:
+            return False
+        word = words[-1].lstrip("\"'(“‘[").lower()
+        return word in abbreviations or (len(word) == 1 and word.isalpha())
@@ -0,0 +1,104 @@
+"""
+Text Similarity for ChwiliTranslate
+OCR gürültüsüne dayanıklı metin normalizasyonu ve yakın kopya arama
+"""
+
+from collections import Counter
+from typing import Dict, Hashable, Optional, Set, Tuple
+import threading
+import unicodedata
+
+
+def normalize_text(text: str) -> str:
+    """Önbellek anahtarı için metni normalize eder
+
+    Unicode NFKC uygulanır, noktalama işaretleri atılır ve boşluklar tek
+    boşluğa indirilir.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    text = "".join(
+        " " if unicodedata.category(char).startswith("P") else char
+        for char in text
+    )
+    return " ".join(text.split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Karakter trigramlarını döndürür (kenarlar boşlukla doldurulur)"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Trigram posting listeleriyle Jaccard benzerliği araması
+
+    Metinler dil çifti gibi bir gruba göre ayrı tutulur; sorgu yalnızca
+    aynı gruptaki metinlerle karşılaştırılır.
+    """
+
+    def __init__(self):
+        """Boş dizin oluşturur"""
+        self._lock = threading.Lock()
+        self._postings: Dict[Tuple[Hashable, str], Set[int]] = {}
+        self._docs: Dict[int, Tuple[Hashable, str, int]] = {}  # id -> (grup, metin, trigram sayısı)
+        self._ids: Dict[Tuple[Hashable, str], int] = {}
+        self._next_id = 0
+
+    def add(self, group: Hashable, text: str) -> None:
+        """Normalize edilmiş metni dizine ekler"""
+        if not text:
+            return
+        with self._lock:
+            if (group, text) in self._ids:
+                return
+            doc_id = self._next_id
+            self._next_id += 1
+            grams = trigrams(text)
+            self._ids[(group, text)] = doc_id
+            self._docs[doc_id] = (group, text, len(grams))
+            for gram in grams:
+                self._postings.setdefault((group, gram), set()).add(doc_id)
+
+    def remove(self, group: Hashable, text: str) -> None:
+        """Metni dizinden çıkarır"""
+        with self._lock:
+            doc_id = self._ids.pop((group, text), None)
+            if doc_id is None:
+                return
+            del self._docs[doc_id]
+            for gram in trigrams(text):
+                posting = self._postings.get((group, gram))
+                if posting is not None:
+                    posting.discard(doc_id)
+                    if not posting:
+                        del self._postings[(group, gram)]
+
+    def query(self, group: Hashable, text: str, threshold: float) -> Optional[Tuple[str, float]]:
+        """En benzer metni ve Jaccard skorunu döndürür (eşik altındaysa None)"""
+        if not text:
+            return None
+        grams = trigrams(text)
+        size = len(grams)
+
+        with self._lock:
+            shared: Counter = Counter()
+            for gram in grams:
+                shared.update(self._postings.get((group, gram), ()))
+
+            best = None
+            for doc_id, common in shared.items():
+                _, doc_text, doc_size = self._docs[doc_id]
+                score = common / (size + doc_size - common)
+                if score >= threshold and (best is None or score > best[1]):
+                    best = (doc_text, score)
+        return best
+
+    def clear(self) -> None:
+        """Dizini boşaltır"""
+        with self._lock:
+            self._postings.clear()
+            self._docs.clear()
+            self._ids.clear()
+
+    def __len__(self) -> int:
+        return len(self._docs)
@@ -738,3 +738,22 @@ class OCRControlPanel(QWidget):
             Qt.TransformationMode.SmoothTransformation
         )
         self._preview_label.setPixmap(scaled)
+    
+    def set_preview_frame(self, frame) -> None:
+        """Önizlemeyi ham Frame'den ayarlar (PNG kodlaması olmadan)"""
+        from PyQt6.QtGui import QImage, QPixmap
+        max_w = self._preview_frame.width() - 20
+        max_h = self._preview_frame.height() - 20
+        
+        # Önce numpy tarafında küçült, sonra yalnızca küçük görüntüyü kopyala
+        rgb = frame.downscale(max_w, max_h).to_rgb()
+        height, width = rgb.shape[:2]
+        image = QImage(rgb.data, width, height, width * 3, QImage.Format.Format_RGB888).copy()
+        
+        scaled = QPixmap.fromImage(image).scaled(
+            max_w,
+            max_h,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self._preview_label.setPixmap(scaled)
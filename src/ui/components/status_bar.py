@@ -55,6 +55,14 @@ class StatusBar(QWidget):
         layout.addWidget(self._gpu_indicator)
         layout.addWidget(self._gpu_status)
         
+        # Ayırıcı
+        layout.addWidget(self._create_separator())
+        
+        # Uyarlanabilir tarama hızı
+        self._scan_status = QLabel("Tarama: -")
+        self._scan_status.setStyleSheet(f"color: {self.TEXT_SECONDARY};")
+        layout.addWidget(self._scan_status)
+        
         layout.addStretch()
         
         # START/STOP butonu
@@ -170,6 +178,19 @@ class StatusBar(QWidget):
             self._gpu_indicator.setStyleSheet(f"color: {self.TEXT_SECONDARY};")
             self._gpu_status.setText("GPU Off")
     
+    def set_scan_rate(self, rate: float, reason: str) -> None:
+        """Etkin tarama hızını ve gerekçesini gösterir"""
+        if not self._is_running or rate <= 0:
+            self._scan_status.setText("Tarama: -")
+            self._scan_status.setToolTip("")
+            return
+        self._scan_status.setText(f"Tarama: {rate:.1f}/sn · {reason}")
+        self._scan_status.setToolTip(f"{1000.0 / rate:.0f} ms aralık")
+    
+    def get_scan_status_text(self) -> str:
+        """Tarama hızı metnini döndürür"""
+        return self._scan_status.text()
+    
     def get_gpu_status_text(self) -> str:
         """GPU durum metnini döndürür"""
         return self._gpu_status.text()
@@ -0,0 +1,102 @@
+"""
+Async Loop Thread for ChwiliTranslate
+Kendi thread'inde sürekli çalışan asyncio event loop'u
+"""
+
+from concurrent.futures import Future
+from typing import Coroutine, Optional, Set
+import asyncio
+import threading
+
+
+class AsyncLoopThread:
+    """Tek bir kalıcı event loop'u arka planda çalıştırır
+
+    Coroutine'ler herhangi bir thread'den submit() ile gönderilir ve
+    concurrent.futures.Future döner. Loop (ve üzerindeki bağlantılar)
+    çağrılar arasında korunur.
+    """
+
+    def __init__(self, name: str = "asyncio-loop"):
+        """Loop thread'ini hazırlar (ilk submit'te başlatılır)"""
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._pending: Set[Future] = set()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Loop çalışmıyorsa başlatır ve loop'u döndürür"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(loop, ready), name=self._name, daemon=True
+            )
+            self._loop = loop
+            self._thread.start()
+            ready.wait()
+            return loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """Loop thread'i - stop() çağrılana kadar çalışır"""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            # Kalan görevleri iptal et ve loop'u temiz kapat
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def is_running(self) -> bool:
+        """Loop thread'i çalışıyor mu"""
+        return bool(self._thread and self._thread.is_alive())
+
+    def get_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Çalışan loop'u döndürür"""
+        return self._loop if self.is_running() else None
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Coroutine'i loop'ta çalıştırır (thread-safe)"""
+        loop = self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def pending_count(self) -> int:
+        """Tamamlanmamış iş sayısını döndürür"""
+        with self._lock:
+            return len(self._pending)
+
+    def cancel_pending(self) -> None:
+        """Tamamlanmamış tüm işleri iptal eder"""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Loop'u durdurur ve thread'in bitmesini bekler"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._thread = None
+            self._loop = None
+        if loop and thread and thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
@@ -31,6 +31,11 @@ class TranslationConfig:
         "google": "",
         "deepl": ""
     })
+    hedge_provider: str = ""  # Birincil geç kalırsa denenecek yedek provider ("" = kapalı)
+    hedge_delay_ms: float = 0.0  # Yedeğe geçmeden önce bekleme (0 = birincilin p90'ı)
+    auto_route: bool = False  # İstekleri anahtarı olan en hızlı sağlıklı provider'a yönlendir
+    rate_limits: Dict[str, float] = field(default_factory=dict)  # provider -> saniyedeki istek (yoksa varsayılan)
+    streaming: bool = False  # LLM çevirilerini geldikçe overlay'de göster
 
 
 @dataclass
@@ -61,6 +66,11 @@ class OverlayConfig:
 class SystemConfig:
     """System settings configuration"""
     cache_enabled: bool = True
+    cache_similarity_threshold: float = 0.0  # Yakın kopya önbellek eşiği (0 = kapalı)
+    cache_max_entries: int = 0  # Önbellek kayıt sınırı (0 = sınırsız)
+    cache_max_mb: int = 0  # Önbellek metin boyutu sınırı, MB (0 = sınırsız)
+    cache_ttl_days: int = 0  # Bu kadar gün kullanılmayan kayıtlar silinir (0 = kapalı)
+    cache_eviction: str = "lru"  # "lru" veya "lfu"
     selected_monitor: int = 0
     exclusion_areas: List[Dict] = field(default_factory=list)
 
@@ -146,7 +156,12 @@ class ConfigManager:
             target_language=trans_data.get("target_language", "tr"),
             api_keys=trans_data.get("api_keys", {
                 "chatgpt": "", "gemini": "", "google": "", "deepl": ""
-            })
+            }),
+            hedge_provider=trans_data.get("hedge_provider", ""),
+            hedge_delay_ms=trans_data.get("hedge_delay_ms", 0.0),
+            auto_route=trans_data.get("auto_route", False),
+            rate_limits=trans_data.get("rate_limits", {}),
+            streaming=trans_data.get("streaming", False)
         )
         
         overlay_data = data.get("overlay", {})
@@ -172,6 +187,11 @@ class ConfigManager:
         system_data = data.get("system", {})
         system = SystemConfig(
             cache_enabled=system_data.get("cache_enabled", True),
+            cache_similarity_threshold=system_data.get("cache_similarity_threshold", 0.0),
+            cache_max_entries=system_data.get("cache_max_entries", 0),
+            cache_max_mb=system_data.get("cache_max_mb", 0),
+            cache_ttl_days=system_data.get("cache_ttl_days", 0),
+            cache_eviction=system_data.get("cache_eviction", "lru"),
             selected_monitor=system_data.get("selected_monitor", 0),
             exclusion_areas=system_data.get("exclusion_areas", [])
         )
@@ -0,0 +1,133 @@
+"""
+Pipeline utilities for ChwiliTranslate
+Aşamalar arası sınırlı kuyruk ve aşama kullanım istatistikleri
+"""
+
+from collections import deque
+from typing import Any, Dict, Optional
+import threading
+import time
+
+
+class QueueClosed(Exception):
+    """Kuyruk kapatıldı (pipeline durduruluyor)"""
+    pass
+
+
+class DropOldestQueue:
+    """Dolduğunda en eski öğeyi atan sınırlı kuyruk
+
+    Üretici hiçbir zaman beklemez; tüketici geride kalırsa bayat öğeler
+    atılır ve her zaman en güncel veri işlenir.
+    """
+
+    def __init__(self, maxsize: int = 1):
+        """Kuyruğu başlatır"""
+        self._items: deque = deque()
+        self._maxsize = max(1, maxsize)
+        self._cond = threading.Condition()
+        self._closed = False
+        self._put_count = 0
+        self._dropped_count = 0
+
+    def put(self, item: Any) -> Optional[Any]:
+        """Öğe ekler; yer yoksa atılan en eski öğeyi döndürür"""
+        dropped = None
+        with self._cond:
+            if len(self._items) >= self._maxsize:
+                dropped = self._items.popleft()
+                self._dropped_count += 1
+            self._items.append(item)
+            self._put_count += 1
+            self._cond.notify()
+        return dropped
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Öğe alır; kuyruk kapatılırsa QueueClosed fırlatır
+
+        Returns:
+            Öğe veya zaman aşımında None
+        """
+        with self._cond:
+            if not self._items and not self._closed:
+                self._cond.wait(timeout)
+            if self._items:
+                return self._items.popleft()
+            if self._closed:
+                raise QueueClosed()
+            return None
+
+    def close(self) -> None:
+        """Kuyruğu kapatır ve bekleyen tüketicileri uyandırır"""
+        with self._cond:
+            self._closed = True
+            self._items.clear()
+            self._cond.notify_all()
+
+    def reopen(self) -> None:
+        """Kapatılmış kuyruğu yeniden kullanıma açar"""
+        with self._cond:
+            self._closed = False
+            self._items.clear()
+            self._put_count = 0
+            self._dropped_count = 0
+
+    def qsize(self) -> int:
+        """Kuyruktaki öğe sayısını döndürür"""
+        with self._cond:
+            return len(self._items)
+
+    def get_stats(self) -> Dict:
+        """Derinlik ve atılan öğe istatistiklerini döndürür"""
+        with self._cond:
+            return {
+                "depth": len(self._items),
+                "maxsize": self._maxsize,
+                "put": self._put_count,
+                "dropped": self._dropped_count
+            }
+
+
+class StageStats:
+    """Pipeline aşamasının meşguliyet ve gecikme istatistikleri"""
+
+    WINDOW_SECONDS = 5.0  # Kullanım oranı penceresi
+
+    def __init__(self):
+        """İstatistikleri başlatır"""
+        self._lock = threading.Lock()
+        self._samples: deque = deque()  # (bitiş zamanı, süre)
+        self._processed = 0
+        self._started_at = time.monotonic()
+
+    def record(self, started: float, finished: float) -> None:
+        """Bir iş biriminin başlangıç/bitiş zamanını kaydeder (monotonic)"""
+        with self._lock:
+            self._samples.append((finished, finished - started))
+            self._processed += 1
+            cutoff = finished - self.WINDOW_SECONDS
+            while self._samples and self._samples[0][0] < cutoff:
+                self._samples.popleft()
+
+    def reset(self) -> None:
+        """İstatistikleri sıfırlar"""
+        with self._lock:
+            self._samples.clear()
+            self._processed = 0
+            self._started_at = time.monotonic()
+
+    def get_stats(self) -> Dict:
+        """Kullanım oranı (0-1), işlenen sayısı ve ortalama süreyi döndürür"""
+        now = time.monotonic()
+        with self._lock:
+            cutoff = now - self.WINDOW_SECONDS
+            durations = [d for end, d in self._samples if end >= cutoff]
+            processed = self._processed
+            window = min(self.WINDOW_SECONDS, max(1e-6, now - self._started_at))
+
+        busy = sum(durations)
+        return {
+            "utilization": min(1.0, busy / window),
+            "processed": processed,
+            "avg_ms": busy / len(durations) * 1000.0 if durations else 0.0
+        }
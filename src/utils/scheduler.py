@@ -0,0 +1,129 @@
+"""
+Adaptive Scheduler for ChwiliTranslate
+Bölge başına uyarlanabilir OCR tarama aralığı
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional
+import threading
+import time
+
+
+@dataclass
+class RegionSchedule:
+    """Tek bir bölgenin tarama durumu"""
+    interval_ms: float
+    next_due: float
+
+
+class AdaptiveScheduler:
+    """Metin değişirken hızlı, ekran sabitken üstel olarak yavaşlayan zamanlayıcı
+
+    İlk değişiklikte aralık hemen min_interval_ms'e döner. Yakalama ve OCR
+    aşamaları farklı thread'lerden çağırabilir.
+    """
+
+    REASON_IDLE = "Bekleniyor"
+    REASON_CHANGING = "Metin değişiyor - hızlı tarama"
+    REASON_BACKOFF = "Sabit ekran - tarama yavaşlatılıyor"
+    REASON_STATIC = "Sabit ekran - en yavaş tarama"
+
+    def __init__(self, min_interval_ms: float = 100, max_interval_ms: float = 2000,
+                 backoff_factor: float = 1.5, initial_interval_ms: Optional[float] = None):
+        """Adaptive Scheduler'ı başlatır"""
+        self._min_ms = max(1.0, float(min_interval_ms))
+        self._max_ms = max(self._min_ms, float(max_interval_ms))
+        self._factor = max(1.0, backoff_factor)
+        self._initial_ms = self._clamp(initial_interval_ms or self._min_ms)
+        self._schedules: Dict[Hashable, RegionSchedule] = {}
+        self._reason = self.REASON_IDLE
+        self._lock = threading.RLock()
+
+    def _clamp(self, interval_ms: float) -> float:
+        return max(self._min_ms, min(self._max_ms, interval_ms))
+
+    def set_bounds(self, min_interval_ms: float, max_interval_ms: float) -> None:
+        """Tarama aralığı sınırlarını ayarlar"""
+        with self._lock:
+            self._min_ms = max(1.0, float(min_interval_ms))
+            self._max_ms = max(self._min_ms, float(max_interval_ms))
+            self._initial_ms = self._clamp(self._initial_ms)
+            for schedule in self._schedules.values():
+                schedule.interval_ms = self._clamp(schedule.interval_ms)
+
+    def get_bounds(self) -> tuple:
+        """(min, max) tarama aralığını ms olarak döndürür"""
+        return (self._min_ms, self._max_ms)
+
+    def _get(self, key: Hashable, now: float) -> RegionSchedule:
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            schedule = RegionSchedule(interval_ms=self._initial_ms, next_due=now)
+            self._schedules[key] = schedule
+        return schedule
+
+    def due(self, keys: Iterable[Hashable], now: Optional[float] = None) -> List[Hashable]:
+        """Taranma zamanı gelmiş bölge anahtarlarını döndürür"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return [key for key in keys if self._get(key, now).next_due <= now]
+
+    def mark_captured(self, key: Hashable, now: Optional[float] = None) -> None:
+        """Bölge yakalandı; sonuç gelene kadar mevcut aralıkla ertelenir"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            schedule = self._get(key, now)
+            schedule.next_due = now + schedule.interval_ms / 1000.0
+
+    def report(self, key: Hashable, changed: bool, now: Optional[float] = None) -> None:
+        """Tarama sonucunu bildirir ve bölgenin aralığını uyarlar"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            schedule = self._get(key, now)
+
+            if changed:
+                schedule.interval_ms = self._min_ms
+                self._reason = self.REASON_CHANGING
+            else:
+                schedule.interval_ms = self._clamp(schedule.interval_ms * self._factor)
+                if all(s.interval_ms >= self._max_ms for s in self._schedules.values()):
+                    self._reason = self.REASON_STATIC
+                elif not any(s.interval_ms <= self._min_ms for s in self._schedules.values()):
+                    self._reason = self.REASON_BACKOFF
+
+            schedule.next_due = now + schedule.interval_ms / 1000.0
+
+    def time_until_next(self, keys: Iterable[Hashable], now: Optional[float] = None) -> float:
+        """Bir sonraki taramaya kalan süreyi saniye olarak döndürür"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due_times = [self._get(key, now).next_due for key in keys]
+        if not due_times:
+            return self._initial_ms / 1000.0
+        return max(0.0, min(due_times) - now)
+
+    def retain(self, keys: Iterable[Hashable]) -> None:
+        """Listede olmayan (kaldırılmış) bölgelerin durumunu siler"""
+        keep = set(keys)
+        with self._lock:
+            for key in list(self._schedules):
+                if key not in keep:
+                    del self._schedules[key]
+
+    def get_rate(self) -> float:
+        """En hızlı bölgenin tarama hızını (tarama/sn) döndürür"""
+        with self._lock:
+            schedules = list(self._schedules.values())
+        if not schedules:
+            return 0.0
+        return 1000.0 / min(s.interval_ms for s in schedules)
+
+    def get_reason(self) -> str:
+        """Son hız değişikliğinin gerekçesini döndürür"""
+        return self._reason
+
+    def reset(self) -> None:
+        """Tüm bölgeleri hemen taranacak şekilde sıfırlar"""
+        with self._lock:
+            self._schedules.clear()
+            self._reason = self.REASON_IDLE
@@ -105,3 +105,140 @@ def test_state_callback(_):
     
     assert AppState.RUNNING in states_received
     assert AppState.IDLE in states_received
+
+
+class _FakeTranslationEngine:
+    """Çalıştığı thread'i kaydeden sahte çeviri motoru"""
+    
+    def __init__(self):
+        self.threads = set()
+    
+    async def close(self):
+        pass
+    
+    def is_rate_limited(self):
+        return False
+    
+    def supports_streaming(self):
+        return False
+    
+    async def translate(self, text):
+        import asyncio
+        import threading
+        from src.translate.providers import TranslationResult, TranslationProvider
+        
+        await asyncio.sleep(0)
+        self.threads.add(threading.get_ident())
+        return TranslationResult(
+            original_text=text, translated_text=text.upper(),
+            provider=TranslationProvider.GOOGLE, cached=False
+        )
+
+
+@given(texts=st.lists(st.text(min_size=1, max_size=20), min_size=1, max_size=5))
+@settings(max_examples=20)
+def test_submit_reuses_translation_loop(texts):
+    """
+    Çeviriler tek bir kalıcı loop'ta çalışmalı ve sonuçlar callback'e iletilmeli
+    """
+    controller = ApplicationController()
+    engine = _FakeTranslationEngine()
+    controller.set_translation_engine(engine)
+    completed = []
+    controller.on_translation_complete(completed.append)
+    
+    try:
+        futures = [controller.submit(text) for text in texts]
+        results = [future.result(timeout=2.0) for future in futures]
+    finally:
+        controller.cleanup()
+    
+    assert [r.translated_text for r in results] == [t.upper() for t in texts]
+    assert len(engine.threads) == 1
+    assert sorted(r.original_text for r in completed) == sorted(texts)
+
+
+class _FakeBatchEngine:
+    """Toplu çeviri çağrılarını kaydeden sahte çeviri motoru"""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def get_provider(self):
+        return "fake"
+    
+    def get_languages(self):
+        return ("en", "tr")
+    
+    def is_rate_limited(self):
+        return False
+    
+    def supports_streaming(self):
+        return False
+    
+    async def translate_batch(self, texts):
+        from src.translate.providers import TranslationResult, TranslationProvider
+        
+        self.batches.append(list(texts))
+        return [
+            TranslationResult(original_text=text, translated_text=f"tr:{text}",
+                              provider=TranslationProvider.GOOGLE, cached=False)
+            for text in texts
+        ]
+    
+    async def close(self):
+        pass
+
+
+@given(
+    rounds=st.lists(
+        st.lists(st.sampled_from(["hp", "mp", "a", "b"]), min_size=3, max_size=3),
+        min_size=1, max_size=5
+    )
+)
+@settings(max_examples=30)
+def test_only_changed_regions_are_translated(rounds):
+    """
+    Yalnızca metni değişen bölgeler çevrilmeli ve overlay metni bölge
+    çevirilerinden sırayla birleştirilmeli
+    """
+    controller = ApplicationController()
+    engine = _FakeBatchEngine()
+    controller.set_translation_engine(engine)
+    
+    previous = [None, None, None]
+    try:
+        for texts in rounds:
+            items = list(zip(["r0", "r1", "r2"], texts))
+            result = controller.submit_regions(items).result(timeout=2.0)
+            
+            changed = list(dict.fromkeys(t for t, old in zip(texts, previous) if t != old))
+            # Değişmeyen bölgeler için API çağrısı yapılmamalı
+            assert engine.batches == ([changed] if changed else [])
+            engine.batches.clear()
+            assert result.translated_text == "\n".join(f"tr:{t}" for t in texts)
+            previous = texts
+    finally:
+        controller.cleanup()
+
+
+def test_removed_regions_state_is_dropped():
+    """
+    Kaldırılan bölgelerin metni ve değişiklik imzası bellekte kalmamalı
+    """
+    import numpy as np
+    from src.ocr.frame import Frame
+    
+    controller = ApplicationController()
+    try:
+        frame = Frame(data=np.zeros((32, 32, 4), dtype=np.uint8))
+        for key in ("kept", "removed"):
+            controller._change_detector.has_changed(key, frame)
+            controller._region_texts[key] = key
+        
+        controller._retain_region_state(["kept"])
+        
+        assert set(controller._region_texts) == {"kept"}
+        assert set(controller._change_detector._signatures) == {"kept"}
+    finally:
+        controller.cleanup()
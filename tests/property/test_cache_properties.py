@@ -5,12 +5,14 @@ Validates: Requirements 4.1, 4.2
 """
 
 import os
+import sqlite3
 import tempfile
 from hypothesis import given, strategies as st, settings
 
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from src.translate import cache as cache_module
 from src.translate.cache import CacheManager
 
 
@@ -53,6 +55,7 @@ def test_cache_round_trip(source_text, translated_text, source_lang, target_lang
         
         # Geri oku
         result = cache.get(source_text, source_lang, target_lang)
+        cache.close()
         
         # Round-trip doğrulama
         assert result == translated_text, \
@@ -87,6 +90,7 @@ def test_cache_entry_round_trip(source_text, translated_text, source_lang, targe
         
         # Tam giriş olarak oku
         entry = cache.get_entry(source_text, source_lang, target_lang)
+        cache.close()
         
         assert entry is not None, "Cache girişi bulunamadı"
         assert entry.source_text == source_text
@@ -97,3 +101,322 @@ def test_cache_entry_round_trip(source_text, translated_text, source_lang, targe
     finally:
         if os.path.exists(temp_db):
             os.remove(temp_db)
+
+
+@given(
+    source_text=text_strategy,
+    translated_text=text_strategy,
+    source_lang=language_strategy,
+    target_lang=language_strategy
+)
+@settings(max_examples=50)
+def test_memory_tier_read_through_and_clear(source_text, translated_text, source_lang, target_lang):
+    """
+    Tekrarlanan okumalar bellek katmanından gelmeli, clear() her iki katmanı
+    da temizlemeli
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "cache.db")
+        writer = CacheManager(db_path=db_path)
+        writer.set(source_text, translated_text, source_lang, target_lang, "google")
+        writer.close()  # Bekleyen yazmaları diske aktar
+        
+        # Yeni örnek: bellek boş, ilk okuma SQLite'tan
+        with CacheManager(db_path=db_path) as cache:
+            assert cache.get(source_text, source_lang, target_lang) == translated_text
+            assert cache.get(source_text, source_lang, target_lang) == translated_text
+            
+            tiers = cache.get_tier_stats()
+            assert tiers["sqlite"]["hits"] == 1
+            assert tiers["memory"]["hits"] == 1
+            
+            cache.clear()
+            assert cache.get(source_text, source_lang, target_lang) is None
+            assert cache.get_tier_stats()["memory"]["entries"] == 0
+
+
+@given(
+    texts=st.lists(st.text(alphabet="abcdef", min_size=1, max_size=10), min_size=1, max_size=20),
+    threads=st.integers(min_value=1, max_value=4)
+)
+@settings(max_examples=20, deadline=None)
+def test_connection_reused_per_thread(texts, threads):
+    """
+    Her thread tek bir kalıcı WAL bağlantısı kullanmalı; işlemler yeni
+    bağlantı açmamalı ve diğer thread'lerin yazdıkları okunabilmeli
+    """
+    import threading
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = CacheManager(db_path=os.path.join(temp_dir, "cache.db"))
+        
+        def worker(index):
+            for text in texts:
+                cache.set(f"{index}:{text}", text.upper(), "en", "tr", "google")
+                cache.get_entry(f"{index}:{text}", "en", "tr")
+        
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        
+        results = [cache.get(f"{i}:{text}", "en", "tr") for i in range(threads) for text in texts]
+        with cache._get_connection() as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        opened = cache.get_tier_stats()["sqlite"]["connections_opened"]
+        
+        cache.close()
+        # Kapatıldıktan sonra ilk kullanımda yeniden açılmalı
+        assert cache.get_entry(f"0:{texts[0]}", "en", "tr").translated_text == texts[0].upper()
+        assert cache.get_stats()["total_entries"] == len({(i, t) for i in range(threads) for t in texts})
+        cache.close()
+    
+    assert results == [text.upper() for _ in range(threads) for text in texts]
+    assert journal_mode == "wal"
+    # İşlem sayısından bağımsız: thread'ler, ana thread ve yazıcı
+    assert opened <= threads + 2
+
+
+@given(
+    texts=st.lists(st.text(alphabet="abcdef ", min_size=1, max_size=10), min_size=1, max_size=50),
+    clear_first=st.booleans()
+)
+@settings(max_examples=20, deadline=None)
+def test_write_behind_reads_own_writes(texts, clear_first):
+    """
+    Yazmalar toplu yazılmalı; diske ulaşmadan da okunabilmeli, clear()
+    bekleyenleri de silmeli ve close() kalanları diske aktarmalı
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "cache.db")
+        cache = CacheManager(db_path=db_path)
+        cache.FLUSH_INTERVAL_MS = 60000  # Arka plan yazıcısı bu testte boşaltmasın
+        
+        if clear_first:
+            cache.set("stale", "eski", "en", "tr", "google")
+            cache.clear()
+        
+        for text in texts:
+            cache.set(text, text.upper(), "en", "tr", "google")
+            cache._memory.clear()  # Okuma bekleyen tampondan gelmeli
+        
+        pending = cache.get_tier_stats()["sqlite"]["pending_writes"]
+        results = [cache.get(text, "en", "tr") for text in texts]
+        entries = [cache.get_entry(text, "en", "tr") for text in texts]
+        cache.close()
+        
+        reopened = CacheManager(db_path=db_path)
+        persisted = [reopened.get(text, "en", "tr") for text in texts]
+        stale = reopened.get("stale", "en", "tr")
+        flushes = cache.get_tier_stats()["sqlite"]["flushes"]
+        reopened.close()
+    
+    assert pending == len(set(texts))
+    assert results == persisted == [text.upper() for text in texts]
+    assert all(entry.translated_text == text.upper() for entry, text in zip(entries, texts))
+    assert stale is None
+    assert flushes == 1
+
+
+@given(rows=st.dictionaries(
+    st.text(alphabet="abcdef .!", min_size=1, max_size=12), st.text(min_size=1, max_size=20),
+    min_size=1, max_size=20
+))
+@settings(max_examples=20, deadline=None)
+def test_legacy_schema_is_migrated(rows):
+    """
+    Metin anahtarlı eski şemadaki kayıtlar özet anahtarlı şemaya taşınmalı
+    ve user_version güncellenmeli
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "cache.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE translations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(source_text, source_lang, target_lang)
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO translations (source_text, translated_text, source_lang, target_lang, provider) "
+            "VALUES (?, ?, 'en', 'tr', 'google')",
+            list(rows.items())
+        )
+        conn.commit()
+        conn.close()
+        
+        cache = CacheManager(db_path=db_path)
+        results = {text: cache.get(text, "en", "tr") for text in rows}
+        count = cache.get_stats()["total_entries"]
+        cache.close()
+        
+        conn = sqlite3.connect(db_path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.close()
+    
+    assert results == rows
+    assert count == len(rows)
+    assert version == CacheManager.SCHEMA_VERSION
+
+
+def test_hash_collision_is_verified(monkeypatch):
+    """
+    Özet çakışan iki metin birbirinin çevirisini döndürmemeli
+    """
+    monkeypatch.setattr(cache_module, "_key_hash", lambda text, source_lang, target_lang: 42)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = CacheManager(db_path=os.path.join(temp_dir, "cache.db"))
+        cache.set("first", "birinci", "en", "tr", "google")
+        cache.flush()
+        cache._memory.clear()
+        
+        other = cache.get("second", "en", "tr")
+        other_entry = cache.get_entry("second", "en", "tr")
+        same = cache.get("first", "en", "tr")
+        cache.close()
+    
+    assert other is None
+    assert other_entry is None
+    assert same == "birinci"
+
+
+@given(
+    count=st.integers(min_value=1, max_value=60),
+    max_entries=st.integers(min_value=1, max_value=40),
+    policy=st.sampled_from([CacheManager.EVICT_LRU, CacheManager.EVICT_LFU])
+)
+@settings(max_examples=20, deadline=None)
+def test_eviction_keeps_cache_bounded(count, max_entries, policy):
+    """
+    Sınır aşılınca kayıt sayısı sınırın altına inmeli ve son/sık kullanılan
+    kayıt atılmamalı
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = CacheManager(db_path=os.path.join(temp_dir, "cache.db"))
+        for i in range(count):
+            cache.set(f"text {i}", f"metin {i}", "en", "tr", "google")
+        cache.flush()
+        
+        for _ in range(3):
+            assert cache.get("text 0", "en", "tr") == "metin 0"
+        cache.flush()  # İsabetler toplu yazılır
+        cache.set_limits(max_entries=max_entries, policy=policy)
+        cache.compact()
+        
+        total = cache.get_stats()["total_entries"]
+        stats = cache.get_tier_stats()["sqlite"]
+        cache._memory.clear()
+        kept = cache.get("text 0", "en", "tr")
+        cache.close()
+    
+    assert total <= max_entries
+    assert stats["evicted"] == count - total
+    assert kept == "metin 0"
+
+
+def test_ttl_expires_unused_entries():
+    """
+    TTL süresince kullanılmayan kayıtlar silinmeli, dosya artımlı vacuum
+    ile küçülebilmeli
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "cache.db")
+        cache = CacheManager(db_path=db_path)
+        for i in range(200):
+            cache.set(f"old {i}", "x" * 500, "en", "tr", "google")
+        cache.flush()
+        with cache._get_connection() as conn:
+            conn.execute("UPDATE translations SET last_accessed = last_accessed - 7200")
+            conn.commit()
+        cache.set("fresh", "taze", "en", "tr", "google")
+        cache.flush()
+        
+        cache.set_limits(ttl_seconds=3600)
+        cache.compact()
+        
+        stats = cache.get_tier_stats()["sqlite"]
+        total = cache.get_stats()["total_entries"]
+        fresh = cache.get("fresh", "en", "tr")
+        with cache._get_connection() as conn:
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        cache.close()
+    
+    assert stats["expired"] == 200
+    assert stats["vacuumed_pages"] > 0
+    assert total == 1
+    assert fresh == "taze"
+    assert auto_vacuum == 2  # INCREMENTAL
+
+
+@given(
+    operations=st.lists(st.tuples(
+        st.sampled_from(["set", "set", "set", "evict", "clear"]),
+        st.text(alphabet="abc", min_size=1, max_size=3),
+        provider_strategy,
+        st.sampled_from(["en", "ja"])
+    ), min_size=1, max_size=40)
+)
+@settings(max_examples=30, deadline=None)
+def test_incremental_stats_match_table(operations):
+    """
+    Artımlı tutulan toplamlar ekleme, üzerine yazma, atma ve temizleme
+    sonrasında tablonun gerçek GROUP BY sonucuna eşit olmalı
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = CacheManager(db_path=os.path.join(temp_dir, "cache.db"))
+        for operation, text, provider, source_lang in operations:
+            if operation == "set":
+                cache.set(text, text * 2, source_lang, "tr", provider)
+                cache.flush()
+            elif operation == "evict":
+                cache.set_limits(max_entries=3)
+                cache.compact()
+                cache.set_limits()
+            else:
+                cache.clear()
+        
+        version = cache.get_stats_version()
+        stats = cache.get_stats()
+        with cache._get_connection() as conn:
+            by_provider = dict(conn.execute(
+                "SELECT provider, COUNT(*) FROM translations GROUP BY provider"
+            ).fetchall())
+            total, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM translations"
+            ).fetchone()
+        unchanged = cache.get_stats_version() == version
+        cache.close()
+    
+    assert stats["total_entries"] == total
+    assert stats["total_bytes"] == size
+    assert stats["by_provider"] == by_provider
+    assert sum(pair["count"] for pair in stats["by_language_pair"]) == total
+    assert unchanged
+
+
+def test_writer_does_not_recreate_deleted_database():
+    """
+    Veritabanı dosyası silindiyse yazıcı boş bir veritabanı oluşturmamalı
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "cache.db")
+        with CacheManager(db_path=db_path) as cache:
+            cache.close()  # Bağlantıları bırak ki dosya silinebilsin
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+            
+            cache.set("hello", "merhaba", "en", "tr", "google")
+            cache.flush()
+        
+        recreated = os.path.exists(db_path)
+    
+    assert not recreated
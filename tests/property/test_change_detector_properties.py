@@ -0,0 +1,203 @@
+"""
+Property-based tests for Change Detector
+Feature: chwili-translate, Property 12: Unchanged Frame Skipping
+Validates: Requirements 1.3
+"""
+
+import os
+import numpy as np
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.ocr.frame import Frame
+from src.ocr.change_detector import ChangeDetector
+
+
+# Stratejiler
+dimension_strategy = st.integers(min_value=1, max_value=80)
+seed_strategy = st.integers(min_value=0, max_value=2**32 - 1)
+
+
+def _random_frame(width: int, height: int, seed: int) -> Frame:
+    rng = np.random.default_rng(seed)
+    return Frame(data=rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8))
+
+
+@given(width=dimension_strategy, height=dimension_strategy, seed=seed_strategy)
+@settings(max_examples=100)
+def test_identical_frames_are_skipped(width: int, height: int, seed: int):
+    """
+    Feature: chwili-translate, Property 12: Unchanged Frame Skipping
+    
+    For any frame, the first observation of a region should count as a
+    change and an identical follow-up frame should not.
+    
+    Validates: Requirements 1.3
+    """
+    detector = ChangeDetector(tolerance=0.0)
+    frame = _random_frame(width, height, seed)
+    
+    assert detector.has_changed("region", frame)
+    assert not detector.has_changed("region", Frame(data=frame.data.copy()))
+
+
+@given(
+    width=st.integers(min_value=16, max_value=80),
+    height=st.integers(min_value=16, max_value=80),
+    seed=seed_strategy,
+    tolerance=st.floats(min_value=0.0, max_value=50.0, allow_nan=False)
+)
+@settings(max_examples=100)
+def test_changes_beyond_tolerance_are_detected(width: int, height: int, seed: int, tolerance: float):
+    """
+    Bir blokta toleransın üzerinde değişen piksel sayısı eşiğe ulaşırsa
+    kare değişmiş sayılmalı
+    """
+    detector = ChangeDetector(tolerance=tolerance)
+    frame = _random_frame(width, height, seed)
+    detector.has_changed("region", frame)
+    
+    changed = frame.data.copy()
+    # İlk bloğu tek renge boya
+    block = changed[:16, :16, :3]
+    changed[:16, :16, :3] = np.where(block.mean() > 127, 0, 255).astype(np.uint8)
+    
+    before = frame.to_gray()[:16, :16].astype(np.int16)
+    after = Frame(data=changed).to_gray()[:16, :16].astype(np.int16)
+    expected = int((np.abs(after - before) > tolerance).sum()) >= ChangeDetector.MIN_DIRTY_PIXELS
+    
+    assert detector.has_changed("region", Frame(data=changed)) == expected
+
+
+def _render_text(text: str, width: int = 96, height: int = 32) -> Frame:
+    """Metni siyah zemine beyaz yazar (BGRA kare)"""
+    from PIL import Image, ImageDraw
+    
+    image = Image.new("L", (width, height), 0)
+    ImageDraw.Draw(image).text((4, 8), text, fill=255)
+    gray = np.asarray(image)
+    return Frame(data=np.dstack([gray, gray, gray, np.full_like(gray, 255)]))
+
+
+@given(
+    swap=st.sampled_from([("HP 96", "HP 69"), ("69", "96"), ("bd", "db"), ("12:05", "12:50")]),
+    tolerance=st.sampled_from([0.0, 2.0, 10.0])
+)
+@settings(max_examples=30)
+def test_permuted_glyphs_are_detected(swap, tolerance):
+    """
+    Karodaki toplam mürekkebi koruyan değişiklikler (yer değiştiren rakam
+    ve glifler) de algılanmalı
+    """
+    before, after = swap
+    detector = ChangeDetector(tolerance=tolerance)
+    detector.has_changed("region", _render_text(before))
+    
+    assert detector.has_changed("region", _render_text(after))
+    assert not detector.has_changed("region", _render_text(after))
+
+
+class _FakeEngine:
+    """Her çağrıda kare yüksekliğini kaydeden sahte OCR motoru"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def process_image(self, frame):
+        from src.ocr.engine import OCRResult, OCRSegment
+        self.calls.append((frame.top, frame.height))
+        box = (0, 0, frame.width, min(10, frame.height))
+        segment = OCRSegment(text=f"line@{frame.top}", confidence=0.9, box=box)
+        return OCRResult(text=segment.text, confidence=0.9,
+                         bounding_boxes=[box], timestamp=0.0, segments=[segment])
+
+
+@given(
+    line_row=st.integers(min_value=1, max_value=9),
+    seed=seed_strategy
+)
+@settings(max_examples=50)
+def test_incremental_ocr_keeps_clean_lines(line_row: int, seed: int):
+    """
+    Yalnızca kirli satır bandı yeniden OCR'lanmalı, diğer satırlar korunmalı
+    """
+    from src.ocr.incremental import IncrementalOCR
+    
+    engine = _FakeEngine()
+    incremental = IncrementalOCR(engine, ChangeDetector(tolerance=1.0))
+    frame = Frame(data=np.zeros((320, 64, 4), dtype=np.uint8))
+    
+    first = incremental.process("region", frame)
+    assert first is not None and engine.calls == [(0, 320)]
+    assert incremental.process("region", Frame(data=frame.data.copy())) is None
+    
+    changed = frame.data.copy()
+    changed[line_row * 32:line_row * 32 + 16, :, :3] = 255
+    result = incremental.process("region", Frame(data=changed))
+    
+    band_top, band_height = engine.calls[-1]
+    assert band_height < 320
+    assert band_top <= line_row * 32 < band_top + band_height
+    # İlk tam OCR'daki satır (y=0..10) bandın dışında kaldıysa korunmuş olmalı
+    if band_top >= 10:
+        assert "line@0" in result.text
+    assert f"line@{band_top}" in result.text
+
+
+@given(
+    line_row=st.integers(min_value=2, max_value=8),
+    seed=seed_strategy
+)
+@settings(max_examples=30)
+def test_new_line_band_covers_neighbouring_tiles(line_row: int, seed: int):
+    """
+    Önceki satırlarla kesişmeyen yeni bir satırın bandı her yönde en az bir
+    karo satırı büyütülmeli
+    """
+    from src.ocr.incremental import IncrementalOCR
+    
+    engine = _FakeEngine()
+    incremental = IncrementalOCR(engine, ChangeDetector(tolerance=1.0))
+    frame = Frame(data=np.zeros((320, 64, 4), dtype=np.uint8))
+    incremental.process("region", frame)
+    
+    changed = frame.data.copy()
+    changed[line_row * 32:line_row * 32 + 16, :, :3] = 255
+    incremental.process("region", Frame(data=changed))
+    
+    band_top, band_height = engine.calls[-1]
+    block = ChangeDetector.BLOCK_SIZE
+    assert band_top <= line_row * 32 - block
+    assert band_top + band_height >= line_row * 32 + 16 + block
+
+
+@given(
+    keys=st.lists(st.sampled_from(["a", "b", "c", "d"]), min_size=1, max_size=4, unique=True),
+    kept=st.lists(st.sampled_from(["a", "b", "c", "d"]), max_size=4, unique=True)
+)
+@settings(max_examples=30)
+def test_retain_drops_removed_regions(keys, kept):
+    """
+    Kaldırılan bölgelerin sonuçları ve imzaları silinmeli, kalanlar korunmalı
+    """
+    from src.ocr.incremental import IncrementalOCR
+    
+    engine = _FakeEngine()
+    incremental = IncrementalOCR(engine, ChangeDetector(tolerance=1.0))
+    frame = Frame(data=np.zeros((64, 64, 4), dtype=np.uint8))
+    for key in keys:
+        incremental.process(key, frame)
+    
+    incremental.retain(kept)
+    
+    survivors = set(keys) & set(kept)
+    assert set(incremental._results) == survivors
+    assert set(incremental._detector._signatures) == survivors
+    for key in keys:
+        engine.calls.clear()
+        result = incremental.process(key, Frame(data=frame.data.copy()))
+        # Kalan bölge değişmemiş sayılır, silinen bölge baştan taranır
+        assert (result is None) == (key in survivors)
+        assert engine.calls == ([] if key in survivors else [(0, 64)])
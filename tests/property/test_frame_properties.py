@@ -0,0 +1,82 @@
+"""
+Property-based tests for Frame
+Feature: chwili-translate, Property 11: Raw Frame Conversion Consistency
+Validates: Requirements 1.2
+"""
+
+import os
+import numpy as np
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.ocr.frame import Frame
+
+
+# Stratejiler
+dimension_strategy = st.integers(min_value=1, max_value=64)
+seed_strategy = st.integers(min_value=0, max_value=2**32 - 1)
+
+
+def _random_frame(width: int, height: int, seed: int) -> Frame:
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    return Frame(data=data)
+
+
+@given(width=dimension_strategy, height=dimension_strategy, seed=seed_strategy)
+@settings(max_examples=100)
+def test_frame_rgb_conversion(width: int, height: int, seed: int):
+    """
+    Feature: chwili-translate, Property 11: Raw Frame Conversion Consistency
+    
+    For any BGRA frame, to_rgb() should return the same pixels with the
+    blue and red channels swapped and the alpha channel dropped.
+    
+    Validates: Requirements 1.2
+    """
+    frame = _random_frame(width, height, seed)
+    rgb = frame.to_rgb()
+    
+    assert rgb.shape == (height, width, 3)
+    assert rgb.flags["C_CONTIGUOUS"]
+    assert np.array_equal(rgb[..., 0], frame.data[..., 2])
+    assert np.array_equal(rgb[..., 1], frame.data[..., 1])
+    assert np.array_equal(rgb[..., 2], frame.data[..., 0])
+
+
+@given(width=dimension_strategy, height=dimension_strategy, seed=seed_strategy)
+@settings(max_examples=100)
+def test_frame_gray_conversion(width: int, height: int, seed: int):
+    """
+    Gri tonlama dönüşümü PIL'in L moduna ±1 yakın olmalı
+    """
+    from PIL import Image
+    
+    frame = _random_frame(width, height, seed)
+    gray = frame.to_gray()
+    expected = np.asarray(Image.fromarray(frame.to_rgb(), "RGB").convert("L"))
+    
+    assert gray.shape == (height, width)
+    assert np.abs(gray.astype(np.int16) - expected.astype(np.int16)).max() <= 1
+
+
+@given(
+    width=st.integers(min_value=2, max_value=64),
+    height=st.integers(min_value=2, max_value=64),
+    seed=seed_strategy
+)
+@settings(max_examples=100)
+def test_frame_crop_is_view(width: int, height: int, seed: int):
+    """
+    crop() kopya oluşturmamalı ve ekran koordinatlarını kaydırmalı
+    """
+    frame = _random_frame(width, height, seed)
+    frame.left, frame.top = 100, 200
+    
+    sub = frame.crop(1, 1, width - 1, height - 1)
+    
+    assert sub.size == (width - 1, height - 1)
+    assert (sub.left, sub.top) == (101, 201)
+    assert np.shares_memory(sub.data, frame.data)
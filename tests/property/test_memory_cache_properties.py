@@ -0,0 +1,61 @@
+"""
+Property-based tests for Memory Cache
+Feature: chwili-translate, Property 16: LRU Cache Bounds
+Validates: Requirements 4.1, 4.2
+"""
+
+import os
+from collections import OrderedDict
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.translate.memory_cache import LRUCache
+
+
+# Stratejiler
+key_strategy = st.sampled_from([("a", "en", "tr"), ("b", "en", "tr"), ("c", "en", "tr"),
+                                ("d", "en", "tr"), ("a", "ja", "tr"), ("e", "de", "tr")])
+operation_strategy = st.lists(
+    st.tuples(st.booleans(), key_strategy, st.text(min_size=0, max_size=20)),
+    min_size=1, max_size=60
+)
+
+
+@given(operations=operation_strategy,
+       max_entries=st.integers(min_value=1, max_value=5),
+       max_bytes=st.integers(min_value=4, max_value=80))
+@settings(max_examples=100)
+def test_lru_cache_respects_bounds(operations, max_entries, max_bytes):
+    """
+    Feature: chwili-translate, Property 16: LRU Cache Bounds
+    
+    For any sequence of puts and gets, the cache should never exceed its
+    entry or byte limits, should evict least recently used entries first
+    and should return the last value stored for any key it still holds.
+    
+    Validates: Requirements 4.1, 4.2
+    """
+    cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+    model: "OrderedDict[tuple, str]" = OrderedDict()
+    
+    for is_put, key, value in operations:
+        if is_put:
+            cache.put(key, value)
+            model.pop(key, None)
+            if LRUCache._sizeof(key, value) <= max_bytes:
+                model[key] = value
+            while len(model) > max_entries or \
+                    sum(LRUCache._sizeof(k, v) for k, v in model.items()) > max_bytes:
+                model.popitem(last=False)
+        else:
+            expected = model.get(key)
+            if expected is not None:
+                model.move_to_end(key)
+            assert cache.get(key) == expected
+        
+        stats = cache.get_stats()
+        assert stats["entries"] <= max_entries
+        assert stats["bytes"] <= max_bytes
+        assert stats["entries"] == len(model)
@@ -0,0 +1,67 @@
+"""
+Property-based tests for Pipeline Queues
+Feature: chwili-translate, Property 14: Bounded Queue Freshness
+Validates: Requirements 9.2
+"""
+
+import os
+import pytest
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.pipeline import DropOldestQueue, QueueClosed
+
+
+# Stratejiler
+items_strategy = st.lists(st.integers(), min_size=1, max_size=50)
+maxsize_strategy = st.integers(min_value=1, max_value=5)
+
+
+@given(items=items_strategy, maxsize=maxsize_strategy)
+@settings(max_examples=100)
+def test_queue_keeps_newest_items(items, maxsize):
+    """
+    Feature: chwili-translate, Property 14: Bounded Queue Freshness
+    
+    For any sequence of puts without a consumer, the queue depth should
+    never exceed maxsize, every overflow should drop the oldest item and
+    the consumer should receive exactly the newest items in order.
+    
+    Validates: Requirements 9.2
+    """
+    queue = DropOldestQueue(maxsize)
+    dropped = []
+    
+    for item in items:
+        old = queue.put(item)
+        if old is not None:
+            dropped.append(old)
+        assert queue.qsize() <= maxsize
+    
+    received = []
+    while queue.qsize():
+        received.append(queue.get(timeout=0))
+    
+    assert received == items[-maxsize:]
+    assert dropped == items[:-maxsize]
+    
+    stats = queue.get_stats()
+    assert stats["put"] == len(items)
+    assert stats["dropped"] == max(0, len(items) - maxsize)
+
+
+def test_closed_queue_wakes_consumer():
+    """Kapatılan kuyruk bekleyen tüketiciye QueueClosed fırlatır"""
+    queue = DropOldestQueue()
+    assert queue.get(timeout=0) is None
+    
+    queue.put("stale")
+    queue.close()
+    with pytest.raises(QueueClosed):
+        queue.get(timeout=0)
+    
+    queue.reopen()
+    queue.put("fresh")
+    assert queue.get(timeout=0) == "fresh"
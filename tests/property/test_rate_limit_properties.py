@@ -0,0 +1,161 @@
+"""
+Property-based tests for Rate Limiting
+Feature: chwili-translate, Property 19: Token Bucket Spacing
+Validates: Requirements 3.1, 3.2
+"""
+
+import os
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.translate.rate_limit import TokenBucket, parse_retry_after, backoff_delay
+from src.translate.engine import TranslationEngine
+from src.translate.providers import TranslationProvider, GoogleTranslateProvider
+
+
+@given(
+    rate=st.floats(min_value=1.0, max_value=1000.0),
+    burst=st.integers(min_value=1, max_value=10),
+    requests=st.integers(min_value=1, max_value=50)
+)
+@settings(max_examples=100)
+def test_token_bucket_spacing(rate, burst, requests):
+    """
+    Feature: chwili-translate, Property 19: Token Bucket Spacing
+
+    For any rate and burst, the first burst reservations should not wait
+    and each later reservation should wait one more 1 / rate interval.
+
+    Validates: Requirements 3.1, 3.2
+    """
+    bucket = TokenBucket(rate, burst)
+    waits = [bucket.reserve() for _ in range(requests)]
+
+    slack = 0.05  # reserve() çağrıları arasında geçen süre
+    for n, wait in enumerate(waits):
+        expected = max(0.0, (n - burst + 1) / rate)
+        assert expected - slack <= wait <= expected + slack
+
+
+def test_block_for_delays_next_request():
+    """
+    Retry-After ile verilen ara sınırsız bucket'ta bile beklenmeli
+    """
+    bucket = TokenBucket(0.0)
+    assert bucket.reserve() <= 0.0
+    assert not bucket.is_throttled()
+
+    bucket.block_for(5.0)
+
+    assert bucket.is_throttled()
+    assert 4.9 <= bucket.reserve() <= 5.0
+
+
+@given(seconds=st.integers(min_value=0, max_value=3600))
+@settings(max_examples=50)
+def test_parse_retry_after(seconds):
+    """
+    Retry-After hem saniye hem HTTP tarihi biçiminde ayrıştırılmalı
+    """
+    when = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+    assert parse_retry_after(str(seconds)) == float(seconds)
+    assert abs(parse_retry_after(format_datetime(when, usegmt=True)) - seconds) <= 1.5
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+
+@given(
+    attempt=st.integers(min_value=0, max_value=20),
+    retry_after=st.one_of(st.none(), st.floats(min_value=0.0, max_value=100.0))
+)
+@settings(max_examples=100)
+def test_backoff_delay_bounds(attempt, retry_after):
+    """
+    Bekleme üstel büyümeli, tavanı aşmamalı ve Retry-After'dan kısa olmamalı
+    """
+    delay = backoff_delay(attempt, retry_after, base=0.5, cap=30.0)
+    exponential = min(30.0, 0.5 * (2 ** attempt))
+
+    assert exponential * 0.5 <= delay <= 30.0
+    if retry_after is not None:
+        assert delay >= min(retry_after, 30.0)
+
+
+def test_rate_limited_request_is_retried():
+    """
+    429 yanıtı hata olarak gösterilmemeli; Retry-After beklenip istek
+    yeniden denenmeli
+    """
+    from aiohttp import web
+
+    calls = []
+
+    async def handler(request):
+        calls.append(request.query["q"])
+        if len(calls) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response([[[request.query["q"].upper(), request.query["q"]]]])
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/translate_a/single", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        engine = TranslationEngine()
+        provider = GoogleTranslateProvider()
+        provider.API_URL = f"http://127.0.0.1:{port}/translate_a/single"
+        engine._providers[TranslationProvider.GOOGLE] = provider
+        try:
+            result = await engine.translate("hello")
+        finally:
+            await engine.close()
+            await runner.cleanup()
+        return result, provider.get_connection_stats(), engine.get_provider_stats()
+
+    result, stats, health = asyncio.run(run())
+
+    assert result.translated_text == "HELLO"
+    assert calls == ["hello", "hello"]
+    assert stats["rate_limited"] == 1
+    assert health["google"]["error_rate"] == 0.0
+
+
+class _QueuedProvider(GoogleTranslateProvider):
+    """İstek hakkını bekleyip hemen yanıt veren sahte provider"""
+
+    async def translate_batch(self, texts, source_lang, target_lang):
+        await self._get_session()
+        await asyncio.sleep(0.01)
+        return [text.upper() for text in texts]
+
+
+def test_queueing_not_counted_as_provider_latency():
+    """
+    Kendi token bucket'ımızda geçen bekleme provider gecikmesine
+    (yönlendirme p50'si, hedge p90'ı) eklenmemeli
+    """
+    async def run():
+        engine = TranslationEngine()
+        provider = _QueuedProvider()
+        provider.pause(0.3)
+        engine._providers[TranslationProvider.GOOGLE] = provider
+        try:
+            await engine.translate("hello")
+        finally:
+            await engine.close()
+        return engine.get_provider_stats()
+
+    stats = asyncio.run(run())
+
+    assert stats["google"]["samples"] == 1
+    assert stats["google"]["p50_ms"] < 200.0
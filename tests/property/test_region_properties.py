@@ -104,3 +104,68 @@ def test_region_validity(width: int, height: int):
     
     # Pozitif boyutlar geçerli olmalı
     assert region.is_valid() == (width > 0 and height > 0)
+
+
+class _FakeScreenshot:
+    """mss ScreenShot taklidi - piksel değeri mutlak koordinattan türetilir"""
+    
+    def __init__(self, area):
+        import numpy as np
+        self.left, self.top = area["left"], area["top"]
+        self.width, self.height = area["width"], area["height"]
+        ys, xs = np.mgrid[self.top:self.top + self.height, self.left:self.left + self.width]
+        pixels = np.stack([xs % 256, ys % 256, (xs + ys) % 256, np.full_like(xs, 255)], axis=-1)
+        self.raw = bytearray(pixels.astype(np.uint8).tobytes())
+
+
+class _FakeGrabber:
+    """Yakalama çağrılarını sayan sahte ScreenGrabber"""
+    
+    def __init__(self):
+        self.grab_count = 0
+    
+    def get_monitors(self):
+        return [
+            {"id": 0, "left": 0, "top": 0, "width": 1920, "height": 1080, "name": "Monitor 1"},
+            {"id": 1, "left": 1920, "top": 0, "width": 1920, "height": 1080, "name": "Monitor 2"}
+        ]
+    
+    def grab(self, area):
+        self.grab_count += 1
+        return _FakeScreenshot(area)
+
+
+region_strategy = st.builds(
+    Region,
+    x=st.integers(min_value=0, max_value=300),
+    y=st.integers(min_value=0, max_value=300),
+    width=st.integers(min_value=1, max_value=200),
+    height=st.integers(min_value=1, max_value=200),
+    monitor_id=st.integers(min_value=0, max_value=1)
+)
+
+
+@given(regions=st.lists(region_strategy, min_size=1, max_size=5))
+@settings(max_examples=100)
+def test_batched_capture_matches_single_capture(regions):
+    """
+    Toplu yakalama, bölge başına yakalama ile aynı pikselleri vermeli ve
+    monitör başına tam olarak bir birleşik yakalama yapmalı
+    """
+    import numpy as np
+    
+    selector = RegionSelector()
+    selector._grabber = _FakeGrabber()
+    selector.MAX_UNION_OVERHEAD = float("inf")  # Her zaman birleşik yakala
+    
+    frames = selector.capture_regions(regions)
+    batched_grabs = selector._grabber.grab_count
+    
+    assert len(frames) == len(regions)
+    for region, frame in zip(regions, frames):
+        single = selector.capture_region(region)
+        assert frame.size == (region.width, region.height)
+        assert (frame.left, frame.top) == (single.left, single.top)
+        assert np.array_equal(frame.data, single.data)
+    
+    assert batched_grabs == len({region.monitor_id for region in regions})
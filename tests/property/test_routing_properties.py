@@ -0,0 +1,177 @@
+"""
+Property-based tests for Provider Routing
+Feature: chwili-translate, Property 18: Circuit Breaker Fail-Fast
+Validates: Requirements 3.1, 3.2
+"""
+
+import os
+import asyncio
+import tempfile
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.translate.routing import CircuitBreaker, ProviderRouter, CircuitOpenError
+from src.translate.engine import TranslationEngine
+from src.translate.providers import TranslationProvider
+
+
+@given(
+    outcomes=st.lists(st.sampled_from(["ok", "error", "timeout"]), min_size=1, max_size=30),
+    threshold=st.integers(min_value=1, max_value=5)
+)
+@settings(max_examples=100)
+def test_breaker_opens_on_consecutive_failures(outcomes, threshold):
+    """
+    Feature: chwili-translate, Property 18: Circuit Breaker Fail-Fast
+
+    For any sequence of request outcomes, the breaker should be open exactly
+    when the last run of failures reached the threshold or contains a
+    timeout, and an open breaker should refuse requests.
+
+    Validates: Requirements 3.1, 3.2
+    """
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_timeout=60.0)
+    for outcome in outcomes:
+        if outcome == "ok":
+            breaker.record_success()
+        else:
+            breaker.record_failure(timeout=outcome == "timeout")
+
+    run = []
+    for outcome in reversed(outcomes):
+        if outcome == "ok":
+            break
+        run.append(outcome)
+    expected_open = len(run) >= threshold or "timeout" in run
+
+    assert (breaker.get_state() == CircuitBreaker.OPEN) == expected_open
+    assert breaker.allow_request() == (not expected_open)
+
+
+def test_breaker_half_open_allows_single_probe():
+    """
+    Bekleme dolunca tek bir deneme isteğine izin verilmeli; başarısızsa
+    devre yeniden açılmalı, başarılıysa kapanmalı
+    """
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    assert breaker.get_state() == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.allow_request()  # reset_timeout=0: hemen yeniden yarı açık
+    breaker.record_success()
+    assert breaker.get_state() == CircuitBreaker.CLOSED
+    assert breaker.get_stats()["trips"] == 2
+
+
+@given(latencies=st.dictionaries(
+    st.sampled_from(["google", "deepl", "gemini", "chatgpt"]),
+    st.lists(st.floats(min_value=1.0, max_value=5000.0), min_size=3, max_size=10),
+    min_size=1
+), broken=st.sets(st.sampled_from(["google", "deepl", "gemini", "chatgpt"])))
+@settings(max_examples=100)
+def test_router_chooses_fastest_healthy_provider(latencies, broken):
+    """
+    Router açık devreli provider'ları atlamalı ve kalanlar arasından medyan
+    gecikmesi en düşük olanı seçmeli
+    """
+    router = ProviderRouter(failure_threshold=1, reset_timeout=60.0)
+    for provider, values in latencies.items():
+        for value in values:
+            router.health(provider).record_success(value)
+        if provider in broken:
+            router.health(provider).record_failure()
+
+    choice = router.choose(latencies.keys(), preferred="google")
+    healthy = {p: router.health(p).percentile(0.5) for p in latencies if p not in broken}
+
+    if not healthy:
+        assert choice is None
+    else:
+        assert choice in healthy
+        assert healthy[choice] == min(healthy.values())
+
+
+def test_router_stats_persist_between_runs():
+    """
+    Kaydedilen gecikme ve hata pencereleri yeni router'a yüklenmeli
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "provider_stats.json")
+        router = ProviderRouter(path)
+        router.health("deepl").record_success(120.0)
+        router.health("deepl").record_failure()
+        router.save()
+
+        stats = ProviderRouter(path).get_stats()
+
+    assert stats["deepl"]["samples"] == 1
+    assert stats["deepl"]["p50_ms"] == 120.0
+    assert stats["deepl"]["error_rate"] == 0.5
+
+
+class _TimeoutProvider:
+    """Her istekte zaman aşımı veren sahte provider"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def translate_batch(self, texts, source_lang, target_lang):
+        self.calls += 1
+        raise asyncio.TimeoutError()
+
+    async def close(self):
+        pass
+
+
+class _EchoProvider:
+    """Metni önekle döndüren sahte provider"""
+
+    async def translate_batch(self, texts, source_lang, target_lang):
+        return [f"deepl:{text}" for text in texts]
+
+    async def close(self):
+        pass
+
+
+@given(frames=st.integers(min_value=2, max_value=10))
+@settings(max_examples=10, deadline=None)
+def test_dead_provider_costs_one_timeout(frames):
+    """
+    Zaman aşımı veren provider'a yalnızca bir kez gidilmeli; yönlendirme
+    açıksa sonraki istekler sağlıklı provider'a gitmeli
+    """
+    engine = TranslationEngine()
+    dead = _TimeoutProvider()
+    engine._providers[TranslationProvider.GOOGLE] = dead
+
+    async def run():
+        errors = []
+        for i in range(frames):
+            try:
+                await engine.translate(f"frame {i}")
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    errors = asyncio.run(run())
+
+    assert dead.calls == 1
+    assert len(errors) == frames
+    assert all(isinstance(e, CircuitOpenError) for e in errors[1:])
+    assert engine.get_provider_stats()["google"]["state"] == CircuitBreaker.OPEN
+
+    # Yönlendirme açıkken anahtarı olan sağlıklı provider kullanılmalı
+    engine.set_api_key(TranslationProvider.DEEPL, "key")
+    engine._providers[TranslationProvider.DEEPL] = _EchoProvider()
+    engine.set_routing(True)
+    result = asyncio.run(engine.translate("hello"))
+
+    assert result.provider == TranslationProvider.DEEPL
+    assert result.translated_text == "deepl:hello"
+    assert dead.calls == 1
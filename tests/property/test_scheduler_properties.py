@@ -0,0 +1,58 @@
+"""
+Property-based tests for Adaptive Scheduler
+Feature: chwili-translate, Property 13: Adaptive Scan Interval Bounds
+Validates: Requirements 9.2
+"""
+
+import os
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.scheduler import AdaptiveScheduler
+
+
+# Stratejiler
+bounds_strategy = st.tuples(
+    st.integers(min_value=10, max_value=500),
+    st.integers(min_value=0, max_value=5000)
+).map(lambda b: (b[0], b[0] + b[1]))
+changes_strategy = st.lists(st.booleans(), min_size=1, max_size=50)
+
+
+@given(bounds=bounds_strategy, changes=changes_strategy,
+       factor=st.floats(min_value=1.0, max_value=4.0, allow_nan=False))
+@settings(max_examples=100)
+def test_scan_interval_stays_within_bounds(bounds, changes, factor):
+    """
+    Feature: chwili-translate, Property 13: Adaptive Scan Interval Bounds
+    
+    For any sequence of changed/unchanged scans, the scan interval should
+    stay within [min, max], snap to min on a change and never shrink
+    while the screen is static.
+    
+    Validates: Requirements 9.2
+    """
+    min_ms, max_ms = bounds
+    scheduler = AdaptiveScheduler(min_ms, max_ms, backoff_factor=factor)
+    now = 0.0
+    previous_rate = None
+    
+    for changed in changes:
+        assert scheduler.due(["region"], now) == ["region"]
+        scheduler.report("region", changed, now)
+        rate = scheduler.get_rate()
+        interval = 1000.0 / rate
+        
+        assert min_ms - 1e-6 <= interval <= max_ms + 1e-6
+        if changed:
+            assert abs(interval - min_ms) < 1e-6
+            assert scheduler.get_reason() == AdaptiveScheduler.REASON_CHANGING
+        elif previous_rate is not None:
+            assert rate <= previous_rate + 1e-9
+        
+        previous_rate = rate
+        wait = scheduler.time_until_next(["region"], now)
+        assert abs(wait - interval / 1000.0) < 1e-6
+        now += wait + 1e-6
@@ -0,0 +1,134 @@
+"""
+Property-based tests for Screen Grabber
+Feature: chwili-translate, Property 20: Capture Session Reuse
+Validates: Requirements 2.1
+"""
+
+import os
+import threading
+import types
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.ocr.screen_grabber import ScreenGrabber
+
+
+class _FakeSession:
+    """mss oturumu taklidi - açılışta geçerli monitör düzenini kopyalar"""
+    
+    def __init__(self, layout):
+        self.monitors = [dict(mon) for mon in layout]
+        self.closed = False
+        self.on_read = None  # Monitör listesi okunurken çalışacak kanca
+    
+    def grab(self, area):
+        return dict(area)
+    
+    def close(self):
+        self.closed = True
+
+
+def _install_fake_mss(monkeypatch, layout):
+    """sys.modules'e oturumları kaydeden sahte mss modülü koyar"""
+    sessions = []
+    
+    def factory():
+        session = _FakeSession(layout)
+        sessions.append(session)
+        return session
+    
+    monkeypatch.setitem(sys.modules, "mss", types.SimpleNamespace(mss=factory))
+    return sessions
+
+
+def _layout(width):
+    """Tüm ekranlar + tek monitör düzeni"""
+    monitor = {"left": 0, "top": 0, "width": width, "height": 1080}
+    return [dict(monitor), dict(monitor)]
+
+
+@given(
+    grabs=st.integers(min_value=1, max_value=20),
+    threads=st.integers(min_value=1, max_value=4)
+)
+@settings(max_examples=20, deadline=None)
+def test_session_reused_per_thread(grabs, threads):
+    """
+    Feature: chwili-translate, Property 20: Capture Session Reuse
+    
+    For any number of grabs on any number of threads, each thread should
+    open exactly one capture session and every grab should be counted.
+    
+    Validates: Requirements 2.1
+    """
+    import pytest
+    monkeypatch = pytest.MonkeyPatch()
+    try:
+        sessions = _install_fake_mss(monkeypatch, _layout(1920))
+        grabber = ScreenGrabber()
+        area = {"left": 0, "top": 0, "width": 10, "height": 10}
+        
+        def worker():
+            for _ in range(grabs):
+                assert grabber.grab(area) == area
+        
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        
+        stats = grabber.get_stats()
+    finally:
+        monkeypatch.undo()
+    
+    assert len(sessions) == threads
+    assert stats["sessions_opened"] == threads
+    assert stats["captures"] == grabs * threads
+    assert 0.0 <= stats["avg_ms"] <= stats["max_ms"]
+
+
+def test_invalidate_reopens_session_and_rereads_monitors(monkeypatch):
+    """
+    invalidate_monitors() eski oturumu kapatmalı ve yeni geometriyi okumalı
+    """
+    layout = _layout(1920)
+    sessions = _install_fake_mss(monkeypatch, layout)
+    grabber = ScreenGrabber()
+    
+    assert grabber.get_monitors()[0]["width"] == 1920
+    assert grabber.get_monitors() is grabber.get_monitors()  # Önbellekten
+    
+    layout[1]["width"] = 2560
+    grabber.invalidate_monitors()
+    
+    assert grabber.get_monitors()[0]["width"] == 2560
+    assert len(sessions) == 2
+    assert sessions[0].closed
+    assert grabber.get_stats()["sessions_opened"] == 2
+
+
+def test_stale_monitor_list_not_cached(monkeypatch):
+    """
+    Liste okunurken invalidate_monitors() çağrılırsa eski geometri
+    önbelleğe yazılmamalı
+    """
+    layout = _layout(1920)
+    _install_fake_mss(monkeypatch, layout)
+    grabber = ScreenGrabber()
+    
+    class _RacingMonitors(list):
+        """Okunurken ekran değişikliği bildiren monitör listesi"""
+        
+        def __getitem__(self, index):
+            layout[1]["width"] = 2560
+            grabber.invalidate_monitors()
+            return list.__getitem__(self, index)
+    
+    session = grabber._get_session()
+    session.monitors = _RacingMonitors(session.monitors)
+    
+    assert grabber.get_monitors()[0]["width"] == 1920  # Okunan (eski) liste
+    assert grabber.get_monitors()[0]["width"] == 2560  # Önbelleğe alınmamış
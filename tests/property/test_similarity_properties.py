@@ -0,0 +1,107 @@
+"""
+Property-based tests for Normalized Cache Lookup
+Feature: chwili-translate, Property 17: Noisy OCR Cache Lookup
+Validates: Requirements 4.1, 4.2
+"""
+
+import os
+import sqlite3
+import tempfile
+from hypothesis import given, strategies as st, settings
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.translate.cache import CacheManager
+from src.translate.similarity import normalize_text
+
+
+# Stratejiler
+word_strategy = st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=3, max_size=8)
+sentence_strategy = st.lists(word_strategy, min_size=4, max_size=10)
+noise_strategy = st.lists(st.sampled_from(["", " ", "  ", ",", ".", "!", "\t"]), min_size=11, max_size=11)
+
+
+@given(words=sentence_strategy, noise=noise_strategy)
+@settings(max_examples=50)
+def test_whitespace_and_punctuation_noise_hits_cache(words, noise):
+    """
+    Feature: chwili-translate, Property 17: Noisy OCR Cache Lookup
+    
+    For any cached text, a variant that differs only by whitespace or
+    punctuation should hit the cache through the normalized key, and an
+    unrelated text should not.
+    
+    Validates: Requirements 4.1, 4.2
+    """
+    original = " ".join(words)
+    noisy = noise[0] + "".join(word + " " + extra for word, extra in zip(words, noise[1:]))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with CacheManager(db_path=os.path.join(temp_dir, "cache.db")) as cache:
+            cache.set(original, "çeviri", "en", "tr", "google")
+            
+            assert normalize_text(noisy) == normalize_text(original)
+            match = cache.get_match(noisy, "en", "tr")
+            assert match is not None and match[0] == "çeviri"
+            assert match[1] in (CacheManager.MATCH_EXACT, CacheManager.MATCH_NORMALIZED)
+            assert cache.get(original + " zzz", "en", "tr") is None
+            assert cache.get_lookup_stats()["avg_ms"] > 0
+
+
+@given(words=st.lists(word_strategy, min_size=5, max_size=10, unique=True),
+       position=st.integers(min_value=0, max_value=200))
+@settings(max_examples=50)
+def test_single_misread_character_hits_similarity_index(words, position):
+    """
+    Tek karakterlik OCR hatası benzerlik dizini açıkken eşleşmeli, kapalıyken
+    eşleşmemeli
+    """
+    original = " ".join(words)
+    letters = [i for i, char in enumerate(original) if char != " "]
+    index = letters[position % len(letters)]
+    misread = original[:index] + ("x" if original[index] != "x" else "y") + original[index + 1:]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with CacheManager(db_path=os.path.join(temp_dir, "cache.db")) as cache:
+            cache.set(original, "çeviri", "en", "tr", "google")
+            assert cache.get(misread, "en", "tr") is None
+            
+            cache.set_similarity_threshold(0.5)
+            match = cache.get_match(misread, "en", "tr")
+            assert match == ("çeviri", CacheManager.MATCH_SIMILAR)
+            
+            # Tekrar aramada da benzerlik eşleşmesi olarak dönmeli ve sayılmalı
+            assert cache.get_match(misread, "en", "tr") == ("çeviri", CacheManager.MATCH_SIMILAR)
+            assert cache.get_lookup_stats()["similar_hits"] == 2
+            
+            # Farklı dil çifti asla eşleşmemeli
+            assert cache.get(misread, "en", "de") is None
+
+
+def test_legacy_database_gets_normalized_column():
+    """Eski şemalı veritabanı normalize sütunuyla güncellenmeli"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "cache.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE translations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(source_text, source_lang, target_lang)
+            )
+        """)
+        conn.execute(
+            "INSERT INTO translations (source_text, translated_text, source_lang, target_lang, provider) "
+            "VALUES ('Hello,  world!', 'Merhaba dünya', 'en', 'tr', 'google')"
+        )
+        conn.commit()
+        conn.close()
+        
+        with CacheManager(db_path=db_path) as cache:
+            assert cache.get("Hello world", "en", "tr") == "Merhaba dünya"
@@ -101,3 +101,344 @@ def test_encrypted_key_round_trip(provider: TranslationProvider, api_key: str):
     decrypted = engine2.get_api_key(provider)
     assert decrypted == api_key, \
         f"Encrypted key round-trip başarısız: beklenen '{api_key}', alınan '{decrypted}'"
+
+
+@given(texts=st.lists(st.text(alphabet="abcxyz ", min_size=1, max_size=10), min_size=2, max_size=5))
+@settings(max_examples=10, deadline=None)
+def test_provider_session_reuses_connections(texts):
+    """
+    Aynı provider'dan ardışık istekler (toplu çeviri dahil) tek bir keep-alive
+    bağlantıyı paylaşmalı
+    """
+    import asyncio
+    from aiohttp import web
+    from src.translate.providers import GoogleTranslateProvider
+    
+    async def handler(request):
+        return web.json_response([[[request.query["q"].upper(), request.query["q"]]]])
+    
+    async def batch_handler(request):
+        return web.json_response([q.upper() for q in request.query.getall("q")])
+    
+    async def run():
+        app = web.Application()
+        app.router.add_get("/translate_a/single", handler)
+        app.router.add_get("/translate_a/t", batch_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        
+        provider = GoogleTranslateProvider()
+        provider.API_URL = f"http://127.0.0.1:{port}/translate_a/single"
+        provider.BATCH_URL = f"http://127.0.0.1:{port}/translate_a/t"
+        try:
+            results = [await provider.translate(text, "en", "tr") for text in texts]
+            # Toplu çeviri aynı bağlantıyı kullanan tek bir istek olmalı
+            results.extend(await provider.translate_batch(texts, "en", "tr"))
+        finally:
+            await provider.close()
+            await runner.cleanup()
+        return results, provider.get_connection_stats()
+    
+    results, stats = asyncio.run(run())
+    
+    assert results == [text.upper() for text in texts] * 2
+    assert stats["requests"] == len(texts) + 1
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == len(texts)
+
+
+@given(texts=st.lists(st.text(alphabet="abc", min_size=1, max_size=5), min_size=2, max_size=5),
+       missing=st.integers(min_value=1, max_value=5))
+@settings(max_examples=5, deadline=None)
+def test_deepl_batch_rejects_short_response(texts, missing):
+    """
+    DeepL gönderilenden az çeviri döndürürse eksikler boş bırakılmamalı,
+    hata verilmeli
+    """
+    import asyncio
+    import pytest
+    from aiohttp import web
+    from src.translate.providers import DeepLProvider
+    
+    async def handler(request):
+        sent = (await request.post()).getall("text")
+        kept = sent[:max(0, len(sent) - missing)]
+        return web.json_response({"translations": [{"text": text.upper()} for text in kept]})
+    
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v2/translate", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        
+        provider = DeepLProvider("x" * 32)
+        provider.API_URL = f"http://127.0.0.1:{port}/v2/translate"
+        try:
+            with pytest.raises(Exception, match="çeviri döndü"):
+                await provider.translate_batch(texts, "en", "tr")
+        finally:
+            await provider.close()
+            await runner.cleanup()
+    
+    asyncio.run(run())
+
+
+class _BatchProvider:
+    """Toplu çağrıları kaydeden sahte provider"""
+    
+    def __init__(self):
+        self.batches = []
+    
+    async def translate_batch(self, texts, source_lang, target_lang):
+        self.batches.append(list(texts))
+        return [f"{target_lang}:{text}" for text in texts]
+    
+    async def close(self):
+        pass
+
+
+@given(
+    texts=st.lists(st.sampled_from(["a", "b", "c", "d", "e"]), min_size=1, max_size=8),
+    cached=st.sets(st.sampled_from(["a", "b", "c", "d", "e"]))
+)
+@settings(max_examples=50)
+def test_translate_batch_sends_only_cache_misses(texts, cached):
+    """
+    Toplu çeviri sırayı korumalı ve yalnızca cache'te olmayan metinleri
+    tek bir provider çağrısıyla göndermeli
+    """
+    import asyncio
+    import tempfile
+    from src.translate.cache import CacheManager
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with CacheManager(db_path=os.path.join(temp_dir, "cache.db")) as cache:
+            for text in cached:
+                cache.set(text, f"tr:{text}", "en", "tr", "google")
+            
+            engine = TranslationEngine(cache)
+            provider = _BatchProvider()
+            engine._providers[TranslationProvider.GOOGLE] = provider
+            
+            results = asyncio.run(engine.translate_batch(texts))
+    
+    assert [r.original_text for r in results] == texts
+    assert all(r.translated_text == f"tr:{r.original_text}" for r in results)
+    assert all(r.cached == (r.original_text in cached) for r in results)
+    
+    misses = list(dict.fromkeys(t for t in texts if t not in cached))
+    assert provider.batches == ([misses] if misses else [])
+
+
+class _SlowProvider(_BatchProvider):
+    """Yanıtı bir süre bekleten (istersen hata veren) sahte provider"""
+    
+    def __init__(self, fail_first: bool = False):
+        super().__init__()
+        self._fail_first = fail_first
+    
+    async def translate_batch(self, texts, source_lang, target_lang):
+        import asyncio
+        self.batches.append(list(texts))
+        await asyncio.sleep(0.01)
+        if self._fail_first and len(self.batches) == 1:
+            raise Exception("provider hatası")
+        return [f"{target_lang}:{text}" for text in texts]
+
+
+@given(
+    texts=st.lists(st.sampled_from(["a", "b", "c"]), min_size=1, max_size=3, unique=True),
+    callers=st.integers(min_value=2, max_value=5)
+)
+@settings(max_examples=20, deadline=None)
+def test_concurrent_identical_requests_are_coalesced(texts, callers):
+    """
+    Aynı anda istenen aynı çeviriler tek provider isteğini paylaşmalı ve
+    istek bitince uçuş kaydı temizlenmeli
+    """
+    import asyncio
+    
+    engine = TranslationEngine()
+    provider = _SlowProvider()
+    engine._providers[TranslationProvider.GOOGLE] = provider
+    
+    async def run():
+        return await asyncio.gather(*(engine.translate_batch(texts) for _ in range(callers)))
+    
+    results = asyncio.run(run())
+    
+    assert all([r.translated_text for r in batch] == [f"tr:{t}" for t in texts] for batch in results)
+    assert provider.batches == [texts]
+    assert engine.get_inflight_stats() == {"inflight": 0, "coalesced": len(texts) * (callers - 1)}
+
+
+def test_coalesced_requests_share_failure():
+    """
+    Paylaşılan istek provider hatasıyla biterse bekleyenler aynı hatayı
+    almalı, isteği yeniden göndermemeli
+    """
+    import asyncio
+    
+    engine = TranslationEngine()
+    provider = _SlowProvider(fail_first=True)
+    engine._providers[TranslationProvider.GOOGLE] = provider
+    
+    async def run():
+        return await asyncio.gather(
+            engine.translate("a"), engine.translate("a"), return_exceptions=True
+        )
+    
+    first, second = asyncio.run(run())
+    
+    assert isinstance(first, Exception)
+    assert isinstance(second, Exception)
+    assert provider.batches == [["a"]]
+    assert engine.get_inflight_stats()["inflight"] == 0
+
+
+def test_coalesced_requests_retry_after_owner_cancelled():
+    """
+    Paylaşılan isteğin sahibi iptal edilirse bekleyen kendi isteğini göndermeli
+    """
+    import asyncio
+    
+    engine = TranslationEngine()
+    provider = _SlowProvider()
+    engine._providers[TranslationProvider.GOOGLE] = provider
+    
+    async def run():
+        owner = asyncio.ensure_future(engine.translate("a"))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(engine.translate("a"))
+        await asyncio.sleep(0)
+        owner.cancel()
+        return await asyncio.gather(owner, waiter, return_exceptions=True)
+    
+    owner, waiter = asyncio.run(run())
+    
+    assert isinstance(owner, asyncio.CancelledError)
+    assert waiter.translated_text == "tr:a"
+    assert provider.batches == [["a"], ["a"]]
+    assert engine.get_inflight_stats()["inflight"] == 0
+
+
+class _DelayedProvider(_BatchProvider):
+    """Sabit gecikmeyle yanıt veren, iptalleri sayan sahte provider"""
+    
+    def __init__(self, delay: float, prefix: str):
+        super().__init__()
+        self._delay = delay
+        self._prefix = prefix
+        self.cancelled = 0
+    
+    async def translate_batch(self, texts, source_lang, target_lang):
+        import asyncio
+        self.batches.append(list(texts))
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return [f"{self._prefix}:{text}" for text in texts]
+
+
+@given(primary_slow=st.booleans())
+@settings(max_examples=4, deadline=None)
+def test_hedged_request_uses_first_answer(primary_slow):
+    """
+    Birincil provider gecikmeyi aşarsa istek yedeğe de gitmeli; ilk yanıt
+    kazanmalı, kaybeden iptal edilmeli ve sunan provider kaydedilmeli
+    """
+    import asyncio
+    import tempfile
+    from src.translate.cache import CacheManager
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with CacheManager(db_path=os.path.join(temp_dir, "cache.db")) as cache:
+            engine = TranslationEngine(cache)
+            primary = _DelayedProvider(0.5 if primary_slow else 0.0, "google")
+            secondary = _DelayedProvider(0.0, "deepl")
+            engine._providers[TranslationProvider.GOOGLE] = primary
+            engine._providers[TranslationProvider.DEEPL] = secondary
+            engine.set_hedging(TranslationProvider.DEEPL, delay_ms=20)
+            
+            result = asyncio.run(engine.translate("hello"))
+            cache.flush()
+            
+            with cache._get_connection() as conn:
+                row = conn.execute("SELECT translated_text, provider FROM translations").fetchone()
+    
+    winner = TranslationProvider.DEEPL if primary_slow else TranslationProvider.GOOGLE
+    assert result.provider == winner
+    assert result.translated_text == f"{winner.value}:hello"
+    assert row == (result.translated_text, winner.value)
+    assert primary.cancelled == (1 if primary_slow else 0)
+    assert secondary.batches == ([["hello"]] if primary_slow else [])
+    assert engine.get_hedging_stats()["hedges"] == engine.get_hedging_stats()["hedge_wins"] == int(primary_slow)
+
+
+@given(chunks=st.lists(st.text(alphabet="abc xyz", min_size=1, max_size=5), min_size=1, max_size=6))
+@settings(max_examples=10, deadline=None)
+def test_streamed_translation_pushes_partials(chunks):
+    """
+    Akışlı çeviride kısmi metin parça geldikçe iletilmeli, cache'e yalnızca
+    tamamlanan çeviri yazılmalı
+    """
+    import asyncio
+    import json
+    import tempfile
+    from aiohttp import web
+    from src.translate.cache import CacheManager
+    from src.translate.providers import ChatGPTProvider
+    
+    async def handler(request):
+        body = await request.json()
+        assert body["stream"] is True
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for chunk in chunks:
+            event = {"choices": [{"delta": {"content": chunk}}]}
+            await response.write(f"data: {json.dumps(event)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        return response
+    
+    async def run(cache):
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        
+        engine = TranslationEngine(cache)
+        engine.set_api_key(TranslationProvider.CHATGPT, "sk-" + "x" * 30)
+        engine.set_provider(TranslationProvider.CHATGPT)
+        engine.set_streaming(True)
+        provider = engine._providers[TranslationProvider.CHATGPT]
+        provider.API_URL = f"http://127.0.0.1:{port}/v1/chat/completions"
+        provider.set_rate_limit(0)
+        partials = []
+        try:
+            result = await engine.translate_stream("hello", partials.append)
+        finally:
+            await engine.close()
+            await runner.cleanup()
+        return result, partials
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with CacheManager(db_path=os.path.join(temp_dir, "cache.db")) as cache:
+            result, partials = asyncio.run(run(cache))
+            stored = cache.get("hello", "en", "tr")
+    
+    expected = [("".join(chunks[:i + 1])).strip() for i in range(len(chunks))]
+    assert partials == expected
+    assert result.translated_text == expected[-1]
+    assert result.provider == TranslationProvider.CHATGPT and not result.cached
+    assert stored == expected[-1]